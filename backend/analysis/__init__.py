@@ -0,0 +1,5 @@
+from .dealer import DealerOutcomes, shared_dealer_outcomes
+from .ev import EVCalculator
+from .solver import BasicStrategySolver, solve_table
+
+__all__ = ['DealerOutcomes', 'shared_dealer_outcomes', 'EVCalculator', 'BasicStrategySolver', 'solve_table']
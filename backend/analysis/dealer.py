@@ -0,0 +1,99 @@
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+
+# Shoe compositions are tuples of 10 counts indexed by card value - 2 (2-9, ten, ace)
+TEN = 8
+ACE = 9
+DEALER_TOTALS = (17, 18, 19, 20, 21)
+BUST = 5  # index of the bust probability in a dealer outcome vector
+
+DEFAULT_CACHE_SIZE = 1 << 19
+
+
+def full_shoe(num_decks: int) -> Tuple[int, ...]:
+    return tuple(4 * num_decks if i != TEN else 16 * num_decks for i in range(10))
+
+
+def remove_card(composition: Tuple[int, ...], index: int) -> Tuple[int, ...]:
+    return composition[:index] + (composition[index] - 1,) + composition[index + 1:]
+
+
+def shoe_composition(shoe) -> Tuple[int, ...]:
+    """Composition of the undealt cards of an engine Shoe"""
+    from engine.card import CARD_VALUES
+    counts = [0] * 10
+    for code in shoe.codes[shoe.position:]:
+        counts[CARD_VALUES[code] - 2] += 1
+    return tuple(counts)
+
+
+def hard_value(index: int) -> int:
+    return 1 if index == ACE else index + 2
+
+
+class DealerOutcomes:
+    """
+    Distribution of the dealer's final total (17-21 or bust) for an upcard and a shoe
+    composition. Partial dealer hands are memoized in an LRU cache keyed by
+    (composition, hard total, has ace), so every caller sharing an instance shares
+    the dealer trees.
+    """
+    
+    def __init__(self, hits_soft_17: bool = False, maxsize: Optional[int] = DEFAULT_CACHE_SIZE):
+        self.hits_soft_17 = hits_soft_17
+        self._outcomes = lru_cache(maxsize=maxsize)(self._draw_out)
+    
+    def _draw_out(self, composition, hard: int, has_ace: bool, excluded: Optional[int] = None) -> tuple:
+        # Terminal draws are tallied in place; only hands that keep drawing recurse
+        remaining = sum(composition) - (composition[excluded] if excluded is not None else 0)
+        totals = [0.0] * 6
+        for index, count in enumerate(composition):
+            if not count or index == excluded:
+                continue
+            p = count / remaining
+            new_hard = hard + hard_value(index)
+            new_ace = has_ace or index == ACE
+            soft = new_ace and new_hard <= 11
+            value = new_hard + 10 if soft else new_hard
+            if value > 21:
+                totals[BUST] += p
+            elif value > 17 or (value == 17 and not (soft and self.hits_soft_17)):
+                totals[value - 17] += p
+            else:
+                sub = self._outcomes(remove_card(composition, index), new_hard, new_ace)
+                for i in range(6):
+                    totals[i] += p * sub[i]
+        return tuple(totals)
+    
+    def distribution(self, upcard: int, composition, no_blackjack: bool = False) -> tuple:
+        """
+        Dealer final-total probabilities (17, 18, 19, 20, 21, bust) for an upcard value
+        (2-11) and the composition left after the upcard is removed. With no_blackjack
+        the hole card is conditioned on not completing a blackjack (dealer peeked).
+        """
+        up_index = upcard - 2
+        excluded = None
+        if no_blackjack:
+            excluded = TEN if up_index == ACE else ACE if up_index == TEN else None
+        return self._outcomes(tuple(composition), hard_value(up_index), up_index == ACE, excluded)
+    
+    def probabilities(self, upcard: int, composition, no_blackjack: bool = False) -> Dict[str, float]:
+        distribution = self.distribution(upcard, composition, no_blackjack)
+        return dict(zip([str(t) for t in DEALER_TOTALS] + ["bust"], distribution))
+    
+    def cache_info(self):
+        return self._outcomes.cache_info()
+    
+    def clear(self):
+        self._outcomes.cache_clear()
+
+
+_shared = {}
+
+
+def shared_dealer_outcomes(hits_soft_17: bool = False) -> DealerOutcomes:
+    """Process-wide DealerOutcomes instance for a dealer rule"""
+    if hits_soft_17 not in _shared:
+        _shared[hits_soft_17] = DealerOutcomes(hits_soft_17)
+    return _shared[hits_soft_17]
@@ -0,0 +1,212 @@
+from typing import Dict, Optional, Tuple
+from engine import GameConfig
+from engine.tables import (
+    ACTION_STAND, ACTION_HIT, ACTION_DOUBLE, ACTION_SPLIT, ACTION_SURRENDER,
+    FLAG_DOUBLE, FLAG_SPLIT, FLAG_SURRENDER, NUM_FLAGS, NUM_UPCARDS,
+    PAIR_ROW_OFFSET, SOFT_ROW_OFFSET, build_table,
+)
+from .dealer import (
+    ACE, BUST, DEALER_TOTALS, TEN, DealerOutcomes, full_shoe, remove_card,
+    hard_value, shared_dealer_outcomes,
+)
+
+
+def _card_value(index: int) -> int:
+    return index + 2
+
+
+class EVCalculator:
+    """
+    Composition-dependent expected value of a playing strategy under a GameConfig.
+    
+    Every initial deal (two player cards and the dealer upcard) is enumerated with its
+    exact probability. Player draws and the dealer's draw-out are recursed over the
+    remaining shoe composition with memoization. Rules and quirks follow
+    BlackjackGame.play_hand; dealer trees come from a shared DealerOutcomes cache.
+    Two approximations remain: split hands are valued independently with no
+    resplits, and with peek the hole-card information is only applied to the
+    dealer's draw-out.
+    """
+    
+    def __init__(self, config: GameConfig = None, strategy=None, table: bytes = None,
+                 dealer: Optional[DealerOutcomes] = None):
+        self.config = config or GameConfig()
+        if table is None:
+            if strategy is None:
+                raise ValueError("EVCalculator needs a playing strategy or a decision table")
+            table = getattr(strategy, "table", None) or build_table(strategy)
+        self.table = table
+        self.dealer = dealer or shared_dealer_outcomes(self.config.dealer_hits_soft_17)
+        self._hand_memo: Dict[tuple, float] = {}
+    
+    def dealer_distribution(self, upcard: int, composition, no_blackjack: bool = False) -> tuple:
+        return self.dealer.distribution(upcard, composition, no_blackjack)
+    
+    # Player
+    
+    @staticmethod
+    def _stand_ev(value: int, dealer: tuple) -> float:
+        if value > 21:
+            return -1.0
+        ev = dealer[BUST]
+        for total, p in zip(DEALER_TOTALS, dealer):
+            if value > total:
+                ev += p
+            elif value < total:
+                ev -= p
+        return ev
+    
+    def _action(self, row: int, upcard: int, flags: int) -> int:
+        return self.table[(row * NUM_UPCARDS + upcard - 2) * NUM_FLAGS + flags]
+    
+    def _drawn_hand_ev(self, composition, hard: int, has_ace: bool, upcard: int, no_blackjack: bool) -> float:
+        """EV of a hand that has already acted once: only hit or stand remain"""
+        soft = has_ace and hard <= 11
+        value = hard + 10 if soft else hard
+        if value > 21:
+            return -1.0
+        
+        key = (composition, hard, has_ace, upcard, no_blackjack)
+        cached = self._hand_memo.get(key)
+        if cached is not None:
+            return cached
+        
+        action = self._action(SOFT_ROW_OFFSET + value if soft else value, upcard, 0)
+        if action == ACTION_HIT:
+            ev = self._hit_ev(composition, hard, has_ace, upcard, no_blackjack)
+        else:
+            ev = self._stand_ev(value, self.dealer_distribution(upcard, composition, no_blackjack))
+        self._hand_memo[key] = ev
+        return ev
+    
+    def _hit_ev(self, composition, hard: int, has_ace: bool, upcard: int, no_blackjack: bool) -> float:
+        remaining = sum(composition)
+        ev = 0.0
+        for index, count in enumerate(composition):
+            if count:
+                ev += count / remaining * self._drawn_hand_ev(
+                    remove_card(composition, index), hard + hard_value(index),
+                    has_ace or index == ACE, upcard, no_blackjack)
+        return ev
+    
+    def _double_ev(self, composition, hard: int, has_ace: bool, upcard: int, no_blackjack: bool) -> float:
+        remaining = sum(composition)
+        ev = 0.0
+        for index, count in enumerate(composition):
+            if not count:
+                continue
+            new_hard = hard + hard_value(index)
+            new_ace = has_ace or index == ACE
+            value = new_hard + 10 if new_ace and new_hard <= 11 else new_hard
+            sub = remove_card(composition, index)
+            ev += count / remaining * self._stand_ev(value, self.dealer_distribution(upcard, sub, no_blackjack))
+        return 2 * ev
+    
+    def _can_double(self, value: int, split_hand: bool) -> bool:
+        if split_hand and not self.config.double_after_split:
+            return False
+        if self.config.double_on == "10-11":
+            return value in (10, 11)
+        if self.config.double_on == "9-11":
+            return value in (9, 10, 11)
+        return True
+    
+    def _two_card_ev(self, composition, first: int, second: int, upcard: int,
+                     no_blackjack: bool, split_hand: bool = False) -> float:
+        """EV of a two-card hand on its first decision (cards given as composition indexes)"""
+        hard = hard_value(first) + hard_value(second)
+        has_ace = first == ACE or second == ACE
+        soft = has_ace and hard <= 11
+        value = hard + 10 if soft else hard
+        
+        flags = 0
+        if self._can_double(value, split_hand):
+            flags |= FLAG_DOUBLE
+        can_split = first == second and not split_hand and self.config.max_hands > 1
+        if can_split:
+            flags |= FLAG_SPLIT
+        if self.config.surrender_allowed and not split_hand:
+            flags |= FLAG_SURRENDER
+        
+        if can_split:
+            row = PAIR_ROW_OFFSET + _card_value(first)
+        else:
+            row = SOFT_ROW_OFFSET + value if soft else value
+        action = self._action(row, upcard, flags)
+        
+        if action == ACTION_STAND:
+            return self._stand_ev(value, self.dealer_distribution(upcard, composition, no_blackjack))
+        if action == ACTION_DOUBLE and flags & FLAG_DOUBLE:
+            return self._double_ev(composition, hard, has_ace, upcard, no_blackjack)
+        if action == ACTION_SURRENDER and flags & FLAG_SURRENDER:
+            return -0.5
+        if action == ACTION_SPLIT and can_split:
+            return self._split_ev(composition, first, upcard, no_blackjack)
+        return self._hit_ev(composition, hard, has_ace, upcard, no_blackjack)
+    
+    def _split_ev(self, composition, pair: int, upcard: int, no_blackjack: bool) -> float:
+        # As in BlackjackGame, the hand that stays has spent its first action and may only
+        # hit or stand, while the new hand gets a fresh first decision
+        remaining = sum(composition)
+        first_hand = 0.0
+        second_hand = 0.0
+        for index, count in enumerate(composition):
+            if not count:
+                continue
+            p = count / remaining
+            sub = remove_card(composition, index)
+            first_hand += p * self._drawn_hand_ev(sub, hard_value(pair) + hard_value(index),
+                                                  pair == ACE or index == ACE, upcard, no_blackjack)
+            second_hand += p * self._two_card_ev(sub, pair, index, upcard, no_blackjack, split_hand=True)
+        return first_hand + second_hand
+    
+    # Round
+    
+    def round_ev(self, composition, first: int, second: int, upcard: int) -> float:
+        """
+        EV per unit bet of one initial deal, given the composition left after the
+        player's two cards and the upcard are removed (values 2-11)
+        """
+        first, second, up_index = first - 2, second - 2, upcard - 2
+        player_blackjack = {first, second} == {TEN, ACE}
+        config = self.config
+        
+        hole_blackjack = ACE if up_index == TEN else TEN if up_index == ACE else None
+        if config.dealer_peeks and hole_blackjack is not None:
+            p_dealer_blackjack = composition[hole_blackjack] / sum(composition)
+            if player_blackjack:
+                return (1 - p_dealer_blackjack) * config.blackjack_payout
+            play_ev = self._two_card_ev(composition, first, second, up_index + 2, True)
+            return -p_dealer_blackjack + (1 - p_dealer_blackjack) * play_ev
+        
+        if player_blackjack:
+            return config.blackjack_payout
+        return self._two_card_ev(composition, first, second, up_index + 2, False)
+    
+    def expected_value(self, composition: Optional[Tuple[int, ...]] = None) -> float:
+        """Expected net win per unit initial bet for a round dealt from composition"""
+        shoe = composition or full_shoe(self.config.num_decks)
+        total = 0.0
+        for first in range(10):
+            p_first = shoe[first] / sum(shoe)
+            if not p_first:
+                continue
+            after_first = remove_card(shoe, first)
+            for second in range(first, 10):
+                if not after_first[second]:
+                    continue
+                # Unordered player hands: count both card orders for distinct cards
+                p_second = after_first[second] / sum(after_first) * (2 if second != first else 1)
+                after_second = remove_card(after_first, second)
+                for up in range(10):
+                    if not after_second[up]:
+                        continue
+                    p_up = after_second[up] / sum(after_second)
+                    ev = self.round_ev(remove_card(after_second, up), first + 2, second + 2, up + 2)
+                    total += p_first * p_second * p_up * ev
+        return total
+    
+    def dealer_probabilities(self, upcard: int, no_blackjack: bool = False) -> Dict[str, float]:
+        """Dealer final-total probabilities for an upcard dealt from a full shoe"""
+        composition = remove_card(full_shoe(self.config.num_decks), upcard - 2)
+        return self.dealer.probabilities(upcard, composition, no_blackjack)
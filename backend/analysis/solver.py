@@ -0,0 +1,204 @@
+import os
+from typing import Dict, Optional, Tuple
+from engine import GameConfig
+from engine.keys import atomic_write, cache_dir, content_key, rule_fields, source_digest
+from engine.tables import (
+    ACTION_STAND, ACTION_HIT, ACTION_DOUBLE, ACTION_SPLIT, ACTION_SURRENDER, ACTION_NAMES,
+    FLAG_DOUBLE, FLAG_SPLIT, FLAG_SURRENDER, NUM_FLAGS, PAIR_ROW_OFFSET, SOFT_ROW_OFFSET,
+    TABLE_SIZE, table_index,
+)
+from .dealer import ACE, TEN, DealerOutcomes, full_shoe, remove_card, hard_value
+from .ev import EVCalculator
+
+
+DEFAULT_CACHE_DIR = cache_dir("solver")
+
+_FLAG_FOR_ACTION = {ACTION_DOUBLE: FLAG_DOUBLE, ACTION_SPLIT: FLAG_SPLIT, ACTION_SURRENDER: FLAG_SURRENDER}
+
+
+class BasicStrategySolver(EVCalculator):
+    """
+    Derives the EV-maximizing decision table (basic strategy) for a GameConfig.
+    
+    For every dealer upcard and two-card hand dealt from a full shoe, the EV of each
+    action is computed by memoized recursion over the remaining composition: stand
+    and double against the dealer's exact draw-out, hit assuming the best hit/stand
+    choice on every later card, split as two hands played the same way. A table
+    row's action EVs are the probability-weighted average over the two-card hands
+    that make its total, so the result is total-dependent basic strategy for the
+    rule set and deck count. Each (row, upcard, flags) cell holds the best action
+    the flags permit. Splits follow EVCalculator (no resplits).
+    
+    To solve in seconds, a hand that hits keeps facing the dealer distribution of
+    its first decision: the cards it draws are removed from its own draws but not
+    from the dealer's. This only moves marginal single-deck cells.
+    
+    After solve() the calculator's table is the solution, so expected_value()
+    evaluates the solved strategy.
+    """
+    
+    def __init__(self, config: GameConfig = None, dealer: Optional[DealerOutcomes] = None):
+        super().__init__(config, table=bytes(TABLE_SIZE), dealer=dealer)
+        self._optimal_memo: Dict[tuple, float] = {}
+        # (row, upcard value) -> {action code: mean EV}
+        self.action_evs: Dict[Tuple[int, int], Dict[int, float]] = {}
+    
+    def _optimal_drawn_ev(self, composition, hard: int, has_ace: bool, dealer: tuple) -> float:
+        """EV of a hand past its first decision, hitting whenever that beats standing"""
+        soft = has_ace and hard <= 11
+        value = hard + 10 if soft else hard
+        if value > 21:
+            return -1.0
+        
+        key = (composition, hard, has_ace, dealer)
+        cached = self._optimal_memo.get(key)
+        if cached is not None:
+            return cached
+        
+        ev = self._stand_ev(value, dealer)
+        # Hitting a hard 17 or more is never worth it
+        if value < 21 and (soft or value < 17):
+            ev = max(ev, self._optimal_hit_ev(composition, hard, has_ace, dealer))
+        self._optimal_memo[key] = ev
+        return ev
+    
+    def _optimal_hit_ev(self, composition, hard: int, has_ace: bool, dealer: tuple) -> float:
+        remaining = sum(composition)
+        ev = 0.0
+        for index, count in enumerate(composition):
+            if count:
+                ev += count / remaining * self._optimal_drawn_ev(
+                    remove_card(composition, index), hard + hard_value(index), has_ace or index == ACE, dealer)
+        return ev
+    
+    def _first_action_evs(self, composition, first: int, second: int, upcard: int,
+                          no_blackjack: bool, split_hand: bool = False) -> Dict[int, float]:
+        """EV of every action available to a two-card hand (cards as composition indexes)"""
+        hard = hard_value(first) + hard_value(second)
+        has_ace = first == ACE or second == ACE
+        value = hard + 10 if has_ace and hard <= 11 else hard
+        
+        dealer = self.dealer_distribution(upcard, composition, no_blackjack)
+        evs = {
+            ACTION_STAND: self._stand_ev(value, dealer),
+            ACTION_HIT: self._optimal_hit_ev(composition, hard, has_ace, dealer),
+        }
+        if self._can_double(value, split_hand):
+            evs[ACTION_DOUBLE] = self._double_ev(composition, hard, has_ace, upcard, no_blackjack)
+        if self.config.surrender_allowed and not split_hand:
+            evs[ACTION_SURRENDER] = -0.5
+        if first == second and not split_hand and self.config.max_hands > 1:
+            evs[ACTION_SPLIT] = self._optimal_split_ev(composition, first, upcard, no_blackjack)
+        return evs
+    
+    def _optimal_split_ev(self, composition, pair: int, upcard: int, no_blackjack: bool) -> float:
+        # The hand that stays may only hit or stand; the new hand gets a first decision
+        remaining = sum(composition)
+        ev = 0.0
+        for index, count in enumerate(composition):
+            if not count:
+                continue
+            sub = remove_card(composition, index)
+            first_hand = self._optimal_drawn_ev(sub, hard_value(pair) + hard_value(index), pair == ACE or index == ACE,
+                                                self.dealer_distribution(upcard, sub, no_blackjack))
+            second_hand = max(self._first_action_evs(sub, pair, index, upcard, no_blackjack,
+                                                     split_hand=True).values())
+            ev += count / remaining * (first_hand + second_hand)
+        return ev
+    
+    def solve(self) -> bytes:
+        """Compute the decision table; also kept as self.table and self.action_evs"""
+        shoe = full_shoe(self.config.num_decks)
+        totals: Dict[Tuple[int, int], Dict[int, float]] = {}
+        weights: Dict[Tuple[int, int], float] = {}
+        
+        def add(row: int, upcard: int, evs: Dict[int, float], weight: float):
+            key = (row, upcard)
+            sums = totals.setdefault(key, {})
+            for action, ev in evs.items():
+                sums[action] = sums.get(action, 0.0) + weight * ev
+            weights[key] = weights.get(key, 0.0) + weight
+        
+        for up in range(10):
+            upcard = up + 2
+            no_blackjack = self.config.dealer_peeks and up in (TEN, ACE)
+            after_up = remove_card(shoe, up)
+            for first in range(10):
+                if not after_up[first]:
+                    continue
+                after_first = remove_card(after_up, first)
+                for second in range(first, 10):
+                    if not after_first[second] or {first, second} == {TEN, ACE}:
+                        continue
+                    weight = (after_up[first] / sum(after_up) * after_first[second] / sum(after_first)
+                              * (2 if second != first else 1))
+                    evs = self._first_action_evs(remove_card(after_first, second), first, second,
+                                                 upcard, no_blackjack)
+                    
+                    hard = hard_value(first) + hard_value(second)
+                    soft = ACE in (first, second) and hard <= 11
+                    row = SOFT_ROW_OFFSET + hard + 10 if soft else hard
+                    split_ev = evs.pop(ACTION_SPLIT, None)
+                    add(row, upcard, evs, weight)
+                    if first == second:
+                        if split_ev is not None:
+                            evs[ACTION_SPLIT] = split_ev
+                        add(PAIR_ROW_OFFSET + hard_value(first) + (10 if first == ACE else 0),
+                            upcard, evs, weight)
+        
+        self.action_evs = {key: {action: ev / weights[key] for action, ev in sums.items()}
+                           for key, sums in totals.items()}
+        
+        # Rows never dealt as two cards (hard 21, soft 21) keep stand
+        table = bytearray(TABLE_SIZE)
+        for (row, upcard), evs in self.action_evs.items():
+            for flags in range(NUM_FLAGS):
+                allowed = [action for action in evs
+                           if action not in _FLAG_FOR_ACTION or flags & _FLAG_FOR_ACTION[action]]
+                table[table_index(row, upcard, flags)] = max(allowed, key=evs.__getitem__)
+        self.table = bytes(table)
+        self._hand_memo.clear()
+        return self.table
+    
+    def print_chart(self, flags: int = FLAG_DOUBLE | FLAG_SPLIT | FLAG_SURRENDER):
+        """Print the solved table as a chart for first decisions with the given flags"""
+        letters = {"stand": "S", "hit": "H", "double": "D", "split": "P", "surrender": "R"}
+        header = "      " + " ".join(f"{'A' if up == 11 else up:>2}" for up in range(2, 12))
+        
+        def line(label: str, row: int) -> str:
+            return f"{label:>5} " + " ".join(
+                f"{letters[ACTION_NAMES[self.table[table_index(row, up, flags)]]]:>2}" for up in range(2, 12))
+        
+        print(header)
+        for total in range(5, 21):
+            print(line(f"{total}", total))
+        for other in range(2, 10):
+            print(line(f"A,{other}", SOFT_ROW_OFFSET + 11 + other))
+        for value in range(2, 12):
+            label = "A" if value == 11 else str(value)
+            print(line(f"{label},{label}", PAIR_ROW_OFFSET + value))
+
+
+def rules_key(config: GameConfig) -> str:
+    """Cache key of a solved table: the decision-relevant rules and the solver source"""
+    return content_key({"rules": rule_fields(config), "source": source_digest(BasicStrategySolver)})
+
+
+def solve_table(config: GameConfig = None, cache_dir: Optional[str] = DEFAULT_CACHE_DIR) -> bytes:
+    """
+    Basic-strategy decision table for a rule set, ready for
+    TableStrategy({"table": ...}). Tables are cached on disk per rule set; pass
+    cache_dir=None to always solve.
+    """
+    config = config or GameConfig()
+    path = None
+    if cache_dir is not None:
+        path = os.path.join(cache_dir, rules_key(config) + ".bin")
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                return f.read()
+    
+    table = BasicStrategySolver(config).solve()
+    if path is not None:
+        atomic_write(path, table)
+    return table
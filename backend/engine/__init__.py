@@ -1,5 +1,14 @@
-from .card import Card, Rank, Suit, Shoe
+from .card import Card, Rank, Suit, Shoe, CARDS, decode
 from .hand import Hand
-from .game import BlackjackGame, GameConfig, GameResult
+from .game import BlackjackGame, GameConfig, GameResult, MAX_SEATS
+from .events import GameListener, ListenerGroup, VerboseListener
+from .counting import CountSystem, CardCounter, COUNT_SYSTEMS, get_count_system
+from .rng import RNG, PythonRNG, NumpyRNG, make_rng, rng_kind
+from .replay import ShoeRecording, RecordingShoe, ReplayShoe
+from .profiling import GameProfiler
 
-__all__ = ['Card', 'Rank', 'Suit', 'Shoe', 'Hand', 'BlackjackGame', 'GameConfig', 'GameResult']
+__all__ = ['Card', 'Rank', 'Suit', 'Shoe', 'CARDS', 'decode', 'Hand', 'BlackjackGame', 'GameConfig', 'GameResult',
+           'MAX_SEATS', 'GameListener', 'ListenerGroup', 'VerboseListener',
+           'CountSystem', 'CardCounter', 'COUNT_SYSTEMS', 'get_count_system',
+           'RNG', 'PythonRNG', 'NumpyRNG', 'make_rng', 'rng_kind', 'ShoeRecording', 'RecordingShoe', 'ReplayShoe',
+           'GameProfiler']
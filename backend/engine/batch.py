@@ -0,0 +1,283 @@
+import math
+from typing import Optional
+import numpy as np
+from .game import GameConfig
+from .tables import (
+    ACTION_HIT, ACTION_DOUBLE, ACTION_SPLIT, ACTION_SURRENDER,
+    FLAG_DOUBLE, FLAG_SPLIT, FLAG_SURRENDER, SOFT_ROW_OFFSET, PAIR_ROW_OFFSET,
+    NUM_ROWS, NUM_UPCARDS, NUM_FLAGS, build_table,
+)
+
+
+# Cards are encoded by blackjack value 2-11 (ace = 11); composition column = value - 2
+DECK_COMPOSITION = np.array([4, 4, 4, 4, 4, 4, 4, 4, 16, 4], dtype=np.int16)
+
+
+class BatchResult:
+    """Aggregate statistics (and optionally per-hand arrays) of a batch run"""
+    
+    def __init__(self, bet: float):
+        self.bet = bet
+        self.hands_played = 0
+        self.total_net = 0.0
+        self.total_net_sq = 0.0
+        self.total_action = 0.0
+        self.wins = 0
+        self.losses = 0
+        self.pushes = 0
+        self.blackjacks = 0
+        self.net_win: Optional[np.ndarray] = None
+        self.total_bet: Optional[np.ndarray] = None
+        self.num_hands: Optional[np.ndarray] = None
+        self.dealer_total: Optional[np.ndarray] = None
+        self._chunks = []
+    
+    def _add_chunk(self, net_win, total_bet, num_hands, dealer_total, blackjack, keep_hands: bool):
+        self.hands_played += len(net_win)
+        self.total_net += float(net_win.sum())
+        self.total_net_sq += float(np.square(net_win).sum())
+        self.total_action += float(total_bet.sum())
+        self.wins += int(np.count_nonzero(net_win > 0))
+        self.losses += int(np.count_nonzero(net_win < 0))
+        self.pushes += int(np.count_nonzero(net_win == 0))
+        self.blackjacks += int(np.count_nonzero(blackjack))
+        if keep_hands:
+            self._chunks.append((net_win, total_bet, num_hands, dealer_total))
+    
+    def _finish(self):
+        if self._chunks:
+            self.net_win, self.total_bet, self.num_hands, self.dealer_total = (
+                np.concatenate(column) for column in zip(*self._chunks)
+            )
+        self._chunks = []
+    
+    @property
+    def total_wagered(self) -> float:
+        return self.hands_played * self.bet
+    
+    @property
+    def ev_percent(self) -> float:
+        return self.total_net / self.total_wagered * 100 if self.total_wagered > 0 else 0
+    
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.hands_played * 100 if self.hands_played > 0 else 0
+    
+    @property
+    def std_dev(self) -> float:
+        """Standard deviation of the net result per hand, in units of the bet"""
+        if self.hands_played < 2:
+            return 0
+        mean = self.total_net / self.hands_played
+        variance = (self.total_net_sq - self.hands_played * mean * mean) / (self.hands_played - 1)
+        return math.sqrt(max(variance, 0)) / self.bet
+    
+    def ev_confidence_interval(self, z: float = 1.96):
+        """Normal-approximation confidence interval of the EV in percent"""
+        half_width = z * self.std_dev / math.sqrt(self.hands_played) * 100 if self.hands_played else 0
+        return self.ev_percent - half_width, self.ev_percent + half_width
+    
+    def print_summary(self):
+        low, high = self.ev_confidence_interval()
+        print(f"\n{'='*50}")
+        print(f"Batch Simulation Complete")
+        print(f"Hands played: {self.hands_played}")
+        print(f"Win rate: {self.win_rate:.1f}%")
+        print(f"Wins: {self.wins} | Losses: {self.losses} | Pushes: {self.pushes}")
+        print(f"Blackjacks: {self.blackjacks}")
+        print(f"Total wagered: ${self.total_wagered:.2f} (action incl. doubles/splits: ${self.total_action:.2f})")
+        print(f"Expected Value (EV): {self.ev_percent:+.3f}% (95% CI {low:+.3f}% to {high:+.3f}%)")
+        print(f"Std dev per hand: {self.std_dev:.3f} bets")
+
+
+class BatchGame:
+    """
+    Plays many independent hands at once over integer-encoded card arrays.
+    
+    Every hand is dealt from its own freshly shuffled shoe of config.num_decks
+    decks (penetration and shuffle_every_hand do not apply). Decisions come from
+    a decision table (see engine.tables) and follow BlackjackGame.play_hand rule
+    for rule, including peek, DAS, surrender, double_on and max_hands.
+    """
+    
+    def __init__(self, config: GameConfig = None, strategy=None, table: bytes = None,
+                 seed: Optional[int] = None):
+        self.config = config or GameConfig()
+        if table is None:
+            if strategy is None:
+                raise ValueError("BatchGame needs a playing strategy or a decision table")
+            # Precompiled strategies (strategies.playing.table.TableStrategy) carry their table
+            table = getattr(strategy, "table", None) or build_table(strategy)
+        self.table = np.frombuffer(table, dtype=np.int8).reshape(NUM_ROWS, NUM_UPCARDS, NUM_FLAGS)
+        self.rng = np.random.default_rng(seed)
+    
+    def play(self, num_hands: int, bet: float = 1.0, chunk_size: int = 100_000,
+             keep_hands: bool = True) -> BatchResult:
+        """Play num_hands hands of a flat bet, chunk_size hands per vectorized pass"""
+        result = BatchResult(bet)
+        remaining = num_hands
+        while remaining > 0:
+            n = min(chunk_size, remaining)
+            result._add_chunk(*self._play_chunk(n, bet), keep_hands=keep_hands)
+            remaining -= n
+        result._finish()
+        return result
+    
+    def _play_chunk(self, n: int, bet: float):
+        config = self.config
+        rng = self.rng
+        table = self.table
+        max_hands = max(config.max_hands, 1)
+        counts = np.tile(DECK_COMPOSITION * config.num_decks, (n, 1))
+        
+        def draw(rows):
+            cumulative = np.cumsum(counts[rows], axis=1)
+            pick = (rng.random(len(rows)) * cumulative[:, -1]).astype(np.int32)
+            np.minimum(pick, cumulative[:, -1] - 1, out=pick)
+            column = (cumulative <= pick[:, None]).sum(axis=1)
+            counts[rows, column] -= 1
+            return (column + 2).astype(np.int16)
+        
+        everyone = np.arange(n)
+        first_card = draw(everyone)
+        hole_card = draw(everyone)
+        second_card = draw(everyone)
+        upcard = draw(everyone)
+        
+        player_blackjack = first_card + second_card == 21
+        dealer_blackjack = hole_card + upcard == 21
+        net = np.zeros(n)
+        done_early = np.zeros(n, dtype=bool)
+        if config.dealer_peeks:
+            net[dealer_blackjack & ~player_blackjack] = -1
+            done_early |= dealer_blackjack
+        paid_blackjack = player_blackjack & ~done_early
+        net[paid_blackjack] = config.blackjack_payout
+        done_early |= player_blackjack
+        
+        # Per-slot hand state; hard totals count aces as 1
+        hard = np.zeros((n, max_hands), dtype=np.int16)
+        aces = np.zeros((n, max_hands), dtype=np.int8)
+        num_cards = np.zeros((n, max_hands), dtype=np.int8)
+        card0 = np.zeros((n, max_hands), dtype=np.int16)
+        card1 = np.zeros((n, max_hands), dtype=np.int16)
+        multiplier = np.ones((n, max_hands))
+        surrendered = np.zeros((n, max_hands), dtype=bool)
+        is_split = np.zeros((n, max_hands), dtype=bool)
+        hands_in_play = np.ones(n, dtype=np.int8)
+        
+        hard[:, 0] = np.where(first_card == 11, 1, first_card) + np.where(second_card == 11, 1, second_card)
+        aces[:, 0] = (first_card == 11).astype(np.int8) + (second_card == 11)
+        num_cards[:, 0] = 2
+        card0[:, 0] = first_card
+        card1[:, 0] = second_card
+        
+        double_on = config.double_on
+        for slot in range(max_hands):
+            active = np.flatnonzero(~done_early & (hands_in_play > slot))
+            first_action = np.ones(len(active), dtype=bool)
+            while len(active):
+                slot_hard = hard[active, slot]
+                soft = (aces[active, slot] > 0) & (slot_hard + 10 <= 21)
+                value = slot_hard + 10 * soft
+                alive = value <= 21
+                active, first_action = active[alive], first_action[alive]
+                soft, value = soft[alive], value[alive]
+                if not len(active):
+                    break
+                
+                split_hand = is_split[active, slot]
+                two_cards = num_cards[active, slot] == 2
+                can_double = first_action & two_cards
+                if not config.double_after_split:
+                    can_double &= ~split_hand
+                if double_on == "10-11":
+                    can_double &= (value == 10) | (value == 11)
+                elif double_on == "9-11":
+                    can_double &= (value >= 9) & (value <= 11)
+                pair = two_cards & (card0[active, slot] == card1[active, slot])
+                can_split = first_action & pair & (hands_in_play[active] < max_hands)
+                can_surrender = first_action & ~split_hand if config.surrender_allowed else np.zeros(len(active), dtype=bool)
+                
+                flags = can_double * FLAG_DOUBLE + can_split * FLAG_SPLIT + can_surrender * FLAG_SURRENDER
+                row = np.where(can_split, PAIR_ROW_OFFSET + card0[active, slot],
+                               np.where(soft, SOFT_ROW_OFFSET + value, value))
+                action = table[row, upcard[active] - 2, flags]
+                invalid = (((action == ACTION_DOUBLE) & ~can_double) |
+                           ((action == ACTION_SPLIT) & ~can_split) |
+                           ((action == ACTION_SURRENDER) & ~can_surrender))
+                action = np.where(invalid, ACTION_HIT, action)
+                
+                hitting = active[action == ACTION_HIT]
+                if len(hitting):
+                    card = draw(hitting)
+                    hard[hitting, slot] += np.where(card == 11, 1, card)
+                    aces[hitting, slot] += card == 11
+                    num_cards[hitting, slot] += 1
+                
+                doubling = active[action == ACTION_DOUBLE]
+                if len(doubling):
+                    card = draw(doubling)
+                    multiplier[doubling, slot] = 2
+                    hard[doubling, slot] += np.where(card == 11, 1, card)
+                    aces[doubling, slot] += card == 11
+                    num_cards[doubling, slot] += 1
+                
+                surrendered[active[action == ACTION_SURRENDER], slot] = True
+                
+                splitting = active[action == ACTION_SPLIT]
+                if len(splitting):
+                    new_slot = hands_in_play[splitting].astype(np.intp)
+                    pair_card = card0[splitting, slot]
+                    pair_hard = np.where(pair_card == 11, 1, pair_card)
+                    pair_ace = (pair_card == 11).astype(np.int8)
+                    for target in (slot, new_slot):
+                        card = draw(splitting)
+                        hard[splitting, target] = pair_hard + np.where(card == 11, 1, card)
+                        aces[splitting, target] = pair_ace + (card == 11)
+                        num_cards[splitting, target] = 2
+                        card0[splitting, target] = pair_card
+                        card1[splitting, target] = card
+                        is_split[splitting, target] = True
+                    hands_in_play[splitting] += 1
+                
+                # As in play_hand, the hand that stays after a split has used its first action
+                keep = (action == ACTION_HIT) | (action == ACTION_SPLIT)
+                active = active[keep]
+                first_action = np.zeros(len(active), dtype=bool)
+        
+        slots = np.arange(max_hands)
+        in_play = (slots[None, :] < hands_in_play[:, None]) & ~done_early[:, None]
+        player_soft = (aces > 0) & (hard + 10 <= 21)
+        player_value = hard + 10 * player_soft
+        standing = in_play & (player_value <= 21) & ~surrendered
+        
+        # Dealer draws once per hand that still has a live player hand
+        dealer_hard = np.where(hole_card == 11, 1, hole_card) + np.where(upcard == 11, 1, upcard)
+        dealer_aces = (hole_card == 11).astype(np.int8) + (upcard == 11)
+        drawing = np.flatnonzero(standing.any(axis=1))
+        hits_soft_17 = config.dealer_hits_soft_17
+        while len(drawing):
+            soft = (dealer_aces[drawing] > 0) & (dealer_hard[drawing] + 10 <= 21)
+            value = dealer_hard[drawing] + 10 * soft
+            hit = value < 17
+            if hits_soft_17:
+                hit |= (value == 17) & soft
+            drawing = drawing[hit]
+            if len(drawing):
+                card = draw(drawing)
+                dealer_hard[drawing] += np.where(card == 11, 1, card)
+                dealer_aces[drawing] += card == 11
+        dealer_soft = (dealer_aces > 0) & (dealer_hard + 10 <= 21)
+        dealer_value = dealer_hard + 10 * dealer_soft
+        dealer_busted = dealer_value > 21
+        
+        outcome = np.sign(player_value - dealer_value[:, None]).astype(np.float64)
+        outcome[dealer_busted] = 1
+        outcome[player_value > 21] = -1
+        outcome[surrendered] = -0.5
+        outcome *= multiplier
+        net += np.where(in_play, outcome, 0).sum(axis=1)
+        
+        total_bet = np.where(in_play, multiplier, 0).sum(axis=1) + done_early
+        return net * bet, total_bet * bet, hands_in_play, dealer_value.astype(np.int8), paid_blackjack
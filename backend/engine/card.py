@@ -1,6 +1,6 @@
+from array import array
 from enum import Enum
 from typing import List
-import random
 
 
 class Suit(Enum):
@@ -31,9 +31,13 @@ class Rank(Enum):
 
 
 class Card:
+    __slots__ = ("rank", "suit", "value", "code")
+    
     def __init__(self, rank: Rank, suit: Suit):
         self.rank = rank
         self.suit = suit
+        self.value = rank.card_value
+        self.code = _SUIT_INDEX[suit] * len(_RANK_INDEX) + _RANK_INDEX[rank]
     
     def __str__(self):
         return f"{self.rank.display}{self.suit.value}"
@@ -42,26 +46,111 @@ class Card:
         return str(self)
 
 
+_RANK_INDEX = {rank: i for i, rank in enumerate(Rank)}
+_SUIT_INDEX = {suit: i for i, suit in enumerate(Suit)}
+
+# Integer card codes 0-51 (suit * 13 + rank) decode to shared, immutable Card instances
+CARDS = tuple(Card(rank, suit) for suit in Suit for rank in Rank)
+CARD_VALUES = tuple(card.value for card in CARDS)
+
+
+def decode(code: int) -> Card:
+    return CARDS[code]
+
+
 class Shoe:
-    def __init__(self, num_decks: int = 6, penetration: float = 0.75):
+    """
+    Shoe backed by a preallocated buffer of int8 card codes, dealt with a cursor.
+    
+    The cut card is placed after penetration * cards. needs_shuffle() reports when
+    it has been reached so the game can reshuffle between rounds; deal() itself only
+    reshuffles if the shoe runs out. Attached count systems are updated as each
+    card is seen. Shuffles draw from rng (see engine.rng.make_rng; the module-global
+    random by default).
+    """
+    
+    def __init__(self, num_decks: int = 6, penetration: float = 0.75, count_systems=(), rng=None):
+        from .counting import CardCounter, get_count_system
+        from .rng import make_rng
+        
+        self.rng = make_rng(rng)
         self.num_decks = num_decks
         self.penetration = penetration
-        self.cards: List[Card] = []
+        self.codes = array('b', range(len(CARDS))) * num_decks
+        self.position = 0
+        self.counters = [CardCounter(get_count_system(system)) for system in count_systems]
         self.shuffle()
     
     def shuffle(self):
-        self.cards = []
-        for _ in range(self.num_decks):
-            for suit in Suit:
-                for rank in Rank:
-                    self.cards.append(Card(rank, suit))
-        random.shuffle(self.cards)
-        self.cut_card = int(len(self.cards) * self.penetration)
+        self.rng.shuffle(self.codes)
+        self.position = 0
+        self.cut_card = int(len(self.codes) * self.penetration)
+        for counter in self.counters:
+            counter.reset(self.num_decks)
+    
+    def deal_code(self) -> int:
+        if self.position >= len(self.codes):
+            self.shuffle()
+        code = self.codes[self.position]
+        self.position += 1
+        for counter in self.counters:
+            counter.running_count += counter.tags[code]
+        return code
     
     def deal(self) -> Card:
-        if len(self.cards) <= self.cut_card:
+        if self.position >= len(self.codes):
             self.shuffle()
-        return self.cards.pop()
+        code = self.codes[self.position]
+        self.position += 1
+        for counter in self.counters:
+            counter.running_count += counter.tags[code]
+        return CARDS[code]
+    
+    def deal_hidden(self) -> Card:
+        """Deal a face-down card; it is only counted once passed to reveal()"""
+        if self.position >= len(self.codes):
+            self.shuffle()
+        code = self.codes[self.position]
+        self.position += 1
+        return CARDS[code]
+    
+    def reveal(self, card: Card):
+        for counter in self.counters:
+            counter.running_count += counter.tags[card.code]
+    
+    def start_round(self):
+        """Called by BlackjackGame before each round is dealt"""
+        pass
+    
+    def remaining(self) -> int:
+        return len(self.codes) - self.position
+    
+    @property
+    def cards(self) -> List[Card]:
+        """Undealt cards, decoded for display (next card to be dealt last)"""
+        return [CARDS[code] for code in reversed(self.codes[self.position:])]
     
     def needs_shuffle(self) -> bool:
-        return len(self.cards) <= self.cut_card
+        return self.position >= self.cut_card
+    
+    def decks_remaining(self) -> float:
+        return (len(self.codes) - self.position) / len(CARDS)
+    
+    def _counter(self, system=None):
+        if not self.counters:
+            raise ValueError("No count system attached to this shoe")
+        if system is None:
+            return self.counters[0]
+        name = system if isinstance(system, str) else system.name
+        for counter in self.counters:
+            if counter.system.name == name:
+                return counter
+        raise ValueError(f"Count system {name} is not attached to this shoe")
+    
+    def running_count(self, system=None) -> int:
+        """Running count of a system (default: the first attached)"""
+        return self._counter(system).running_count
+    
+    def true_count(self, system=None) -> float:
+        """Running count per deck remaining"""
+        return self._counter(system).running_count / max(self.decks_remaining(), 1 / len(CARDS))
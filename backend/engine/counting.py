@@ -0,0 +1,62 @@
+from typing import Dict
+from .card import Rank, CARDS
+
+
+class CountSystem:
+    """Card counting system: a tag per rank and the initial running count per deck"""
+    
+    def __init__(self, name: str, tags: Dict[Rank, int], balanced: bool = True,
+                 initial_count_per_deck: int = 0, initial_count_offset: int = 0):
+        self.name = name
+        self.tags = tags
+        self.balanced = balanced
+        self.initial_count_per_deck = initial_count_per_deck
+        self.initial_count_offset = initial_count_offset
+        # Tag for every card code, so counting a dealt card is one tuple index
+        self.tags_by_code = tuple(tags[card.rank] for card in CARDS)
+    
+    def initial_count(self, num_decks: int) -> int:
+        return self.initial_count_per_deck * num_decks + self.initial_count_offset
+    
+    def __repr__(self):
+        return f"CountSystem({self.name!r})"
+
+
+def _tags(two, three, four, five, six, seven, eight, nine, ten, ace) -> Dict[Rank, int]:
+    return {
+        Rank.TWO: two, Rank.THREE: three, Rank.FOUR: four, Rank.FIVE: five, Rank.SIX: six,
+        Rank.SEVEN: seven, Rank.EIGHT: eight, Rank.NINE: nine,
+        Rank.TEN: ten, Rank.JACK: ten, Rank.QUEEN: ten, Rank.KING: ten, Rank.ACE: ace,
+    }
+
+
+HI_LO = CountSystem("hi-lo", _tags(1, 1, 1, 1, 1, 0, 0, 0, -1, -1))
+# Unbalanced: starts at 4 - 4 * decks so the count ends the shoe at +4
+KO = CountSystem("ko", _tags(1, 1, 1, 1, 1, 1, 0, 0, -1, -1), balanced=False,
+                 initial_count_per_deck=-4, initial_count_offset=4)
+OMEGA_II = CountSystem("omega-ii", _tags(1, 1, 2, 2, 2, 1, 0, -1, -2, 0))
+ZEN = CountSystem("zen", _tags(1, 1, 2, 2, 2, 1, 0, 0, -2, -1))
+
+COUNT_SYSTEMS = {system.name: system for system in (HI_LO, KO, OMEGA_II, ZEN)}
+
+
+def get_count_system(system) -> CountSystem:
+    if isinstance(system, CountSystem):
+        return system
+    try:
+        return COUNT_SYSTEMS[system.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown count system: {system} (choose from {', '.join(COUNT_SYSTEMS)})")
+
+
+class CardCounter:
+    """Running count of one system, updated by the Shoe as cards are seen"""
+    __slots__ = ("system", "tags", "running_count")
+    
+    def __init__(self, system: CountSystem):
+        self.system = system
+        self.tags = system.tags_by_code
+        self.running_count = 0
+    
+    def reset(self, num_decks: int):
+        self.running_count = self.system.initial_count(num_decks)
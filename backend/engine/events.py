@@ -0,0 +1,137 @@
+from typing import List
+
+
+class GameListener:
+    """
+    Observer of BlackjackGame events. Subclasses override the hooks they need; the
+    game only builds and emits events when a listener is attached.
+    """
+    
+    def on_deal(self, bet: float, player_hand, dealer_upcard):
+        pass
+    
+    def on_insurance(self, amount: float):
+        pass
+    
+    def on_dealer_blackjack(self, dealer_hand, player_blackjack: bool, insurance: float):
+        pass
+    
+    def on_player_blackjack(self, net_win: float):
+        pass
+    
+    def on_action(self, hand, action: str, allowed: bool = True, card=None, new_hand=None):
+        """
+        A player decision. card is the card drawn by a hit or double; a split passes
+        the new hand. allowed is False when the action was refused and the hand hits.
+        """
+        pass
+    
+    def on_dealer_reveal(self, dealer_hand):
+        pass
+    
+    def on_dealer_draw(self, card, dealer_hand):
+        pass
+    
+    def on_dealer_done(self, dealer_hand):
+        pass
+    
+    def on_resolve(self, index: int, hand, outcome: str, net: float, num_hands: int):
+        """Settlement of one hand: outcome is surrender, bust, dealer_bust, win, loss or push"""
+        pass
+    
+    def on_settle(self, net: float):
+        pass
+    
+    def on_round_end(self, result):
+        pass
+
+
+class ListenerGroup(GameListener):
+    """Fans every event out to several listeners"""
+    
+    def __init__(self, listeners: List[GameListener]):
+        self.listeners = list(listeners)
+
+
+def _fan_out(name: str):
+    def emit(self, *args, **kwargs):
+        for listener in self.listeners:
+            getattr(listener, name)(*args, **kwargs)
+    emit.__name__ = name
+    return emit
+
+
+for _name in [name for name in vars(GameListener) if name.startswith("on_")]:
+    setattr(ListenerGroup, _name, _fan_out(_name))
+
+
+class VerboseListener(GameListener):
+    """Prints a play-by-play of every round (BlackjackGame's verbose mode)"""
+    
+    def on_deal(self, bet, player_hand, dealer_upcard):
+        print(f"\n{'='*50}")
+        print(f"Bet: ${bet}")
+        print(f"Player: {player_hand}")
+        print(f"Dealer: {dealer_upcard} ?")
+    
+    def on_insurance(self, amount):
+        print(f"Insurance: ${amount}")
+    
+    def on_dealer_blackjack(self, dealer_hand, player_blackjack, insurance):
+        print(f"Dealer has blackjack: {dealer_hand}")
+        if player_blackjack:
+            print("Push - both have blackjack")
+        else:
+            print("Dealer blackjack - you lose")
+        if insurance:
+            print(f"Insurance pays ${2 * insurance}")
+    
+    def on_player_blackjack(self, net_win):
+        print(f"Blackjack! You win ${net_win}")
+    
+    def on_action(self, hand, action, allowed=True, card=None, new_hand=None):
+        if not allowed:
+            print(f"Cannot {action}, hitting instead")
+        elif action == "stand":
+            print("Stand")
+        elif action == "hit":
+            print(f"Hit: {card} -> {hand}")
+        elif action == "double":
+            print(f"Double down: {card} -> {hand}")
+        elif action == "split":
+            print("Split!")
+            print(f"Hand 1: {hand}")
+            print(f"Hand 2: {new_hand}")
+        elif action == "surrender":
+            print("Surrender")
+        if card is not None and hand.is_busted():
+            print("Bust!")
+    
+    def on_dealer_reveal(self, dealer_hand):
+        print(f"\nDealer reveals: {dealer_hand}")
+    
+    def on_dealer_draw(self, card, dealer_hand):
+        print(f"Dealer hits: {card} -> {dealer_hand}")
+    
+    def on_dealer_done(self, dealer_hand):
+        if dealer_hand.is_busted():
+            print("Dealer busts!")
+    
+    def on_resolve(self, index, hand, outcome, net, num_hands):
+        if num_hands > 1:
+            print(f"\nHand {index + 1}: {hand}")
+        if outcome == "surrender":
+            print(f"Surrendered: lose ${-net}")
+        elif outcome == "bust":
+            print(f"Busted: lose ${-net}")
+        elif outcome == "dealer_bust":
+            print(f"Dealer busted: win ${net}")
+        elif outcome == "win":
+            print(f"Win: ${net}")
+        elif outcome == "loss":
+            print(f"Lose: ${-net}")
+        else:
+            print("Push")
+    
+    def on_settle(self, net):
+        print(f"\nNet result: ${net:+.2f}")
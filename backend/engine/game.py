@@ -1,6 +1,11 @@
 from typing import List, Optional
 from .card import Shoe, Card
 from .hand import Hand
+from .events import GameListener, ListenerGroup, VerboseListener
+from .rng import make_rng
+
+
+MAX_SEATS = 7
 
 
 class GameConfig:
@@ -12,6 +17,7 @@ class GameConfig:
         self.dealer_peeks = kwargs.get("dealer_peeks", True)
         self.blackjack_payout = kwargs.get("blackjack_payout", 1.5)
         self.surrender_allowed = kwargs.get("surrender_allowed", True)
+        self.insurance_allowed = kwargs.get("insurance_allowed", True)  # offered against an Ace when the dealer peeks
         self.double_after_split = kwargs.get("double_after_split", True)
         self.double_on = kwargs.get("double_on", "any")  # "any", "9-11", "10-11"
         self.resplit_aces = kwargs.get("resplit_aces", False)
@@ -19,6 +25,12 @@ class GameConfig:
         self.max_hands = kwargs.get("max_hands", 4)
         self.min_bet = kwargs.get("min_bet", 5)
         self.max_bet = kwargs.get("max_bet", 500)
+        self.count_systems = kwargs.get("count_systems", ())  # e.g. ["hi-lo"], see engine.counting
+        self.rng = kwargs.get("rng", "python")  # "python" or "pcg64", see engine.rng
+        self.seed = kwargs.get("seed", None)  # None: python draws from the module-global random
+    
+    def to_dict(self) -> dict:
+        return dict(vars(self))
 
 
 class GameResult:
@@ -29,102 +41,169 @@ class GameResult:
         self.outcome: str = ""  # "win", "loss", "push", "blackjack", "bust", "surrender"
         self.actions_taken = []  # List of actions player took
         self.dealer_upcard = None
-        self.initial_player_hand = None
+        self.initial_cards = []  # Player's first two cards
+        self.insurance_bet: float = 0  # Side bet taken against a dealer Ace, settled in net_win
+    
+    @property
+    def initial_player_hand(self) -> Optional[str]:
+        """Player's first two cards as displayed, built on access"""
+        if not self.initial_cards:
+            return None
+        hand = Hand()
+        for card in self.initial_cards:
+            hand.add_card(card)
+        return str(hand)
 
 
 class BlackjackGame:
-    def __init__(self, config: GameConfig = None, verbose: bool = True):
+    def __init__(self, config: GameConfig = None, verbose: bool = True,
+                 listeners: Optional[List[GameListener]] = None, shoe: Optional[Shoe] = None):
         self.config = config or GameConfig()
-        self.shoe = Shoe(self.config.num_decks, self.config.penetration)
+        # A shoe may be passed in, e.g. an engine.replay ReplayShoe
+        if shoe is None:
+            shoe = Shoe(self.config.num_decks, self.config.penetration, self.config.count_systems,
+                        make_rng(self.config.rng, self.config.seed))
+        self.shoe = shoe
+        self.rng = shoe.rng
         self.dealer_hand: Optional[Hand] = None
         self.verbose = verbose
+        # Events are only built when a listener is attached; verbose output is one
+        self.listener: Optional[GameListener] = None
+        if verbose:
+            self.add_listener(VerboseListener())
+        for listener in listeners or ():
+            self.add_listener(listener)
+    
+    def add_listener(self, listener: GameListener):
+        if self.listener is None:
+            self.listener = listener
+        elif isinstance(self.listener, ListenerGroup):
+            self.listener.listeners.append(listener)
+        else:
+            self.listener = ListenerGroup([self.listener, listener])
     
-    def play_hand(self, bet: float, strategy) -> GameResult:
-        """Play a single hand of blackjack"""
-        result = GameResult()
+    def play_hand(self, bet: float, strategy, shuffle: bool = True) -> GameResult:
+        """
+        Play a single hand of blackjack. Pass shuffle=False when the caller manages
+        reshuffling between rounds itself.
+        """
+        return self.play_round([bet], [strategy], shuffle)[0]
+    
+    def play_round(self, bets: List[float], strategies: list, shuffle: bool = True) -> List[GameResult]:
+        """
+        Play one round at a table of up to MAX_SEATS seats sharing the shoe, one bet
+        and strategy per seat. Cards go out in casino order (a card to every seat,
+        the dealer's hole card, a second card to every seat, the upcard), seats play
+        in turn and the dealer draws out once for the whole table. Returns one
+        GameResult per seat.
+        """
+        num_seats = len(bets)
+        if not 1 <= num_seats <= MAX_SEATS or len(strategies) != num_seats:
+            raise ValueError(f"A round needs 1 to {MAX_SEATS} seats with one bet and strategy each")
+        listener = self.listener
+        shoe = self.shoe
         
-        # Shuffle before each hand if configured
-        if self.config.shuffle_every_hand:
-            self.shoe.shuffle()
+        # Shuffle before each round if configured, or once the cut card is reached
+        if shuffle and (self.config.shuffle_every_hand or shoe.needs_shuffle()):
+            shoe.shuffle()
+        shoe.start_round()
         
         # Initial deal
-        player_hand = Hand()
-        player_hand.bet = bet
-        self.dealer_hand = Hand()
-        
-        player_hand.add_card(self.shoe.deal())
-        self.dealer_hand.add_card(self.shoe.deal())
-        player_hand.add_card(self.shoe.deal())
-        dealer_upcard = self.shoe.deal()
-        self.dealer_hand.add_card(dealer_upcard)
+        seat_hands = []
+        for bet in bets:
+            hand = Hand()
+            hand.bet = bet
+            hand.add_card(shoe.deal())
+            seat_hands.append(hand)
+        dealer_hand = self.dealer_hand = Hand()
+        hole_card = shoe.deal_hidden()
+        dealer_hand.add_card(hole_card)
+        for hand in seat_hands:
+            hand.add_card(shoe.deal())
+        dealer_upcard = shoe.deal()
+        dealer_hand.add_card(dealer_upcard)
         
-        result.dealer_upcard = dealer_upcard
-        result.initial_player_hand = str(player_hand)
+        results = []
+        for hand in seat_hands:
+            result = GameResult()
+            result.dealer_upcard = dealer_upcard
+            result.initial_cards = hand.cards[:]
+            result.dealer_hand = dealer_hand
+            result.player_hands = [hand]
+            results.append(result)
+            if listener is not None:
+                listener.on_deal(hand.bet, hand, dealer_upcard)
         
-        if self.verbose:
-            print(f"\n{'='*50}")
-            print(f"Bet: ${bet}")
-            print(f"Player: {player_hand}")
-            print(f"Dealer: {dealer_upcard} ?")
+        # Offer insurance (half the bet, pays 2:1) before the dealer peeks under an Ace
+        insurance = [0] * num_seats
+        if self.config.insurance_allowed and self.config.dealer_peeks and dealer_upcard.value == 11:
+            for i, hand in enumerate(seat_hands):
+                if strategies[i].take_insurance(hand, dealer_upcard, {"player_blackjack": hand.is_blackjack()}):
+                    insurance[i] = bets[i] / 2
+                    results[i].insurance_bet = insurance[i]
+                    if listener is not None:
+                        listener.on_insurance(insurance[i])
         
         # Check for dealer blackjack
-        if self.config.dealer_peeks and self.dealer_hand.is_blackjack():
-            if self.verbose:
-                print(f"Dealer has blackjack: {self.dealer_hand}")
-            if player_hand.is_blackjack():
-                result.outcome = "push"
-                result.net_win = 0
-                if self.verbose:
-                    print("Push - both have blackjack")
-            else:
-                result.outcome = "loss"
-                result.net_win = -bet
-                if self.verbose:
-                    print("Dealer blackjack - you lose")
-            result.player_hands = [player_hand]
-            result.dealer_hand = self.dealer_hand
-            return result
-        
-        # Check for player blackjack
-        if player_hand.is_blackjack():
-            result.outcome = "blackjack"
-            result.net_win = bet * self.config.blackjack_payout
-            if self.verbose:
-                print(f"Blackjack! You win ${result.net_win}")
-            result.player_hands = [player_hand]
-            result.dealer_hand = self.dealer_hand
-            return result
+        if self.config.dealer_peeks and dealer_hand.is_blackjack():
+            shoe.reveal(hole_card)
+            for hand, bet, side_bet, result in zip(seat_hands, bets, insurance, results):
+                player_blackjack = hand.is_blackjack()
+                if player_blackjack:
+                    result.outcome = "push"
+                    result.net_win = 0
+                else:
+                    result.outcome = "loss"
+                    result.net_win = -bet
+                if side_bet:
+                    result.net_win += 2 * side_bet
+                if listener is not None:
+                    listener.on_dealer_blackjack(dealer_hand, player_blackjack, side_bet)
+                    listener.on_round_end(result)
+            return results
         
-        # Play player hand(s)
-        hands = [player_hand]
-        for hand in hands:
-            if hand.is_surrendered:
+        # Pay player blackjacks, play out the other seats in turn
+        live_seats = []
+        dealer_plays = False
+        for i, hand in enumerate(seat_hands):
+            result = results[i]
+            if hand.is_blackjack():
+                result.outcome = "blackjack"
+                result.net_win = bets[i] * self.config.blackjack_payout - insurance[i]
+                if listener is not None:
+                    listener.on_player_blackjack(result.net_win)
                 continue
             
-            self._play_player_hand(hand, dealer_upcard, strategy, hands, result)
+            hands = result.player_hands
+            for seat_hand in hands:
+                if seat_hand.is_surrendered:
+                    continue
+                
+                self._play_player_hand(seat_hand, dealer_upcard, strategies[i], hands, result)
+            live_seats.append(i)
+            if not dealer_plays:
+                for seat_hand in hands:
+                    if not seat_hand.is_surrendered and not seat_hand.is_busted():
+                        dealer_plays = True
+                        break
         
         # Play dealer hand
-        if any(not h.is_busted() and not h.is_surrendered for h in hands):
-            if self.verbose:
-                print(f"\nDealer reveals: {self.dealer_hand}")
-            while self._dealer_should_hit():
-                card = self.shoe.deal()
-                self.dealer_hand.add_card(card)
-                if self.verbose:
-                    print(f"Dealer hits: {card} -> {self.dealer_hand}")
-            
-            if self.dealer_hand.is_busted() and self.verbose:
-                print("Dealer busts!")
+        shoe.reveal(hole_card)
+        if dealer_plays:
+            self._play_dealer()
         
         # Resolve all hands
-        result.net_win = self._resolve_hands(hands)
-        result.player_hands = hands
-        result.dealer_hand = self.dealer_hand
+        for i in live_seats:
+            results[i].net_win = self._resolve_hands(results[i].player_hands) - insurance[i]
+        if listener is not None:
+            for result in results:
+                listener.on_round_end(result)
         
-        return result
+        return results
     
     def _play_player_hand(self, hand: Hand, dealer_upcard: Card, strategy, all_hands: List[Hand], result: GameResult):
         """Play out a single player hand"""
+        listener = self.listener
         is_first_action = True
         
         while not hand.is_busted():
@@ -139,17 +218,15 @@ class BlackjackGame:
             result.actions_taken.append(action_value)
             
             if action_value == "stand":
-                if self.verbose:
-                    print("Stand")
+                if listener is not None:
+                    listener.on_action(hand, action_value)
                 break
             
             elif action_value == "hit":
                 card = self.shoe.deal()
                 hand.add_card(card)
-                if self.verbose:
-                    print(f"Hit: {card} -> {hand}")
-                if hand.is_busted() and self.verbose:
-                    print("Bust!")
+                if listener is not None:
+                    listener.on_action(hand, action_value, card=card)
             
             elif action_value == "double":
                 if game_state["can_double"]:
@@ -157,51 +234,61 @@ class BlackjackGame:
                     hand.is_doubled = True
                     card = self.shoe.deal()
                     hand.add_card(card)
-                    if self.verbose:
-                        print(f"Double down: {card} -> {hand}")
-                    if hand.is_busted() and self.verbose:
-                        print("Bust!")
+                    if listener is not None:
+                        listener.on_action(hand, action_value, card=card)
                     break
                 else:
-                    if self.verbose:
-                        print("Cannot double, hitting instead")
+                    if listener is not None:
+                        listener.on_action(hand, action_value, allowed=False)
                     continue
             
             elif action_value == "split":
                 if game_state["can_split"]:
-                    if self.verbose:
-                        print("Split!")
                     new_hand = Hand()
                     new_hand.bet = hand.bet
                     new_hand.is_split_hand = True
-                    new_hand.add_card(hand.cards.pop())
+                    new_hand.add_card(hand.pop_card())
                     hand.is_split_hand = True
                     
                     hand.add_card(self.shoe.deal())
                     new_hand.add_card(self.shoe.deal())
                     all_hands.append(new_hand)
                     
-                    if self.verbose:
-                        print(f"Hand 1: {hand}")
-                        print(f"Hand 2: {new_hand}")
+                    if listener is not None:
+                        listener.on_action(hand, action_value, new_hand=new_hand)
                 else:
-                    if self.verbose:
-                        print("Cannot split, hitting instead")
+                    if listener is not None:
+                        listener.on_action(hand, action_value, allowed=False)
                     continue
             
             elif action_value == "surrender":
                 if game_state["can_surrender"]:
                     hand.is_surrendered = True
-                    if self.verbose:
-                        print("Surrender")
+                    if listener is not None:
+                        listener.on_action(hand, action_value)
                     break
                 else:
-                    if self.verbose:
-                        print("Cannot surrender, hitting instead")
+                    if listener is not None:
+                        listener.on_action(hand, action_value, allowed=False)
                     continue
             
             is_first_action = False
     
+    def _play_dealer(self):
+        """Draw out the dealer's hand once the hole card is revealed"""
+        listener = self.listener
+        dealer_hand = self.dealer_hand
+        if listener is not None:
+            listener.on_dealer_reveal(dealer_hand)
+        while self._dealer_should_hit():
+            card = self.shoe.deal()
+            dealer_hand.add_card(card)
+            if listener is not None:
+                listener.on_dealer_draw(card, dealer_hand)
+        
+        if listener is not None:
+            listener.on_dealer_done(dealer_hand)
+    
     def _can_double(self, hand: Hand) -> bool:
         """Check if doubling is allowed"""
         if len(hand.cards) != 2:
@@ -227,40 +314,36 @@ class BlackjackGame:
     
     def _resolve_hands(self, hands: List[Hand]) -> float:
         """Resolve all hands and return net win/loss"""
+        listener = self.listener
         net = 0
         dealer_value = self.dealer_hand.value()
         dealer_busted = self.dealer_hand.is_busted()
         
         for i, hand in enumerate(hands):
-            if len(hands) > 1 and self.verbose:
-                print(f"\nHand {i+1}: {hand}")
-            
             if hand.is_surrendered:
-                net -= hand.bet / 2
-                if self.verbose:
-                    print(f"Surrendered: lose ${hand.bet / 2}")
+                hand_net = -hand.bet / 2
+                outcome = "surrender"
             elif hand.is_busted():
-                net -= hand.bet
-                if self.verbose:
-                    print(f"Busted: lose ${hand.bet}")
+                hand_net = -hand.bet
+                outcome = "bust"
             elif dealer_busted:
-                net += hand.bet
-                if self.verbose:
-                    print(f"Dealer busted: win ${hand.bet}")
+                hand_net = hand.bet
+                outcome = "dealer_bust"
             else:
                 player_value = hand.value()
                 if player_value > dealer_value:
-                    net += hand.bet
-                    if self.verbose:
-                        print(f"Win: ${hand.bet}")
+                    hand_net = hand.bet
+                    outcome = "win"
                 elif player_value < dealer_value:
-                    net -= hand.bet
-                    if self.verbose:
-                        print(f"Lose: ${hand.bet}")
+                    hand_net = -hand.bet
+                    outcome = "loss"
                 else:
-                    if self.verbose:
-                        print("Push")
+                    hand_net = 0
+                    outcome = "push"
+            net += hand_net
+            if listener is not None:
+                listener.on_resolve(i, hand, outcome, hand_net, len(hands))
         
-        if self.verbose:
-            print(f"\nNet result: ${net:+.2f}")
+        if listener is not None:
+            listener.on_settle(net)
         return net
@@ -1,5 +1,5 @@
 from typing import List
-from .card import Card, Rank
+from .card import Card
 
 
 class Hand:
@@ -9,42 +9,63 @@ class Hand:
         self.is_split_hand: bool = False
         self.is_doubled: bool = False
         self.is_surrendered: bool = False
+        # Running totals kept up to date by add_card/pop_card (aces counted as 1)
+        self.hard_total: int = 0
+        self.aces: int = 0
+        self._value: int = 0
+        self._soft: bool = False
     
     def add_card(self, card: Card):
         self.cards.append(card)
+        if card.value == 11:
+            self.aces += 1
+            self.hard_total += 1
+        else:
+            self.hard_total += card.value
+        self._update_value()
+    
+    def pop_card(self) -> Card:
+        """Remove and return the last card (used when splitting)"""
+        card = self.cards.pop()
+        if card.value == 11:
+            self.aces -= 1
+            self.hard_total -= 1
+        else:
+            self.hard_total -= card.value
+        self._update_value()
+        return card
+    
+    def _update_value(self):
+        # At most one ace can count as 11 without busting
+        if self.aces and self.hard_total <= 11:
+            self._value = self.hard_total + 10
+            self._soft = True
+        else:
+            self._value = self.hard_total
+            self._soft = False
     
     def value(self) -> int:
         """Calculate best hand value (soft or hard)"""
-        total = sum(card.rank.card_value for card in self.cards)
-        aces = sum(1 for card in self.cards if card.rank == Rank.ACE)
-        
-        # Adjust for aces
-        while total > 21 and aces > 0:
-            total -= 10
-            aces -= 1
-        
-        return total
+        return self._value
     
     def is_soft(self) -> bool:
         """Check if hand is soft (has ace counted as 11)"""
-        total = sum(card.rank.card_value for card in self.cards)
-        aces = sum(1 for card in self.cards if card.rank == Rank.ACE)
-        return aces > 0 and total <= 21
+        return self._soft
     
     def is_busted(self) -> bool:
-        return self.value() > 21
+        return self._value > 21
     
     def is_blackjack(self) -> bool:
         """Natural blackjack: Ace + 10-value card on initial 2 cards"""
         return (len(self.cards) == 2 and 
-                self.value() == 21 and 
+                self._value == 21 and 
                 not self.is_split_hand)
     
     def is_pair(self) -> bool:
         """Check if hand can be split"""
         if len(self.cards) != 2:
             return False
-        return self.cards[0].rank.card_value == self.cards[1].rank.card_value
+        return self.cards[0].value == self.cards[1].value
     
     def __str__(self):
         return f"{' '.join(str(c) for c in self.cards)} ({self.value()})"
@@ -0,0 +1,76 @@
+import hashlib
+import inspect
+import json
+import os
+from typing import Optional, Union
+
+
+# GameConfig fields that can change a playing decision
+DECISION_FIELDS = ("num_decks", "dealer_hits_soft_17", "dealer_peeks", "surrender_allowed",
+                   "double_after_split", "double_on", "max_hands")
+
+# GameConfig fields that decide how a hand plays out and pays; shoe handling, bet
+# limits, counting and the RNG are not rules
+RULE_FIELDS = DECISION_FIELDS + ("blackjack_payout", "insurance_allowed", "resplit_aces", "hit_split_aces")
+
+# GameConfig fields besides the rules that change a simulated session
+SESSION_FIELDS = ("penetration", "shuffle_every_hand", "min_bet", "max_bet", "count_systems")
+
+
+def rule_fields(game_config, fields=DECISION_FIELDS) -> Optional[dict]:
+    """The named rule fields of a GameConfig for a cache key; None without a config"""
+    if game_config is None:
+        return None
+    return {field: getattr(game_config, field) for field in fields}
+
+
+def source_digest(cls) -> str:
+    """sha256 of a class's source, so that editing the class invalidates what it cached"""
+    try:
+        source = inspect.getsource(cls)
+    except (OSError, TypeError):
+        source = ""
+    return hashlib.sha256(source.encode()).hexdigest()
+
+
+def describe(obj):
+    """JSON-able description of a strategy: its classes, their source and config"""
+    if hasattr(obj, "betting") and hasattr(obj, "playing"):
+        return {"betting": describe(obj.betting), "playing": describe(obj.playing)}
+    if isinstance(obj, (bytes, bytearray)):
+        return hashlib.sha256(obj).hexdigest()
+    if isinstance(obj, dict):
+        return {str(k): describe(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [describe(v) for v in obj]
+    if hasattr(obj, "config"):
+        cls = type(obj)
+        return {
+            "class": f"{cls.__module__}.{cls.__qualname__}",
+            "source": source_digest(cls),
+            "config": describe(obj.config),
+        }
+    return obj
+
+
+def content_key(payload) -> str:
+    """sha256 of a JSON-able payload, independent of dict order"""
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def cache_dir(name: str) -> str:
+    """A cache subdirectory under $BLACKJACK_CACHE_DIR (default ~/.cache/blackjack_simulator)"""
+    root = os.environ.get("BLACKJACK_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "blackjack_simulator"))
+    return os.path.join(root, name)
+
+
+def atomic_write(path: str, data: Union[bytes, str]):
+    """
+    Write a file through a temporary file and a rename, so that readers (and other
+    processes writing the same cache entry) never see it half written
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb" if isinstance(data, bytes) else "w") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
@@ -0,0 +1,124 @@
+from time import perf_counter
+from typing import Dict, List
+
+
+# Exclusive phases: time spent in a nested phase (e.g. the dealer's draws, which are
+# dealing) is not counted again in the phase around it
+PHASES = ("shuffle", "deal", "betting", "decisions", "dealer", "settle", "game", "runner")
+COUNTERS = ("rounds", "hands", "shuffles", "cards_dealt", "bets", "decisions", "doubles", "splits",
+            "history_bytes")
+
+_MISSING = object()
+
+
+class GameProfiler:
+    """
+    Opt-in per-phase timers and counters for a BlackjackGame.
+    
+    attach() wraps the methods of one game, its shoe and the strategies on those
+    instances only, so nothing is measured (or slowed down) unless a profiler is
+    attached; detach() restores them. start()/stop() bracket the run: wall time
+    not spent in any engine phase is reported as runner (history, statistics and
+    the loop itself).
+    """
+    
+    def __init__(self):
+        self.times: Dict[str, float] = dict.fromkeys(PHASES, 0.0)
+        self.counts: Dict[str, int] = dict.fromkeys(COUNTERS, 0)
+        self.wall_time = 0.0
+        self._started = None
+        self._child: List[float] = []
+        self._patched = []
+    
+    def _timed(self, phase: str, func, counter: str = None):
+        times = self.times
+        counts = self.counts
+        child = self._child
+        
+        def timed(*args, **kwargs):
+            child.append(0.0)
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = perf_counter() - start
+                times[phase] += elapsed - child.pop()
+                if child:
+                    child[-1] += elapsed
+                if counter is not None:
+                    counts[counter] += 1
+        return timed
+    
+    def _timed_action(self, func):
+        counts = self.counts
+        timed = self._timed("decisions", func, "decisions")
+        
+        def get_action(player_hand, dealer_upcard, game_state):
+            action = timed(player_hand, dealer_upcard, game_state)
+            name = getattr(action, "value", action)
+            if name == "split" and game_state.get("can_split"):
+                counts["splits"] += 1
+            elif name == "double" and game_state.get("can_double"):
+                counts["doubles"] += 1
+            return action
+        return get_action
+    
+    def _patch(self, obj, name: str, wrapper):
+        self._patched.append((obj, name, vars(obj).get(name, _MISSING)))
+        setattr(obj, name, wrapper)
+    
+    def attach(self, game, strategies=()):
+        shoe = game.shoe
+        self._patch(shoe, "shuffle", self._timed("shuffle", shoe.shuffle, "shuffles"))
+        self._patch(shoe, "deal", self._timed("deal", shoe.deal, "cards_dealt"))
+        self._patch(shoe, "deal_hidden", self._timed("deal", shoe.deal_hidden, "cards_dealt"))
+        self._patch(game, "_play_dealer", self._timed("dealer", game._play_dealer))
+        self._patch(game, "_resolve_hands", self._timed("settle", game._resolve_hands))
+        
+        play_round = self._timed("game", game.play_round, "rounds")
+        counts = self.counts
+        
+        def counted_round(bets, strategies, shuffle=True):
+            counts["hands"] += len(bets)
+            return play_round(bets, strategies, shuffle)
+        self._patch(game, "play_round", counted_round)
+        
+        for strategy in strategies:
+            self._patch(strategy, "get_action", self._timed_action(strategy.get_action))
+            self._patch(strategy, "take_insurance", self._timed("decisions", strategy.take_insurance))
+            self._patch(strategy, "next_bet", self._timed("betting", strategy.next_bet, "bets"))
+            self._patch(strategy, "get_bet", self._timed("betting", strategy.get_bet, "bets"))
+        return self
+    
+    def detach(self):
+        for obj, name, original in reversed(self._patched):
+            if original is _MISSING:
+                delattr(obj, name)
+            else:
+                setattr(obj, name, original)
+        self._patched = []
+    
+    def start(self):
+        self._started = perf_counter()
+    
+    def stop(self):
+        if self._started is not None:
+            self.wall_time += perf_counter() - self._started
+            self._started = None
+    
+    def phase_times(self) -> Dict[str, float]:
+        """Seconds per phase; runner is the wall time left over by the engine phases"""
+        times = dict(self.times)
+        times["runner"] = max(self.wall_time - sum(t for p, t in times.items() if p != "runner"), 0.0)
+        return times
+    
+    def print_report(self):
+        times = self.phase_times()
+        total = sum(times.values()) or 1.0
+        counts = self.counts
+        print(f"\nProfile ({self.wall_time:.2f}s wall, "
+              f"{counts['hands'] / self.wall_time if self.wall_time else 0:,.0f} hands/s):")
+        for phase in PHASES:
+            print(f"  {phase:<10} {times[phase]:8.3f}s {times[phase] / total * 100:5.1f}%")
+        print("  " + " | ".join(f"{name.replace('_', ' ')}: {counts[name]:,}" for name in COUNTERS))
+
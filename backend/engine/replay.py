@@ -0,0 +1,156 @@
+import struct
+import sys
+import zlib
+from array import array
+from .card import Shoe, CARDS
+from .keys import atomic_write
+
+
+_MAGIC = b"BJRC"
+_HEADER = struct.Struct("<4sIII")  # magic, decks, shoes, rounds
+
+
+class ShoeRecording:
+    """
+    Card sequence of a session: the order of every shoe it shuffled (one byte per
+    card) and the shoe and position each round started from. Record with a
+    RecordingShoe, replay with a ReplayShoe.
+    """
+    
+    def __init__(self, num_decks: int = 6):
+        if num_decks * len(CARDS) > 0xFFFF:
+            raise ValueError(f"Too many decks to record: {num_decks}")
+        self.num_decks = num_decks
+        self.orders = bytearray()
+        self.round_shoes = array('I')
+        self.round_starts = array('H')
+    
+    @property
+    def shoe_size(self) -> int:
+        return self.num_decks * len(CARDS)
+    
+    @property
+    def num_shoes(self) -> int:
+        return len(self.orders) // self.shoe_size
+    
+    @property
+    def num_rounds(self) -> int:
+        return len(self.round_shoes)
+    
+    def shoe_order(self, index: int) -> bytes:
+        return bytes(self.orders[index * self.shoe_size:(index + 1) * self.shoe_size])
+    
+    def recorder(self, game_config=None, rng=None) -> "RecordingShoe":
+        """A shoe for BlackjackGame(shoe=...) that records into this recording"""
+        from .game import GameConfig
+        from .rng import make_rng
+        
+        config = game_config or GameConfig()
+        return RecordingShoe(self, config.penetration, config.count_systems,
+                             rng if rng is not None else make_rng(config.rng, config.seed))
+    
+    def replayer(self, game_config=None) -> "ReplayShoe":
+        """A shoe for BlackjackGame(shoe=...) that deals this recording again"""
+        from .game import GameConfig
+        from .rng import make_rng
+        
+        config = game_config or GameConfig()
+        return ReplayShoe(self, config.count_systems, make_rng(config.rng, config.seed))
+    
+    def save(self, path: str):
+        """Write the recording zlib-compressed (about a byte per card dealt)"""
+        shoes, starts = self.round_shoes, self.round_starts
+        if sys.byteorder == "big":
+            shoes, starts = array('I', shoes), array('H', starts)
+            shoes.byteswap()
+            starts.byteswap()
+        header = _HEADER.pack(_MAGIC, self.num_decks, self.num_shoes, self.num_rounds)
+        body = zlib.compress(bytes(self.orders) + shoes.tobytes() + starts.tobytes())
+        atomic_write(path, header + body)
+    
+    @classmethod
+    def load(cls, path: str) -> "ShoeRecording":
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, num_decks, num_shoes, num_rounds = _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            raise ValueError(f"{path} is not a shoe recording")
+        body = zlib.decompress(data[_HEADER.size:])
+        recording = cls(num_decks)
+        orders_end = num_shoes * recording.shoe_size
+        shoes_end = orders_end + 4 * num_rounds
+        recording.orders = bytearray(body[:orders_end])
+        recording.round_shoes.frombytes(body[orders_end:shoes_end])
+        recording.round_starts.frombytes(body[shoes_end:])
+        if sys.byteorder == "big":
+            recording.round_shoes.byteswap()
+            recording.round_starts.byteswap()
+        return recording
+
+
+class RecordingShoe(Shoe):
+    """A Shoe that records every shuffled order and round start"""
+    
+    def __init__(self, recording: ShoeRecording, penetration: float = 0.75, count_systems=(), rng=None):
+        self.recording = recording
+        super().__init__(recording.num_decks, penetration, count_systems, rng)
+    
+    def shuffle(self):
+        super().shuffle()
+        self.recording.orders += self.codes.tobytes()
+    
+    def start_round(self):
+        self.recording.round_shoes.append(self.recording.num_shoes - 1)
+        self.recording.round_starts.append(self.position)
+
+
+class ReplayShoe(Shoe):
+    """
+    Deals a ShoeRecording again without shuffling. Every round starts from the
+    recorded shoe and position, so a changed strategy sees exactly the recorded
+    deals even if it draws more or fewer cards than the original; cards skipped or
+    dealt twice that way are reflected in the counts as if seen. A round that
+    runs out its shoe continues into the next recorded one. The penetration is
+    implied by the recording.
+    """
+    
+    def __init__(self, recording: ShoeRecording, count_systems=(), rng=None):
+        self.recording = recording
+        self.round = 0
+        self.shoe_index = -1
+        super().__init__(recording.num_decks, 1.0, count_systems, rng)
+    
+    def shuffle(self):
+        # Reshuffles come from the recording: only an exhausted shoe moves on
+        if self.position < len(self.codes) and self.shoe_index >= 0:
+            return
+        self._load_shoe(self.shoe_index + 1)
+    
+    def needs_shuffle(self) -> bool:
+        return False
+    
+    def _load_shoe(self, index: int):
+        if index >= self.recording.num_shoes:
+            raise ValueError("Recording has no more shoes")
+        self.codes = array('b', self.recording.shoe_order(index))
+        self.shoe_index = index
+        self.position = 0
+        self.cut_card = len(self.codes)
+        for counter in self.counters:
+            counter.reset(self.num_decks)
+    
+    def start_round(self):
+        if self.round >= self.recording.num_rounds:
+            raise ValueError(f"Recording has only {self.recording.num_rounds} rounds")
+        shoe_index = self.recording.round_shoes[self.round]
+        start = self.recording.round_starts[self.round]
+        self.round += 1
+        if shoe_index != self.shoe_index:
+            self._load_shoe(shoe_index)
+        if start != self.position:
+            step = 1 if start > self.position else -1
+            low, high = min(start, self.position), max(start, self.position)
+            for counter in self.counters:
+                tags = counter.tags
+                counter.running_count += step * sum(tags[code] for code in self.codes[low:high])
+            self.position = start
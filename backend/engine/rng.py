@@ -0,0 +1,149 @@
+import random
+from abc import ABC, abstractmethod
+from typing import Optional, Sequence
+
+
+class RNG(ABC):
+    """
+    Random source used by the shoe and by randomized strategies. Implementations
+    shuffle the shoe's card buffer in place and draw the few scalars strategies
+    need; getstate()/setstate() capture the stream for reproduction.
+    """
+    
+    @abstractmethod
+    def shuffle(self, codes):
+        """Shuffle the shoe's card buffer in place"""
+        pass
+    
+    @abstractmethod
+    def random(self) -> float:
+        """A float in [0, 1)"""
+        pass
+    
+    def uniform(self, low: float, high: float) -> float:
+        return low + (high - low) * self.random()
+    
+    @abstractmethod
+    def choice(self, seq: Sequence):
+        """A uniformly chosen element of seq"""
+        pass
+    
+    @abstractmethod
+    def getstate(self):
+        """The generator state, for setstate()"""
+        pass
+    
+    @abstractmethod
+    def setstate(self, state):
+        """Restore a state from getstate()"""
+        pass
+
+
+class PythonRNG(RNG):
+    """
+    The standard library Mersenne Twister: a random.Random instance, or the
+    module-global generator when none is given (what random.seed() seeds)
+    """
+    
+    def __init__(self, generator: Optional[random.Random] = None):
+        self.generator = generator if generator is not None else random
+    
+    def shuffle(self, codes):
+        self.generator.shuffle(codes)
+    
+    def random(self) -> float:
+        return self.generator.random()
+    
+    def uniform(self, low: float, high: float) -> float:
+        return self.generator.uniform(low, high)
+    
+    def choice(self, seq: Sequence):
+        return self.generator.choice(seq)
+    
+    def getstate(self):
+        return self.generator.getstate()
+    
+    def setstate(self, state):
+        self.generator.setstate(state)
+    
+    def __reduce__(self):
+        # The module-global generator stays process-global when pickled to a worker
+        if self.generator is random:
+            return _global_rng, ()
+        return PythonRNG, (self.generator,)
+
+
+class NumpyRNG(RNG):
+    """A NumPy Generator (PCG64 by default); shuffles the shoe buffer in C"""
+    
+    def __init__(self, generator=None, seed: Optional[int] = None):
+        import numpy as np
+        self._np = np
+        self.generator = generator if generator is not None else np.random.Generator(np.random.PCG64(seed))
+    
+    def shuffle(self, codes):
+        self.generator.shuffle(self._np.frombuffer(codes, dtype=self._np.int8))
+    
+    def random(self) -> float:
+        return float(self.generator.random())
+    
+    def uniform(self, low: float, high: float) -> float:
+        return float(self.generator.uniform(low, high))
+    
+    def choice(self, seq: Sequence):
+        return seq[int(self.generator.integers(len(seq)))]
+    
+    def getstate(self):
+        return self.generator.bit_generator.state
+    
+    def setstate(self, state):
+        self.generator.bit_generator.state = state
+    
+    def __reduce__(self):
+        return NumpyRNG, (self.generator,)
+
+
+_GLOBAL = PythonRNG()
+
+
+def _global_rng() -> PythonRNG:
+    return _GLOBAL
+
+
+RNG_KINDS = ("python", "pcg64")
+
+
+def make_rng(rng=None, seed: Optional[int] = None) -> RNG:
+    """
+    Build an RNG from a GameConfig-style spec: an RNG instance, a random.Random, a
+    NumPy Generator, or a kind name ("python" or "pcg64") with an optional seed.
+    With neither kind nor seed this is the module-global random, so random.seed()
+    keeps controlling unseeded runs.
+    """
+    if isinstance(rng, RNG):
+        return rng
+    if isinstance(rng, random.Random):
+        return PythonRNG(rng)
+    if rng is None or rng == "python":
+        return _GLOBAL if seed is None else PythonRNG(random.Random(seed))
+    if rng == "pcg64":
+        return NumpyRNG(seed=seed)
+    if type(rng).__name__ == "Generator" and hasattr(rng, "bit_generator"):
+        return NumpyRNG(rng)
+    raise ValueError(f"Unknown RNG: {rng!r} (expected one of {RNG_KINDS}, an RNG or a generator)")
+
+
+def rng_kind(rng=None) -> str:
+    """
+    The kind name of a make_rng() spec, so that it can be rebuilt with another seed
+    (a NumPy generator of any bit generator becomes "pcg64")
+    """
+    if rng is None or isinstance(rng, (PythonRNG, random.Random)):
+        return "python"
+    if isinstance(rng, str):
+        if rng not in RNG_KINDS:
+            raise ValueError(f"Unknown RNG: {rng!r} (expected one of {RNG_KINDS}, an RNG or a generator)")
+        return rng
+    if isinstance(rng, NumpyRNG) or (type(rng).__name__ == "Generator" and hasattr(rng, "bit_generator")):
+        return "pcg64"
+    raise ValueError(f"Unknown RNG: {rng!r} (expected one of {RNG_KINDS}, an RNG or a generator)")
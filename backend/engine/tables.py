@@ -0,0 +1,118 @@
+from typing import Optional
+from .card import Card, Rank, Suit
+from .hand import Hand
+
+
+# Integer action codes used by table-driven engines
+ACTION_STAND = 0
+ACTION_HIT = 1
+ACTION_DOUBLE = 2
+ACTION_SPLIT = 3
+ACTION_SURRENDER = 4
+ACTION_NAMES = ("stand", "hit", "double", "split", "surrender")
+ACTION_CODES = {name: code for code, name in enumerate(ACTION_NAMES)}
+
+# game_state flags packed into a bitmask
+FLAG_DOUBLE = 1
+FLAG_SPLIT = 2
+FLAG_SURRENDER = 4
+
+# Table layout: rows 0-21 hard totals, 22-31 soft 12-21, 32-41 pairs of 2-11
+SOFT_ROW_OFFSET = 10
+PAIR_ROW_OFFSET = 30
+NUM_ROWS = 42
+NUM_UPCARDS = 10  # dealer upcard values 2-11
+NUM_FLAGS = 8
+TABLE_SIZE = NUM_ROWS * NUM_UPCARDS * NUM_FLAGS
+
+_RANK_FOR_VALUE = {
+    2: Rank.TWO, 3: Rank.THREE, 4: Rank.FOUR, 5: Rank.FIVE, 6: Rank.SIX,
+    7: Rank.SEVEN, 8: Rank.EIGHT, 9: Rank.NINE, 10: Rank.TEN, 11: Rank.ACE,
+}
+
+
+def hand_row(total: int, soft: bool, pair_value: Optional[int] = None) -> int:
+    """Table row for a hand; pair_value is only given when the hand may be split"""
+    if pair_value is not None:
+        return PAIR_ROW_OFFSET + pair_value
+    if soft:
+        return SOFT_ROW_OFFSET + total
+    return total
+
+
+def table_index(row: int, upcard_value: int, flags: int) -> int:
+    """Flat index into a decision table"""
+    return (row * NUM_UPCARDS + upcard_value - 2) * NUM_FLAGS + flags
+
+
+def state_flags(game_state: dict) -> int:
+    """Pack a game_state dict into a flags bitmask"""
+    flags = 0
+    if game_state.get("can_double", False):
+        flags |= FLAG_DOUBLE
+    if game_state.get("can_split", False):
+        flags |= FLAG_SPLIT
+    if game_state.get("can_surrender", False):
+        flags |= FLAG_SURRENDER
+    return flags
+
+
+def _make_hand(values) -> Hand:
+    hand = Hand()
+    suits = list(Suit)
+    for i, value in enumerate(values):
+        hand.add_card(Card(_RANK_FOR_VALUE[value], suits[i % len(suits)]))
+    return hand
+
+
+def _representative_cards(row: int):
+    """Cards of a typical hand for a table row (two cards where possible)"""
+    if row >= PAIR_ROW_OFFSET + 2:
+        value = row - PAIR_ROW_OFFSET
+        return (value, value)
+    if row >= SOFT_ROW_OFFSET + 12:
+        other = row - SOFT_ROW_OFFSET - 11
+        return (11, other if other > 1 else 11)
+    if row == 4:
+        return (2, 2)
+    if row == 20:
+        return (10, 7, 3)
+    if row == 21:
+        return (10, 8, 3)
+    if 5 <= row <= 19:
+        low = max(2, row - 10)
+        return (low, row - low)
+    return None
+
+
+def build_table(strategy) -> bytes:
+    """
+    Compile a playing strategy into a dense decision table by probing get_action
+    with a representative hand for every (row, upcard, flags) cell.
+    
+    The strategy must decide from hand total, softness, pair rank, dealer upcard
+    and game_state only. Actions not permitted by the flags are stored as hit,
+    matching how BlackjackGame treats them.
+    """
+    table = bytearray(TABLE_SIZE)
+    for row in range(NUM_ROWS):
+        cards = _representative_cards(row)
+        if cards is None:
+            continue
+        for upcard_value in range(2, 12):
+            upcard = Card(_RANK_FOR_VALUE[upcard_value], Suit.CLUBS)
+            for flags in range(NUM_FLAGS):
+                game_state = {
+                    "can_double": bool(flags & FLAG_DOUBLE),
+                    "can_split": bool(flags & FLAG_SPLIT),
+                    "can_surrender": bool(flags & FLAG_SURRENDER),
+                }
+                action = strategy.get_action(_make_hand(cards), upcard, game_state)
+                action_value = action.value if hasattr(action, 'value') else action
+                code = ACTION_CODES[action_value]
+                if ((code == ACTION_DOUBLE and not flags & FLAG_DOUBLE) or
+                        (code == ACTION_SPLIT and not flags & FLAG_SPLIT) or
+                        (code == ACTION_SURRENDER and not flags & FLAG_SURRENDER)):
+                    code = ACTION_HIT
+                table[table_index(row, upcard_value, flags)] = code
+    return bytes(table)
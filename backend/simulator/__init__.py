@@ -1,3 +1,13 @@
 from .runner import SimulationRunner, SimulationResult
+from .parallel import ParallelSimulationRunner
+from .compare import ComparisonRunner, ComparisonResult
+from .table import TableRunner, TableResult
+from .sweep import SweepRunner, SweepResult, expand_grid
+from .ruin import RuinSimulator, RuinResult
+from .history import ColumnarHistory
+from .export import HistoryExporter, NpyExporter, ParquetExporter, read_npy_history
 
-__all__ = ['SimulationRunner', 'SimulationResult']
+__all__ = ['SimulationRunner', 'SimulationResult', 'ParallelSimulationRunner', 'ComparisonRunner',
+           'ComparisonResult', 'TableRunner', 'TableResult', 'SweepRunner', 'SweepResult', 'expand_grid',
+           'RuinSimulator', 'RuinResult', 'ColumnarHistory',
+           'HistoryExporter', 'NpyExporter', 'ParquetExporter', 'read_npy_history']
@@ -0,0 +1,142 @@
+import math
+from typing import Dict, List, Tuple
+from .runner import SimulationResult
+
+
+class ComparisonResult:
+    """Per-strategy results of a comparison plus paired differences against the baseline"""
+    
+    def __init__(self, names: List[str], starting_bankroll: float):
+        self.names = names
+        self.baseline = names[0]
+        self.results: Dict[str, SimulationResult] = {
+            name: SimulationResult(starting_bankroll, streaming=True) for name in names
+        }
+        # Welford moments of (net_win - baseline net_win) over rounds both played
+        self._diff_n = [0] * len(names)
+        self._diff_mean = [0.0] * len(names)
+        self._diff_m2 = [0.0] * len(names)
+    
+    def _record_differences(self, nets: List[float]):
+        baseline = nets[0]
+        if baseline is None:
+            return
+        for i in range(1, len(nets)):
+            if nets[i] is None:
+                continue
+            diff = nets[i] - baseline
+            self._diff_n[i] += 1
+            delta = diff - self._diff_mean[i]
+            self._diff_mean[i] += delta / self._diff_n[i]
+            self._diff_m2[i] += delta * (diff - self._diff_mean[i])
+    
+    def difference(self, name: str, z: float = 1.96) -> Tuple[float, float, float]:
+        """
+        Mean net win per round of a strategy minus the baseline's, the half-width of
+        its paired confidence interval, and the half-width two independent runs of
+        the same length would have had
+        """
+        i = self.names.index(name)
+        n = self._diff_n[i]
+        if n < 2:
+            return self._diff_mean[i], float("inf"), float("inf")
+        paired = z * math.sqrt(self._diff_m2[i] / (n - 1) / n)
+        base, other = self.results[self.baseline], self.results[name]
+        independent = z * math.sqrt(base.net_win_variance / max(base.hands_played, 1)
+                                    + other.net_win_variance / max(other.hands_played, 1))
+        return self._diff_mean[i], paired, independent
+    
+    def print_summary(self, z: float = 1.96):
+        print(f"\n{'='*50}")
+        print(f"Comparison Complete ({self.results[self.baseline].hands_played} rounds, one shoe)")
+        for name in self.names:
+            result = self.results[name]
+            print(f"{name}: EV {result.ev_percent:+.2f}% | Net ${result.net_result:+.2f} | "
+                  f"Hands {result.hands_played}")
+        print(f"\nPaired difference vs {self.baseline} (net win per round, {z} sigma):")
+        for name in self.names[1:]:
+            mean, paired, independent = self.difference(name, z)
+            print(f"{name}: ${mean:+.4f} ± {paired:.4f} (independent runs: ± {independent:.4f})")
+
+
+class ComparisonRunner:
+    """
+    Plays K strategies against the same card sequence: every round is dealt once
+    from one shoe and each strategy plays it from the same starting position, so
+    their results are paired round by round (common random numbers).
+    
+    Afterwards the shoe continues from the furthest point any strategy reached. It is
+    only reshuffled between rounds, so keep penetration below 1 so that a round
+    never runs the shoe out.
+    """
+    
+    def __init__(self, game_config=None):
+        self.game_config = game_config
+    
+    def run(self, strategies: Dict[str, object], num_hands: int, starting_bankroll: float,
+            progress_interval: int = 100) -> ComparisonResult:
+        """
+        Play num_hands rounds for every strategy (the first one is the baseline).
+        Results are streaming; betting strategies bet from their SessionState.
+        """
+        from engine import BlackjackGame
+        from strategies import SessionState
+        
+        names = list(strategies)
+        if not names:
+            raise ValueError("ComparisonRunner needs at least one strategy")
+        players = [strategies[name] for name in names]
+        game = BlackjackGame(self.game_config, verbose=False)
+        shoe = game.shoe
+        config = game.config
+        for strategy in players:
+            strategy.bind_shoe(shoe)
+        
+        comparison = ComparisonResult(names, starting_bankroll)
+        results = [comparison.results[name] for name in names]
+        bankrolls = [starting_bankroll] * len(players)
+        states = [SessionState(starting_bankroll, shoe) for _ in players]
+        
+        print(f"Running comparison: {len(players)} strategies, {num_hands} rounds, "
+              f"starting bankroll ${starting_bankroll}\n")
+        
+        for hand_num in range(1, num_hands + 1):
+            if config.shuffle_every_hand or shoe.needs_shuffle():
+                shoe.shuffle()
+            start = shoe.position
+            start_counts = [counter.running_count for counter in shoe.counters]
+            end, end_counts = start, start_counts
+            nets = [None] * len(players)
+            
+            for i, strategy in enumerate(players):
+                if bankrolls[i] < config.min_bet:
+                    continue
+                # Rewind to the start of the round
+                shoe.position = start
+                for counter, count in zip(shoe.counters, start_counts):
+                    counter.running_count = count
+                
+                bet = strategy.next_bet(states[i])
+                game_result = game.play_hand(bet, strategy, shuffle=False)
+                bankrolls[i] += game_result.net_win
+                nets[i] = game_result.net_win
+                states[i].update(bet, game_result.net_win, game_result.outcome, bankrolls[i])
+                results[i].record(bet, game_result.net_win, bankrolls[i])
+                
+                if shoe.position > end:
+                    end, end_counts = shoe.position, [counter.running_count for counter in shoe.counters]
+            
+            if all(net is None for net in nets):
+                print(f"\nAll strategies out of funds after {hand_num - 1} rounds")
+                break
+            shoe.position = end
+            for counter, count in zip(shoe.counters, end_counts):
+                counter.running_count = count
+            comparison._record_differences(nets)
+            
+            if progress_interval > 0 and hand_num % progress_interval == 0:
+                print(f"Round {hand_num}/{num_hands}")
+        
+        for result, bankroll in zip(results, bankrolls):
+            result.final_bankroll = bankroll
+        return comparison
@@ -0,0 +1,173 @@
+import json
+import os
+import struct
+import sys
+from abc import ABC, abstractmethod
+from array import array
+from .history import ColumnarHistory, OUTCOMES
+
+
+class HistoryExporter(ABC):
+    """Base class for exporters fed with ColumnarHistory chunks while a simulation runs"""
+    
+    @abstractmethod
+    def write_chunk(self, chunk: ColumnarHistory):
+        """Write one chunk of consecutive hands"""
+        pass
+    
+    def close(self):
+        pass
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+
+
+# .npy headers are written at a fixed size so the shape can be patched in on close
+_NPY_HEADER_SIZE = 128
+_NPY_COLUMNS = {
+    "hand_num": "<i8",
+    "bet": "<f8",
+    "net_win": "<f8",
+    "bankroll_after": "<f8",
+    "outcome": "|i1",
+    "cards": "|i1",
+    "card_offsets": "<i8",
+    "actions": "|i1",
+    "action_offsets": "<i8",
+}
+
+
+def _history_meta() -> dict:
+    """Code tables and card layout that describe an exported history"""
+    from engine import CARDS
+    from engine.tables import ACTION_NAMES
+    
+    return {
+        "outcomes": list(OUTCOMES),
+        "actions": list(ACTION_NAMES),
+        "card_codes": [str(card) for card in CARDS],
+        "cards": "card code = suit * 13 + rank (card_codes); per hand: 2 initial player cards, "
+                 "dealer count + cards, player hand count, then count + cards per hand",
+    }
+
+
+def _npy_header(descr: str, length: int) -> bytes:
+    header = "{'descr': '%s', 'fortran_order': False, 'shape': (%d,), }" % (descr, length)
+    header = header.ljust(_NPY_HEADER_SIZE - 11) + "\n"
+    return b"\x93NUMPY\x01\x00" + struct.pack("<H", len(header)) + header.encode("latin1")
+
+
+class NpyExporter(HistoryExporter):
+    """
+    Writes history as a directory of typed, memory-mappable .npy columns
+    (np.load(path, mmap_mode="r")). Ragged cards and actions are stored flat with
+    offset columns: hand i's cards are cards[card_offsets[i]:card_offsets[i + 1]].
+    meta.json records the outcome/action code tables and the card layout.
+    """
+    
+    def __init__(self, directory: str):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self._files = {}
+        self._lengths = {}
+        for name, descr in _NPY_COLUMNS.items():
+            f = open(os.path.join(directory, f"{name}.npy"), "wb")
+            f.write(_npy_header(descr, 0))
+            self._files[name] = f
+            self._lengths[name] = 0
+        self._write("card_offsets", array('q', [0]))
+        self._write("action_offsets", array('q', [0]))
+        with open(os.path.join(directory, "meta.json"), "w") as f:
+            json.dump(_history_meta(), f, indent=2)
+    
+    def _write(self, name: str, values: array):
+        if sys.byteorder == "big" and values.itemsize > 1:
+            values = array(values.typecode, values)
+            values.byteswap()
+        values.tofile(self._files[name])
+        self._lengths[name] += len(values)
+    
+    def write_chunk(self, chunk: ColumnarHistory):
+        for name in ("hand_num", "bet", "net_win", "bankroll_after", "outcome"):
+            self._write(name, getattr(chunk, name))
+        card_base = self._lengths["cards"]
+        action_base = self._lengths["actions"]
+        self._write("cards", chunk.cards)
+        self._write("actions", chunk.actions)
+        self._write("card_offsets", array('q', (card_base + o for o in chunk.card_offsets[1:])))
+        self._write("action_offsets", array('q', (action_base + o for o in chunk.action_offsets[1:])))
+    
+    def close(self):
+        for name, f in self._files.items():
+            if f.closed:
+                continue
+            f.seek(0)
+            f.write(_npy_header(_NPY_COLUMNS[name], self._lengths[name]))
+            f.close()
+
+
+def read_npy_history(directory: str) -> ColumnarHistory:
+    """Load a directory written by NpyExporter back into a ColumnarHistory"""
+    history = ColumnarHistory()
+    for name in _NPY_COLUMNS:
+        column = getattr(history, name)
+        del column[:]
+        with open(os.path.join(directory, f"{name}.npy"), "rb") as f:
+            f.seek(_NPY_HEADER_SIZE)
+            column.frombytes(f.read())
+        if sys.byteorder == "big" and column.itemsize > 1:
+            column.byteswap()
+    return history
+
+
+class ParquetExporter(HistoryExporter):
+    """
+    Writes history to a compressed Parquet file, one row group per chunk. Actions
+    are dictionary-encoded lists of action names; cards are list<int8> columns of
+    card codes in the packed per-hand layout, which the schema metadata key
+    "blackjack_history" describes (JSON, as NpyExporter's meta.json). Requires pyarrow.
+    """
+    
+    def __init__(self, path: str, compression: str = "zstd"):
+        from engine.tables import ACTION_NAMES
+        
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("ParquetExporter requires pyarrow (pip install pyarrow)") from e
+        self._pa = pa
+        self.schema = pa.schema([
+            ("hand_num", pa.int64()),
+            ("bet", pa.float64()),
+            ("net_win", pa.float64()),
+            ("bankroll_after", pa.float64()),
+            ("outcome", pa.dictionary(pa.int8(), pa.string())),
+            ("cards", pa.list_(pa.int8())),
+            ("actions", pa.list_(pa.dictionary(pa.int8(), pa.string()))),
+        ], metadata={"blackjack_history": json.dumps(_history_meta())})
+        self._writer = pq.ParquetWriter(path, self.schema, compression=compression)
+        self._outcomes = pa.array(OUTCOMES, pa.string())
+        self._actions = pa.array(ACTION_NAMES, pa.string())
+    
+    def write_chunk(self, chunk: ColumnarHistory):
+        pa = self._pa
+        columns = [
+            pa.array(chunk.hand_num, pa.int64()),
+            pa.array(chunk.bet, pa.float64()),
+            pa.array(chunk.net_win, pa.float64()),
+            pa.array(chunk.bankroll_after, pa.float64()),
+            pa.DictionaryArray.from_arrays(pa.array(chunk.outcome, pa.int8()), self._outcomes),
+            pa.ListArray.from_arrays(pa.array(chunk.card_offsets, pa.int32()), pa.array(chunk.cards, pa.int8())),
+            pa.ListArray.from_arrays(pa.array(chunk.action_offsets, pa.int32()),
+                                     pa.DictionaryArray.from_arrays(pa.array(chunk.actions, pa.int8()), self._actions)),
+        ]
+        self._writer.write_table(pa.Table.from_arrays(columns, schema=self.schema))
+    
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
@@ -0,0 +1,126 @@
+from array import array
+from typing import Dict, List
+
+
+OUTCOMES = ("", "win", "loss", "push", "blackjack", "bust", "surrender")
+_OUTCOME_CODES = {outcome: code for code, outcome in enumerate(OUTCOMES)}
+
+
+class ColumnarHistory:
+    """
+    Hand history stored as typed columns instead of one dict per hand.
+    
+    Numbers live in array columns, outcomes and actions as small integer codes and
+    cards as packed int8 card codes, for roughly 50 bytes per hand. Indexing or
+    iterating decodes entries to the same dicts SimulationRunner records by default.
+    
+    Card layout per hand: two initial player cards, the dealer's card count and
+    cards, the number of player hands, then each player hand's count and cards.
+    """
+    
+    def __init__(self):
+        self.hand_num = array('q')
+        self.bet = array('d')
+        self.net_win = array('d')
+        self.bankroll_after = array('d')
+        self.outcome = array('b')
+        self.cards = array('b')
+        self.card_offsets = array('q', [0])
+        self.actions = array('b')
+        self.action_offsets = array('q', [0])
+    
+    def append(self, hand_num: int, bet: float, game_result, bankroll_after: float):
+        from engine.tables import ACTION_CODES
+        
+        self.hand_num.append(hand_num)
+        self.bet.append(bet)
+        self.net_win.append(game_result.net_win)
+        self.bankroll_after.append(bankroll_after)
+        self.outcome.append(_OUTCOME_CODES[game_result.outcome])
+        
+        cards = self.cards
+        cards.extend(card.code for card in game_result.initial_cards)
+        dealer_cards = game_result.dealer_hand.cards
+        cards.append(len(dealer_cards))
+        cards.extend(card.code for card in dealer_cards)
+        cards.append(len(game_result.player_hands))
+        for hand in game_result.player_hands:
+            cards.append(len(hand.cards))
+            cards.extend(card.code for card in hand.cards)
+        self.card_offsets.append(len(cards))
+        
+        self.actions.extend(ACTION_CODES[action] for action in game_result.actions_taken)
+        self.action_offsets.append(len(self.actions))
+    
+    def extend(self, other: "ColumnarHistory", hand_offset: int = 0, bankroll_offset: float = 0):
+        """Append another history, shifting its hand numbers and bankroll"""
+        self.hand_num.extend(n + hand_offset for n in other.hand_num)
+        self.bet.extend(other.bet)
+        self.net_win.extend(other.net_win)
+        self.bankroll_after.extend(b + bankroll_offset for b in other.bankroll_after)
+        self.outcome.extend(other.outcome)
+        card_base = len(self.cards)
+        self.cards.extend(other.cards)
+        self.card_offsets.extend(card_base + o for o in other.card_offsets[1:])
+        action_base = len(self.actions)
+        self.actions.extend(other.actions)
+        self.action_offsets.extend(action_base + o for o in other.action_offsets[1:])
+    
+    def __len__(self) -> int:
+        return len(self.hand_num)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._decode(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("history index out of range")
+        return self._decode(index)
+    
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self._decode(i)
+    
+    def nbytes(self) -> int:
+        columns = (self.hand_num, self.bet, self.net_win, self.bankroll_after, self.outcome,
+                   self.cards, self.card_offsets, self.actions, self.action_offsets)
+        return sum(len(c) * c.itemsize for c in columns)
+    
+    def _decode(self, i: int) -> Dict:
+        from engine import Hand, CARDS
+        from engine.tables import ACTION_NAMES
+        
+        packed = self.cards[self.card_offsets[i]:self.card_offsets[i + 1]]
+        initial = Hand()
+        for code in packed[:2]:
+            initial.add_card(CARDS[code])
+        
+        pos = 2
+        dealer = Hand()
+        for code in packed[pos + 1:pos + 1 + packed[pos]]:
+            dealer.add_card(CARDS[code])
+        pos += 1 + packed[pos]
+        
+        player_final: List[str] = []
+        for _ in range(packed[pos]):
+            pos += 1
+            hand = Hand()
+            for code in packed[pos + 1:pos + 1 + packed[pos]]:
+                hand.add_card(CARDS[code])
+            player_final.append(str(hand))
+            pos += packed[pos]
+        
+        actions = self.actions[self.action_offsets[i]:self.action_offsets[i + 1]]
+        return {
+            "hand_num": self.hand_num[i],
+            "bet": self.bet[i],
+            "net_win": self.net_win[i],
+            "outcome": OUTCOMES[self.outcome[i]],
+            "player_initial": str(initial),
+            "dealer_upcard": str(dealer.cards[1]) if len(dealer.cards) > 1 else "",
+            "dealer_final": str(dealer),
+            "player_final": player_final,
+            "actions": [ACTION_NAMES[a] for a in actions],
+            "bankroll_after": self.bankroll_after[i]
+        }
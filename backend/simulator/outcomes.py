@@ -0,0 +1,162 @@
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from engine.keys import atomic_write, cache_dir
+from .ruin import RuinResult
+
+
+DEFAULT_CACHE_DIR = cache_dir("outcomes")
+
+
+class OutcomeDistribution:
+    """
+    Distribution of a hand's net win per unit bet (-1, 0, +1, +1.5, -0.5 and the
+    double/split multiples) for one rule set and playing strategy
+    """
+    
+    def __init__(self, multipliers: List[float], probabilities: List[float]):
+        self.multipliers = np.asarray(multipliers, dtype=np.float64)
+        self.probabilities = np.asarray(probabilities, dtype=np.float64)
+        self._cumulative = np.cumsum(self.probabilities)
+        self._cumulative[-1] = 1.0
+    
+    @classmethod
+    def build(cls, game_config=None, strategy=None, num_hands: int = 2_000_000, seed: Optional[int] = 0,
+              cache_dir: Optional[str] = DEFAULT_CACHE_DIR) -> "OutcomeDistribution":
+        """
+        Empirical distribution from num_hands hands of the vectorized engine
+        (engine.batch.BatchGame, each hand from a fresh shoe). Cached on disk per
+        (strategy, rule set, hands, seed); unseeded builds are not cached.
+        """
+        from engine import GameConfig
+        from engine.batch import BatchGame
+        from engine.keys import RULE_FIELDS, content_key, rule_fields
+        from strategies.playing.table import table_cache_key
+        
+        config = game_config or GameConfig()
+        path = None
+        if cache_dir is not None and seed is not None:
+            key = content_key({
+                "table": table_cache_key(strategy),
+                "rules": rule_fields(config, RULE_FIELDS),
+                "hands": num_hands,
+                "seed": seed,
+            })
+            path = os.path.join(cache_dir, f"{key}.json")
+            if os.path.exists(path):
+                with open(path) as f:
+                    data = json.load(f)
+                return cls(data["multipliers"], data["probabilities"])
+        
+        result = BatchGame(config, strategy, seed=seed).play(num_hands, bet=1.0, keep_hands=True)
+        multipliers, counts = np.unique(np.round(result.net_win, 9), return_counts=True)
+        distribution = cls(multipliers.tolist(), (counts / counts.sum()).tolist())
+        
+        if path is not None:
+            atomic_write(path, json.dumps(distribution.to_dict(), indent=2))
+        return distribution
+    
+    def to_dict(self) -> Dict[str, list]:
+        return {"multipliers": self.multipliers.tolist(), "probabilities": self.probabilities.tolist()}
+    
+    @property
+    def mean(self) -> float:
+        return float(self.multipliers @ self.probabilities)
+    
+    @property
+    def std_dev(self) -> float:
+        return float(np.sqrt(np.square(self.multipliers - self.mean) @ self.probabilities))
+    
+    def sample(self, size, rng: np.random.Generator) -> np.ndarray:
+        """Net-win multipliers of size independent hands"""
+        return self.multipliers[np.searchsorted(self._cumulative, rng.random(size), side="right")]
+    
+    def print_summary(self):
+        print(f"Outcome distribution: EV {self.mean * 100:+.3f}%, std {self.std_dev:.3f} units/hand")
+        for multiplier, p in zip(self.multipliers, self.probabilities):
+            print(f"  {multiplier:+.1f}: {p * 100:.3f}%")
+
+
+class FastSessionSimulator:
+    """
+    Bankroll sessions driven by sampled hand outcomes instead of dealt cards: a hand
+    nets bet * multiplier with the multiplier drawn from an OutcomeDistribution.
+    Hands are independent, so this suits betting systems that only react to results
+    (flat, Martingale, random), not count-based betting.
+    
+    Betting strategies with vectorized = True advance all sessions of a chunk one
+    hand at a time with numpy through get_bets(); others use next_bet() per
+    session. Results use the same RuinResult as RuinSimulator.
+    """
+    
+    def __init__(self, distribution: OutcomeDistribution, min_bet: float = 5, seed: Optional[int] = None):
+        self.distribution = distribution
+        self.min_bet = min_bet
+        self.rng = np.random.default_rng(seed)
+    
+    def run(self, betting, num_sessions: int, session_hands: int, starting_bankroll: float,
+            target: Optional[float] = None, chunk_size: int = 100_000) -> RuinResult:
+        betting = getattr(betting, "betting", betting)  # accept a full Strategy
+        result = RuinResult(starting_bankroll, session_hands, target)
+        remaining = num_sessions
+        while remaining > 0:
+            n = min(chunk_size, remaining)
+            run_chunk = self._run_vectorized if betting.vectorized else self._run_scalar
+            columns = run_chunk(betting, n, session_hands, starting_bankroll, target)
+            for name, values in zip(("final_bankroll", "hands_played", "ruined", "peak_bankroll", "max_drawdown"),
+                                    columns):
+                column = getattr(result, name)
+                column.frombytes(values.astype(np.dtype(column.typecode)).tobytes())
+            remaining -= n
+        return result
+    
+    def _run_vectorized(self, betting, n: int, session_hands: int, starting_bankroll: float,
+                        target: Optional[float]) -> Tuple[np.ndarray, ...]:
+        bankroll = np.full(n, float(starting_bankroll))
+        peak = bankroll.copy()
+        max_drawdown = np.zeros(n)
+        hands = np.zeros(n, dtype=np.int64)
+        last_net = None
+        betting.reset()
+        for _ in range(session_hands):
+            active = bankroll >= self.min_bet
+            if target is not None:
+                active &= bankroll < target
+            if not active.any():
+                break
+            bets = betting.get_bets(bankroll, last_net, self.rng)
+            last_net = np.where(active, bets * self.distribution.sample(n, self.rng), 0.0)
+            bankroll += last_net
+            hands += active
+            np.maximum(peak, bankroll, out=peak)
+            np.maximum(max_drawdown, peak - bankroll, out=max_drawdown)
+        return bankroll, hands, bankroll < self.min_bet, peak, max_drawdown
+    
+    def _run_scalar(self, betting, n: int, session_hands: int, starting_bankroll: float,
+                    target: Optional[float]) -> Tuple[np.ndarray, ...]:
+        from strategies import SessionState
+        
+        columns = [np.zeros(n), np.zeros(n, dtype=np.int64), np.zeros(n, dtype=bool), np.zeros(n), np.zeros(n)]
+        for i in range(n):
+            betting.reset()
+            state = SessionState(starting_bankroll)
+            outcomes = self.distribution.sample(session_hands, self.rng)
+            bankroll = peak = float(starting_bankroll)
+            max_drawdown = 0.0
+            hands = 0
+            while hands < session_hands and bankroll >= self.min_bet:
+                if target is not None and bankroll >= target:
+                    break
+                bet = betting.next_bet(state)
+                net_win = bet * outcomes[hands]
+                bankroll += net_win
+                hands += 1
+                state.update(bet, net_win, "", bankroll)
+                if bankroll > peak:
+                    peak = bankroll
+                elif peak - bankroll > max_drawdown:
+                    max_drawdown = peak - bankroll
+            for column, value in zip(columns, (bankroll, hands, bankroll < self.min_bet, peak, max_drawdown)):
+                column[i] = value
+        return tuple(columns)
@@ -0,0 +1,79 @@
+import contextlib
+import hashlib
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+from .runner import SimulationRunner, SimulationResult
+
+
+def worker_seed(seed: int, worker: int) -> int:
+    """Derive an independent, reproducible 64-bit seed for a worker"""
+    digest = hashlib.sha256(f"{seed}:{worker}".encode()).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+def split_hands(num_hands: int, workers: int) -> List[int]:
+    """Split num_hands as evenly as possible across workers"""
+    base, extra = divmod(num_hands, workers)
+    return [base + (1 if i < extra else 0) for i in range(workers)]
+
+
+def worker_config(game_config, seed: int):
+    """
+    A worker's copy of a GameConfig: a configured RNG kind, seed or instance is
+    rebuilt from the worker seed so that workers never share a stream
+    """
+    if game_config is None or (game_config.rng == "python" and game_config.seed is None):
+        return game_config
+    from engine import GameConfig, rng_kind
+    return GameConfig(**dict(game_config.to_dict(), rng=rng_kind(game_config.rng), seed=seed))
+
+
+def run_worker(game_config, strategy, num_hands: int, starting_bankroll: float,
+               seed: int, streaming: bool, history_format: str) -> SimulationResult:
+    """
+    Play one worker's session quietly in the current process, with the module-global
+    random, the configured RNG and the strategy's own RNG all seeded from seed
+    """
+    # Each worker process owns its module-global RNG, so seeding it here gives the
+    # worker its own stream without touching the other workers
+    random.seed(seed)
+    strategy.reseed(seed)
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        runner = SimulationRunner(worker_config(game_config, seed), verbose=False)
+        return runner.run(strategy, num_hands, starting_bankroll, progress_interval=0,
+                          streaming=streaming, history_format=history_format)
+
+
+class ParallelSimulationRunner:
+    """Splits a simulation across a process pool and merges the workers' results"""
+    
+    def __init__(self, game_config=None, workers: Optional[int] = None, seed: Optional[int] = None):
+        self.game_config = game_config
+        self.workers = workers or os.cpu_count() or 1
+        self.seed = seed
+    
+    def run(self, strategy, num_hands: int, starting_bankroll: float,
+            streaming: bool = False, history_format: str = "dicts") -> SimulationResult:
+        """
+        Run num_hands across the pool. Worker i plays its share of the hands as an
+        independent session seeded from (seed, i); the merged result chains the
+        sessions in worker order, so a fixed seed and worker count reproduce it exactly.
+        """
+        seed = self.seed if self.seed is not None else random.SystemRandom().getrandbits(64)
+        shares = split_hands(num_hands, self.workers)
+        
+        print(f"Running simulation: {num_hands} hands on {self.workers} workers, "
+              f"starting bankroll ${starting_bankroll}\n")
+        
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            futures = [
+                pool.submit(run_worker, self.game_config, strategy, share,
+                            starting_bankroll, worker_seed(seed, i), streaming,
+                            history_format)
+                for i, share in enumerate(shares) if share > 0
+            ]
+            results = [future.result() for future in futures]
+        
+        return SimulationResult.merge(results)
@@ -0,0 +1,178 @@
+import math
+import os
+import random
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Sequence
+from .parallel import worker_seed, split_hands, worker_config
+
+
+QUANTILES = (0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99)
+
+
+def quantile(sorted_values: Sequence[float], q: float) -> float:
+    """Linearly interpolated quantile of already sorted values"""
+    if not sorted_values:
+        return float("nan")
+    position = q * (len(sorted_values) - 1)
+    low = int(position)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (position - low)
+
+
+class RuinResult:
+    """
+    Outcome of every session in an ensemble, stored as flat arrays (one entry per
+    session): final bankroll, hands played, whether the session was ruined, the
+    peak bankroll and the largest drawdown
+    """
+    
+    def __init__(self, starting_bankroll: float, session_hands: int, target: Optional[float] = None):
+        self.starting_bankroll = starting_bankroll
+        self.session_hands = session_hands
+        self.target = target
+        self.final_bankroll = array('d')
+        self.hands_played = array('q')
+        self.ruined = array('b')
+        self.peak_bankroll = array('d')
+        self.max_drawdown = array('d')
+    
+    def extend(self, other: "RuinResult"):
+        for name in ("final_bankroll", "hands_played", "ruined", "peak_bankroll", "max_drawdown"):
+            getattr(self, name).extend(getattr(other, name))
+    
+    @property
+    def num_sessions(self) -> int:
+        return len(self.final_bankroll)
+    
+    @property
+    def ruin_probability(self) -> float:
+        return sum(self.ruined) / self.num_sessions if self.num_sessions else 0
+    
+    def ruin_confidence_interval(self, z: float = 1.96):
+        """Wilson score interval of the ruin probability"""
+        n = self.num_sessions
+        if not n:
+            return 0.0, 1.0
+        p = self.ruin_probability
+        center = (p + z * z / (2 * n)) / (1 + z * z / n)
+        half_width = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / (1 + z * z / n)
+        return max(center - half_width, 0.0), min(center + half_width, 1.0)
+    
+    @property
+    def target_probability(self) -> float:
+        """Share of sessions that reached the target bankroll"""
+        if self.target is None or not self.num_sessions:
+            return 0
+        return sum(1 for b in self.final_bankroll if b >= self.target) / self.num_sessions
+    
+    @property
+    def mean_final_bankroll(self) -> float:
+        return sum(self.final_bankroll) / self.num_sessions if self.num_sessions else 0
+    
+    def final_bankroll_quantiles(self, quantiles: Sequence[float] = QUANTILES) -> Dict[float, float]:
+        values = sorted(self.final_bankroll)
+        return {q: quantile(values, q) for q in quantiles}
+    
+    def hands_to_ruin_quantiles(self, quantiles: Sequence[float] = QUANTILES) -> Dict[float, float]:
+        """Quantiles of the session length among ruined sessions"""
+        values = sorted(h for h, r in zip(self.hands_played, self.ruined) if r)
+        return {q: quantile(values, q) for q in quantiles}
+    
+    def max_drawdown_quantiles(self, quantiles: Sequence[float] = QUANTILES) -> Dict[float, float]:
+        values = sorted(self.max_drawdown)
+        return {q: quantile(values, q) for q in quantiles}
+    
+    def print_summary(self):
+        low, high = self.ruin_confidence_interval()
+        print(f"\n{'='*50}")
+        print(f"Session Ensemble Complete")
+        print(f"Sessions: {self.num_sessions} x up to {self.session_hands} hands, "
+              f"starting bankroll ${self.starting_bankroll:.2f}")
+        print(f"Risk of ruin: {self.ruin_probability * 100:.2f}% (95% CI {low * 100:.2f}% to {high * 100:.2f}%)")
+        if self.target is not None:
+            print(f"Reached ${self.target:.2f}: {self.target_probability * 100:.2f}%")
+        print(f"Mean final bankroll: ${self.mean_final_bankroll:.2f}")
+        print("Final bankroll quantiles: " + ", ".join(
+            f"p{q * 100:g} ${v:.2f}" for q, v in self.final_bankroll_quantiles().items()))
+        if self.ruin_probability > 0:
+            print("Hands to ruin quantiles: " + ", ".join(
+                f"p{q * 100:g} {v:.0f}" for q, v in self.hands_to_ruin_quantiles().items()))
+        print("Max drawdown quantiles: " + ", ".join(
+            f"p{q * 100:g} ${v:.2f}" for q, v in self.max_drawdown_quantiles().items()))
+
+
+def _play_sessions(game_config, strategy, num_sessions: int, session_hands: int,
+                   starting_bankroll: float, target: Optional[float], seed: int) -> RuinResult:
+    from engine import BlackjackGame, GameConfig
+    from strategies import SessionState
+    
+    random.seed(seed)
+    strategy.reseed(seed)
+    config = worker_config(game_config, seed) or GameConfig()
+    game = BlackjackGame(config, verbose=False)
+    strategy.bind_shoe(game.shoe)
+    result = RuinResult(starting_bankroll, session_hands, target)
+    min_bet = config.min_bet
+    
+    for _ in range(num_sessions):
+        # Independent sessions: fresh strategy state and a fresh shoe
+        strategy.reset()
+        game.shoe.shuffle()
+        state = SessionState(starting_bankroll, game.shoe)
+        bankroll = peak = starting_bankroll
+        max_drawdown = 0.0
+        hands = 0
+        while hands < session_hands and bankroll >= min_bet:
+            if target is not None and bankroll >= target:
+                break
+            bet = strategy.next_bet(state)
+            game_result = game.play_hand(bet, strategy)
+            net_win = game_result.net_win
+            bankroll += net_win
+            hands += 1
+            state.update(bet, net_win, game_result.outcome, bankroll)
+            if bankroll > peak:
+                peak = bankroll
+            elif peak - bankroll > max_drawdown:
+                max_drawdown = peak - bankroll
+        result.final_bankroll.append(bankroll)
+        result.hands_played.append(hands)
+        result.ruined.append(bankroll < min_bet)
+        result.peak_bankroll.append(peak)
+        result.max_drawdown.append(max_drawdown)
+    return result
+
+
+class RuinSimulator:
+    """
+    Risk-of-ruin Monte Carlo: many independent short sessions of one strategy,
+    keeping only each session's summary. A session ends when the bankroll can no
+    longer cover the table minimum (ruin), reaches the optional target, or after
+    session_hands hands. Sessions are split across a process pool; a fixed seed and
+    worker count reproduce the ensemble exactly.
+    """
+    
+    def __init__(self, game_config=None, workers: Optional[int] = None, seed: Optional[int] = None):
+        self.game_config = game_config
+        self.workers = workers or os.cpu_count() or 1
+        self.seed = seed
+    
+    def run(self, strategy, num_sessions: int, session_hands: int, starting_bankroll: float,
+            target: Optional[float] = None) -> RuinResult:
+        seed = self.seed if self.seed is not None else random.SystemRandom().getrandbits(64)
+        shares = split_hands(num_sessions, self.workers)
+        
+        print(f"Running {num_sessions} sessions of up to {session_hands} hands on {self.workers} workers, "
+              f"starting bankroll ${starting_bankroll}\n")
+        
+        result = RuinResult(starting_bankroll, session_hands, target)
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            futures = [
+                pool.submit(_play_sessions, self.game_config, strategy, share, session_hands,
+                            starting_bankroll, target, worker_seed(seed, i))
+                for i, share in enumerate(shares) if share > 0
+            ]
+            for future in futures:
+                result.extend(future.result())
+        return result
@@ -1,29 +1,97 @@
-from typing import List, Dict
+import math
+import pickle
+import random
+import struct
+import sys
+import zlib
+from typing import List, Optional
+from .history import ColumnarHistory
+
+
+_CHECKPOINT_MAGIC = b"BJCK"
+_CHECKPOINT_HEADER = struct.Struct("<4sI")  # magic, format version
+_CHECKPOINT_VERSION = 1
 
 
 class SimulationResult:
-    def __init__(self, starting_bankroll: float):
+    def __init__(self, starting_bankroll: float, streaming: bool = False,
+                 history_format: str = "dicts"):
+        if history_format not in ("dicts", "columnar"):
+            raise ValueError(f"Unknown history format: {history_format}")
         self.starting_bankroll = starting_bankroll
         self.final_bankroll = 0
         self.hands_played = 0
-        self.history: List[Dict] = []
+        self.streaming = streaming
+        self.history_format = history_format
+        self.history = ColumnarHistory() if history_format == "columnar" else []
         self.bankroll_history: List[float] = [starting_bankroll]
+        # engine.GameProfiler of a run(profile=True)
+        self.profile = None
+        
+        # Running accumulators, updated once per hand by record()
+        self._wins = 0
+        self._losses = 0
+        self._pushes = 0
+        self._total_wagered = 0.0
+        self._total_net = 0.0
+        self._max_bet = 0.0
+        self._peak = starting_bankroll
+        self._trough = starting_bankroll
+        self._max_drawdown = 0.0
+        self._net_mean = 0.0
+        self._net_m2 = 0.0
+        self._bet_mean = 0.0
+        self._bet_m2 = 0.0
+        self._bet_net_m2 = 0.0  # co-moment of bet and net_win
+        
+    def record(self, bet: float, net_win: float, bankroll: float):
+        """Fold one hand into the running statistics"""
+        self.hands_played += 1
+        if net_win > 0:
+            self._wins += 1
+        elif net_win < 0:
+            self._losses += 1
+        else:
+            self._pushes += 1
+        self._total_wagered += bet
+        self._total_net += net_win
+        if bet > self._max_bet:
+            self._max_bet = bet
+        
+        if bankroll > self._peak:
+            self._peak = bankroll
+        elif self._peak - bankroll > self._max_drawdown:
+            self._max_drawdown = self._peak - bankroll
+        if bankroll < self._trough:
+            self._trough = bankroll
         
+        # Welford's online mean/variance of net_win and bet, plus their co-moment
+        delta = net_win - self._net_mean
+        self._net_mean += delta / self.hands_played
+        self._net_m2 += delta * (net_win - self._net_mean)
+        bet_delta = bet - self._bet_mean
+        self._bet_mean += bet_delta / self.hands_played
+        self._bet_m2 += bet_delta * (bet - self._bet_mean)
+        self._bet_net_m2 += bet_delta * (net_win - self._net_mean)
+        
+        if not self.streaming:
+            self.bankroll_history.append(bankroll)
+    
     @property
     def net_result(self) -> float:
         return self.final_bankroll - self.starting_bankroll
     
     @property
     def wins(self) -> int:
-        return sum(1 for h in self.history if h['net_win'] > 0)
+        return self._wins
     
     @property
     def losses(self) -> int:
-        return sum(1 for h in self.history if h['net_win'] < 0)
+        return self._losses
     
     @property
     def pushes(self) -> int:
-        return sum(1 for h in self.history if h['net_win'] == 0)
+        return self._pushes
     
     @property
     def win_rate(self) -> float:
@@ -31,31 +99,51 @@ class SimulationResult:
     
     @property
     def total_wagered(self) -> float:
-        return sum(h['bet'] for h in self.history)
+        return self._total_wagered
     
     @property
     def ev_percent(self) -> float:
-        return (sum(h['net_win'] for h in self.history) / self.total_wagered * 100) if self.total_wagered > 0 else 0
+        return (self._total_net / self.total_wagered * 100) if self.total_wagered > 0 else 0
+    
+    @property
+    def net_win_variance(self) -> float:
+        """Sample variance of net_win per hand"""
+        return self._net_m2 / (self.hands_played - 1) if self.hands_played > 1 else 0
+    
+    @property
+    def net_win_std(self) -> float:
+        return math.sqrt(self.net_win_variance)
+    
+    @property
+    def ev_standard_error(self) -> float:
+        """
+        Standard error of ev_percent. EV is the ratio total net / total wagered, so
+        with variable bets its variance comes from the delta method over the bet
+        and net_win moments.
+        """
+        n = self.hands_played
+        if n < 2 or self._bet_mean <= 0:
+            return 0.0
+        ratio = self._net_mean / self._bet_mean
+        residual_m2 = self._net_m2 - 2 * ratio * self._bet_net_m2 + ratio * ratio * self._bet_m2
+        return math.sqrt(max(residual_m2, 0.0) / (n - 1) / n) / self._bet_mean * 100
+    
+    def ev_confidence_interval(self, z: float = 1.96):
+        """Normal-approximation confidence interval of the EV in percent"""
+        half_width = z * self.ev_standard_error
+        return self.ev_percent - half_width, self.ev_percent + half_width
     
     @property
     def max_drawdown(self) -> float:
-        peak = self.starting_bankroll
-        max_dd = 0
-        for balance in self.bankroll_history:
-            if balance > peak:
-                peak = balance
-            drawdown = peak - balance
-            if drawdown > max_dd:
-                max_dd = drawdown
-        return max_dd
+        return self._max_drawdown
     
     @property
     def peak_bankroll(self) -> float:
-        return max(self.bankroll_history) if self.bankroll_history else self.starting_bankroll
+        return self._peak
     
     @property
     def max_bet(self) -> float:
-        return max(h['bet'] for h in self.history) if self.history else 0
+        return self._max_bet
     
     @property
     def max_drawdown_percent(self) -> float:
@@ -73,8 +161,63 @@ class SimulationResult:
         print(f"Wins: {self.wins} | Losses: {self.losses} | Pushes: {self.pushes}")
         print(f"Total wagered: ${self.total_wagered:.2f}")
         print(f"Max bet: ${self.max_bet:.2f}")
-        print(f"Expected Value (EV): {self.ev_percent:+.2f}%")
+        if self.hands_played > 1:
+            low, high = self.ev_confidence_interval()
+            print(f"Expected Value (EV): {self.ev_percent:+.2f}% (95% CI {low:+.2f}% to {high:+.2f}%)")
+        else:
+            print(f"Expected Value (EV): {self.ev_percent:+.2f}%")
         print(f"Max Drawdown: ${self.max_drawdown:.2f} ({self.max_drawdown_percent:.1f}%)")
+        if self.profile is not None:
+            self.profile.print_report()
+    
+    @classmethod
+    def merge(cls, results: List["SimulationResult"]) -> "SimulationResult":
+        """Chain independent sessions end to end into one result"""
+        merged = cls(results[0].starting_bankroll if results else 0,
+                     streaming=any(r.streaming for r in results),
+                     history_format=results[0].history_format if results else "dicts")
+        bankroll = merged.starting_bankroll
+        for result in results:
+            offset = bankroll - result.starting_bankroll
+            if not merged.streaming:
+                if isinstance(merged.history, ColumnarHistory):
+                    merged.history.extend(result.history, len(merged.history), offset)
+                else:
+                    for entry in result.history:
+                        entry = dict(entry)
+                        entry["hand_num"] = len(merged.history) + 1
+                        entry["bankroll_after"] += offset
+                        merged.history.append(entry)
+                merged.bankroll_history.extend(b + offset for b in result.bankroll_history[1:])
+            
+            # Drawdowns may span sessions: measure this session's low against the
+            # peak carried over from the sessions before it
+            merged._max_drawdown = max(merged._max_drawdown, result._max_drawdown,
+                                       merged._peak - (result._trough + offset))
+            merged._peak = max(merged._peak, result._peak + offset)
+            merged._trough = min(merged._trough, result._trough + offset)
+            
+            # Chan et al. pairwise combination of the Welford moments
+            n_a, n_b = merged.hands_played, result.hands_played
+            if n_b:
+                delta = result._net_mean - merged._net_mean
+                bet_delta = result._bet_mean - merged._bet_mean
+                total = n_a + n_b
+                merged._net_mean += delta * n_b / total
+                merged._net_m2 += result._net_m2 + delta * delta * n_a * n_b / total
+                merged._bet_mean += bet_delta * n_b / total
+                merged._bet_m2 += result._bet_m2 + bet_delta * bet_delta * n_a * n_b / total
+                merged._bet_net_m2 += result._bet_net_m2 + bet_delta * delta * n_a * n_b / total
+            merged.hands_played += n_b
+            merged._wins += result._wins
+            merged._losses += result._losses
+            merged._pushes += result._pushes
+            merged._total_wagered += result._total_wagered
+            merged._total_net += result._total_net
+            merged._max_bet = max(merged._max_bet, result._max_bet)
+            bankroll += result.net_result
+        merged.final_bankroll = bankroll
+        return merged
     
     def export_to_csv(self, filename: str):
         """Export detailed hand history to CSV"""
@@ -93,45 +236,225 @@ class SimulationRunner:
         self.verbose = verbose
     
     def run(self, strategy, num_hands: int, starting_bankroll: float, 
-            progress_interval: int = 100) -> SimulationResult:
-        """Run a simulation session"""
+            progress_interval: int = 100, streaming: bool = False,
+            history_format: str = "dicts", exporter=None,
+            export_chunk_size: int = 100_000, target_half_width: Optional[float] = None,
+            check_interval: int = 10_000, confidence_z: float = 1.96, shoe=None,
+            profile: bool = False, checkpoint_path: Optional[str] = None,
+            checkpoint_interval: int = 1_000_000) -> SimulationResult:
+        """
+        Run a simulation session.
+        
+        With streaming=True no per-hand history is kept: statistics are accumulated
+        online in constant memory. Betting strategies bet from a SessionState via
+        next_bet(); only those with uses_history get the recorded history (when not
+        streaming) through get_bet().
+        history_format="columnar" records history in a compact ColumnarHistory that
+        decodes to the usual per-hand dicts on access.
+        
+        An exporter (see simulator.export) is fed the hands in chunks of
+        export_chunk_size while the simulation runs; closing it is left to the caller.
+        
+        With target_half_width (in EV percentage points) the session stops early, at
+        the first multiple of check_interval hands where the EV confidence interval
+        (confidence_z sigmas) is that narrow; num_hands is then the upper bound.
+        
+        A shoe can be supplied, e.g. to record the session's cards or replay recorded
+        ones (engine.replay).
+        
+        With profile=True an engine.GameProfiler times the session's phases and
+        counts shuffles, cards, decisions and history size; it is kept as
+        result.profile and reported by print_summary(). Off by default, and then
+        nothing is instrumented.
+        
+        With checkpoint_path the session state (game, shoe and RNG, strategy,
+        statistics and bankroll) is written there every checkpoint_interval hands;
+        resume() continues it from the last checkpoint. Checkpoints stay the same
+        size however long the run, so they need streaming=True: keep the hands, if
+        needed, with an exporter, which is flushed at every checkpoint.
+        """
         from engine import BlackjackGame
+        from strategies import SessionState
         
-        game = BlackjackGame(self.game_config, verbose=self.verbose)
-        result = SimulationResult(starting_bankroll)
-        bankroll = starting_bankroll
+        if checkpoint_path is not None and not streaming:
+            raise ValueError("Checkpointing needs streaming=True (use an exporter to keep the hands)")
+        
+        game = BlackjackGame(self.game_config, verbose=self.verbose, shoe=shoe)
+        strategy.bind_shoe(game.shoe)
+        session = {
+            "game": game,
+            "strategy": strategy,
+            "result": SimulationResult(starting_bankroll, streaming=streaming, history_format=history_format),
+            "state": SessionState(starting_bankroll, game.shoe),
+            "bankroll": starting_bankroll,
+            "hand_num": 0,
+            "options": {
+                "num_hands": num_hands,
+                "progress_interval": progress_interval,
+                "export_chunk_size": export_chunk_size,
+                "target_half_width": target_half_width,
+                "check_interval": check_interval,
+                "confidence_z": confidence_z,
+                "checkpoint_path": checkpoint_path,
+                "checkpoint_interval": checkpoint_interval,
+            },
+        }
         
         if not self.verbose:
             print(f"Running simulation: {num_hands} hands, starting bankroll ${starting_bankroll}\n")
+        return self._play(session, exporter, profile)
+    
+    @classmethod
+    def resume(cls, checkpoint_path: str, exporter=None, profile: bool = False) -> SimulationResult:
+        """
+        Continue a run() from its last checkpoint with the same options, writing
+        further checkpoints to the same path. The result is bit-for-bit the one the
+        uninterrupted run would have returned; this restores the module-global
+        random state as of the checkpoint. Exporters are not checkpointed: pass a
+        new one to receive the hands after the checkpoint's hand number.
         
-        for hand_num in range(1, num_hands + 1):
+        Checkpoints are pickles: only resume files this program wrote, since
+        loading one can run arbitrary code.
+        """
+        session = _read_checkpoint(checkpoint_path)
+        random.setstate(session.pop("random_state"))
+        runner = cls(session.pop("game_config"), session.pop("verbose"))
+        if not runner.verbose:
+            print(f"Resuming simulation after hand {session['hand_num']}: "
+                  f"bankroll ${session['bankroll']:.2f}\n")
+        return runner._play(session, exporter, profile)
+    
+    def _play(self, session: dict, exporter, profile: bool) -> SimulationResult:
+        from engine import GameProfiler
+        
+        game = session["game"]
+        strategy = session["strategy"]
+        result = session["result"]
+        state = session["state"]
+        bankroll = session["bankroll"]
+        options = session["options"]
+        num_hands = options["num_hands"]
+        progress_interval = options["progress_interval"]
+        target_half_width = options["target_half_width"]
+        check_interval = options["check_interval"]
+        checkpoint_path = options["checkpoint_path"]
+        checkpoint_interval = options["checkpoint_interval"]
+        
+        streaming = result.streaming
+        columnar = result.history_format == "columnar"
+        export_buffer = ColumnarHistory() if exporter is not None else None
+        history_bets = strategy.uses_history and not streaming
+        profiler = GameProfiler().attach(game, [strategy]) if profile else None
+        
+        if profiler is not None:
+            profiler.start()
+        for hand_num in range(session["hand_num"] + 1, num_hands + 1):
             min_bet = self.game_config.min_bet if self.game_config else 5
             if bankroll < min_bet:
                 print(f"\nInsufficient funds after {hand_num - 1} hands")
                 break
             
-            bet = strategy.get_bet(bankroll, result.history)
+            bet = strategy.get_bet(bankroll, result.history) if history_bets else strategy.next_bet(state)
             game_result = game.play_hand(bet, strategy)
             bankroll += game_result.net_win
+            state.update(bet, game_result.net_win, game_result.outcome, bankroll)
+            
+            if not streaming:
+                if columnar:
+                    result.history.append(hand_num, bet, game_result, bankroll)
+                else:
+                    result.history.append({
+                        "hand_num": hand_num,
+                        "bet": bet,
+                        "net_win": game_result.net_win,
+                        "outcome": game_result.outcome,
+                        "player_initial": game_result.initial_player_hand,
+                        "dealer_upcard": str(game_result.dealer_upcard),
+                        "dealer_final": str(game_result.dealer_hand),
+                        "player_final": [str(h) for h in game_result.player_hands],
+                        "actions": game_result.actions_taken,
+                        "bankroll_after": bankroll
+                    })
+            result.record(bet, game_result.net_win, bankroll)
             
-            result.history.append({
-                "hand_num": hand_num,
-                "bet": bet,
-                "net_win": game_result.net_win,
-                "outcome": game_result.outcome,
-                "player_initial": game_result.initial_player_hand,
-                "dealer_upcard": str(game_result.dealer_upcard),
-                "dealer_final": str(game_result.dealer_hand),
-                "player_final": [str(h) for h in game_result.player_hands],
-                "actions": game_result.actions_taken,
-                "bankroll_after": bankroll
-            })
-            result.bankroll_history.append(bankroll)
+            if export_buffer is not None:
+                export_buffer.append(hand_num, bet, game_result, bankroll)
+                if len(export_buffer) >= options["export_chunk_size"]:
+                    exporter.write_chunk(export_buffer)
+                    export_buffer = ColumnarHistory()
+            
+            if checkpoint_path is not None and hand_num % checkpoint_interval == 0:
+                if export_buffer:
+                    exporter.write_chunk(export_buffer)
+                    export_buffer = ColumnarHistory()
+                if profiler is not None:
+                    profiler.detach()
+                session["bankroll"] = bankroll
+                # Also the offset of the hands a resumed run exports
+                session["hand_num"] = hand_num
+                _write_checkpoint(checkpoint_path, dict(
+                    session, game_config=self.game_config, verbose=self.verbose, random_state=random.getstate()))
+                if profiler is not None:
+                    profiler.attach(game, [strategy])
             
             if not self.verbose and progress_interval > 0 and hand_num % progress_interval == 0:
                 print(f"Hand {hand_num}/{num_hands} - Bankroll: ${bankroll:.2f}")
+            
+            if target_half_width is not None and hand_num % check_interval == 0:
+                half_width = options["confidence_z"] * result.ev_standard_error
+                if 0 < half_width <= target_half_width:
+                    if not self.verbose:
+                        print(f"\nEV within ±{half_width:.4f}% after {hand_num} hands")
+                    break
         
+        if export_buffer:
+            exporter.write_chunk(export_buffer)
         result.final_bankroll = bankroll
-        result.hands_played = len(result.history)
+        if profiler is not None:
+            profiler.stop()
+            profiler.detach()
+            profiler.counts["history_bytes"] = _history_nbytes(result.history)
+            result.profile = profiler
         
         return result
+    
+    def run_until(self, strategy, target_half_width: float, starting_bankroll: float,
+                  max_hands: int = 100_000_000, check_interval: int = 100_000,
+                  confidence_z: float = 1.96, **kwargs) -> SimulationResult:
+        """
+        Simulate in batches of check_interval hands until the EV confidence interval
+        half-width is at most target_half_width percentage points (e.g. 0.02 for
+        ±0.02%), or max_hands. The interval is result.ev_confidence_interval(confidence_z).
+        Streams by default; other keyword arguments are passed on to run().
+        """
+        kwargs.setdefault("streaming", True)
+        kwargs.setdefault("progress_interval", 0)
+        return self.run(strategy, max_hands, starting_bankroll, target_half_width=target_half_width,
+                        check_interval=check_interval, confidence_z=confidence_z, **kwargs)
+
+
+def _history_nbytes(history) -> int:
+    """Memory held by a hand history (shallow per entry for dict history)"""
+    if isinstance(history, ColumnarHistory):
+        return history.nbytes()
+    return sys.getsizeof(history) + sum(sys.getsizeof(entry) for entry in history)
+
+
+def _write_checkpoint(path: str, session: dict):
+    header = _CHECKPOINT_HEADER.pack(_CHECKPOINT_MAGIC, _CHECKPOINT_VERSION)
+    body = zlib.compress(pickle.dumps(session, protocol=pickle.HIGHEST_PROTOCOL))
+    from engine.keys import atomic_write
+    
+    atomic_write(path, header + body)
+
+
+def _read_checkpoint(path: str) -> dict:
+    # Unpickles the file: checkpoints must come from a trusted source
+    with open(path, "rb") as f:
+        data = f.read()
+    magic, version = _CHECKPOINT_HEADER.unpack_from(data)
+    if magic != _CHECKPOINT_MAGIC:
+        raise ValueError(f"{path} is not a simulation checkpoint")
+    if version != _CHECKPOINT_VERSION:
+        raise ValueError(f"{path} has checkpoint format {version}, expected {_CHECKPOINT_VERSION}")
+    return pickle.loads(zlib.decompress(data[_CHECKPOINT_HEADER.size:]))
@@ -0,0 +1,133 @@
+import itertools
+import json
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+from engine.keys import RULE_FIELDS, SESSION_FIELDS, atomic_write, cache_dir, content_key, describe, rule_fields
+from .parallel import worker_seed, run_worker
+
+
+DEFAULT_CACHE_DIR = cache_dir("sweeps")
+
+# Aggregate statistics stored per cell
+_STATS = ("hands_played", "wins", "losses", "pushes", "total_wagered", "net_result",
+          "ev_percent", "ev_standard_error", "net_win_std", "max_bet", "max_drawdown", "final_bankroll")
+
+
+def expand_grid(grid: Dict[str, list], base: Optional[dict] = None) -> List[dict]:
+    """Every combination of the grid's values, each merged over the base config fields"""
+    names = list(grid)
+    return [dict(base or {}, **dict(zip(names, values)))
+            for values in itertools.product(*(grid[name] for name in names))]
+
+
+def cell_key(config, strategy, seed: int, num_hands: int, starting_bankroll: float) -> str:
+    """
+    Cache key of a sweep cell. Of the GameConfig it takes the fields that change
+    a session and the RNG kind; the RNG seed is replaced by the sweep seed.
+    """
+    from engine import rng_kind
+    
+    return content_key({
+        "config": rule_fields(config, RULE_FIELDS + SESSION_FIELDS),
+        "rng": rng_kind(config.rng),
+        "strategy": describe(strategy),
+        "seed": seed,
+        "hands": num_hands,
+        "bankroll": starting_bankroll,
+    })
+
+
+class SweepResult:
+    """One row per grid cell: the swept fields and the cell's aggregate statistics"""
+    
+    def __init__(self, fields: List[str], cells: List[dict], computed: int):
+        self.fields = fields
+        self.cells = cells
+        self.computed = computed
+    
+    def print_summary(self):
+        print(f"\n{'='*50}")
+        print(f"Sweep Complete: {len(self.cells)} cells ({self.computed} computed, "
+              f"{len(self.cells) - self.computed} cached)")
+        for cell in self.cells:
+            fields = ", ".join(f"{name}={cell['config'][name]}" for name in self.fields)
+            stats = cell["stats"]
+            print(f"{fields}: EV {stats['ev_percent']:+.3f}% (std ${stats['net_win_std']:.2f}/hand, "
+                  f"{stats['hands_played']} hands)")
+
+
+class SweepRunner:
+    """
+    Runs a strategy over every cell of a GameConfig grid on a process pool.
+    
+    Each cell is a streaming session seeded from (seed, cell config), so a cell's
+    result does not depend on the rest of the grid. Its statistics are cached on
+    disk under a hash of (config, strategy, seed, hands, bankroll): re-running a
+    sweep only computes cells that are new or changed. Without a seed nothing is
+    cached.
+    """
+    
+    def __init__(self, workers: Optional[int] = None, seed: Optional[int] = None,
+                 cache_dir: Optional[str] = DEFAULT_CACHE_DIR):
+        self.workers = workers or os.cpu_count() or 1
+        self.seed = seed
+        self.cache_dir = cache_dir
+    
+    def _load(self, key: str) -> Optional[dict]:
+        if self.cache_dir is None or self.seed is None:
+            return None
+        path = os.path.join(self.cache_dir, f"{key}.json")
+        if not os.path.exists(path):
+            return None
+        with open(path) as f:
+            return json.load(f)
+    
+    def _store(self, key: str, cell: dict):
+        if self.cache_dir is None or self.seed is None:
+            return
+        atomic_write(os.path.join(self.cache_dir, f"{key}.json"), json.dumps(cell, indent=2, sort_keys=True))
+    
+    def run(self, strategy, grid: Dict[str, list], num_hands: int, starting_bankroll: float,
+            base_config: Optional[dict] = None) -> SweepResult:
+        """
+        Evaluate strategy on every combination of grid values (GameConfig field ->
+        list of values), with other fields taken from base_config or the defaults
+        """
+        from engine import GameConfig, rng_kind
+        
+        defaults = GameConfig().to_dict()
+        for name in list(grid) + list(base_config or {}):
+            if name not in defaults:
+                raise ValueError(f"Unknown GameConfig field: {name}")
+        
+        seed = self.seed if self.seed is not None else random.SystemRandom().getrandbits(64)
+        cells = []
+        pending = []
+        for fields in expand_grid(grid, base_config):
+            game_config = GameConfig(**fields)
+            key = cell_key(game_config, strategy, seed, num_hands, starting_bankroll)
+            # Cells store the RNG by kind: each is reseeded from its cell seed anyway
+            config = dict(game_config.to_dict(), rng=rng_kind(game_config.rng))
+            cell = self._load(key)
+            if cell is None:
+                pending.append((len(cells), key))
+            cells.append(cell or {"config": config, "seed": worker_seed(seed, int(key[:16], 16))})
+        
+        print(f"Running sweep: {len(cells)} cells ({len(pending)} to compute) of {num_hands} hands "
+              f"on {self.workers} workers\n")
+        
+        if pending:
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(pending))) as pool:
+                futures = [
+                    pool.submit(run_worker, GameConfig(**cells[i]["config"]), strategy, num_hands,
+                                starting_bankroll, cells[i]["seed"], True, "dicts")
+                    for i, _ in pending
+                ]
+                for (i, key), future in zip(pending, futures):
+                    result = future.result()
+                    cells[i]["stats"] = {name: getattr(result, name) for name in _STATS}
+                    self._store(key, cells[i])
+        
+        return SweepResult(list(grid), cells, len(pending))
@@ -0,0 +1,106 @@
+from typing import Dict, List
+from .runner import SimulationResult
+
+
+class TableResult:
+    """Per-seat streaming results of a table session plus shoe usage"""
+    
+    def __init__(self, names: List[str], starting_bankroll: float):
+        self.names = names
+        self.results: Dict[str, SimulationResult] = {
+            name: SimulationResult(starting_bankroll, streaming=True) for name in names
+        }
+        self.rounds_played = 0
+        self.shuffles = 0
+        self.cards_dealt = 0
+    
+    @property
+    def rounds_per_shoe(self) -> float:
+        return self.rounds_played / self.shuffles if self.shuffles else float(self.rounds_played)
+    
+    def print_summary(self):
+        print(f"\n{'='*50}")
+        print(f"Table Session Complete ({len(self.names)} seats, {self.rounds_played} rounds)")
+        print(f"Shuffles: {self.shuffles} | Rounds per shoe: {self.rounds_per_shoe:.1f} | "
+              f"Cards per round: {self.cards_dealt / max(self.rounds_played, 1):.2f}")
+        for seat, name in enumerate(self.names, 1):
+            result = self.results[name]
+            print(f"Seat {seat} {name}: EV {result.ev_percent:+.2f}% | Net ${result.net_result:+.2f} | "
+                  f"Hands {result.hands_played} | Max Drawdown ${result.max_drawdown:.2f}")
+
+
+class TableRunner:
+    """
+    Seats up to engine.MAX_SEATS strategies at one table: every round is dealt
+    from one shared shoe in casino order and the dealer draws out once for all
+    seats, so shoe consumption, reshuffles and the count behave as at a full table.
+    Each seat needs its own strategy instance and keeps its own bankroll; a seat
+    that can no longer cover the minimum bet leaves the table.
+    """
+    
+    def __init__(self, game_config=None, verbose: bool = False):
+        self.game_config = game_config
+        self.verbose = verbose
+    
+    def run(self, strategies: Dict[str, object], num_rounds: int, starting_bankroll: float,
+            progress_interval: int = 100, shoe=None) -> TableResult:
+        """
+        Play num_rounds rounds with the seats in order (the first plays first).
+        Results are streaming; betting strategies bet from their SessionState.
+        A shoe can be supplied to record or replay the cards (engine.replay).
+        """
+        from engine import BlackjackGame, MAX_SEATS
+        from strategies import SessionState
+        
+        names = list(strategies)
+        if not 1 <= len(names) <= MAX_SEATS:
+            raise ValueError(f"TableRunner seats 1 to {MAX_SEATS} strategies")
+        players = [strategies[name] for name in names]
+        if len(set(map(id, players))) != len(players):
+            raise ValueError("Every seat needs its own strategy instance")
+        game = BlackjackGame(self.game_config, verbose=self.verbose, shoe=shoe)
+        shoe = game.shoe
+        config = game.config
+        for strategy in players:
+            strategy.bind_shoe(shoe)
+        
+        table = TableResult(names, starting_bankroll)
+        results = [table.results[name] for name in names]
+        bankrolls = [starting_bankroll] * len(players)
+        states = [SessionState(starting_bankroll, shoe) for _ in players]
+        
+        print(f"Running table: {len(players)} seats, {num_rounds} rounds, "
+              f"starting bankroll ${starting_bankroll}\n")
+        
+        for round_num in range(1, num_rounds + 1):
+            seats = [i for i in range(len(players)) if bankrolls[i] >= config.min_bet]
+            if not seats:
+                print(f"\nAll seats out of funds after {round_num - 1} rounds")
+                break
+            
+            if config.shuffle_every_hand or shoe.needs_shuffle():
+                shoe.shuffle()
+                table.shuffles += 1
+            start = shoe.position
+            
+            bets = [players[i].next_bet(states[i]) for i in seats]
+            game_results = game.play_round(bets, [players[i] for i in seats], shuffle=False)
+            if shoe.position >= start:
+                table.cards_dealt += shoe.position - start
+            else:
+                # The shoe ran out mid-round and was reshuffled
+                table.cards_dealt += len(shoe.codes) - start + shoe.position
+                table.shuffles += 1
+            table.rounds_played += 1
+            
+            for i, bet, game_result in zip(seats, bets, game_results):
+                bankrolls[i] += game_result.net_win
+                states[i].update(bet, game_result.net_win, game_result.outcome, bankrolls[i])
+                results[i].record(bet, game_result.net_win, bankrolls[i])
+            
+            if progress_interval > 0 and round_num % progress_interval == 0:
+                print(f"Round {round_num}/{num_rounds}")
+        
+        for result, bankroll in zip(results, bankrolls):
+            result.final_bankroll = bankroll
+        return table
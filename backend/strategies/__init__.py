@@ -1,3 +1,3 @@
-from .base_strategy import Action, BettingStrategy, PlayingStrategy, Strategy
+from .base_strategy import Action, BettingStrategy, PlayingStrategy, SessionState, Strategy
 
-__all__ = ['Action', 'BettingStrategy', 'PlayingStrategy', 'Strategy']
+__all__ = ['Action', 'BettingStrategy', 'PlayingStrategy', 'SessionState', 'Strategy']
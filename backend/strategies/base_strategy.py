@@ -11,24 +11,110 @@ class Action(Enum):
     SURRENDER = "surrender"
 
 
+class SessionState:
+    """
+    Fixed-size state of a betting session, updated once per hand by the runner and
+    passed to BettingStrategy.next_bet in place of the hand history
+    """
+    __slots__ = ("bankroll", "peak_bankroll", "hands_played", "last_bet", "last_net_win",
+                 "last_outcome", "streak", "shoe")
+    
+    def __init__(self, bankroll: float, shoe=None):
+        self.bankroll = bankroll
+        self.peak_bankroll = bankroll
+        self.hands_played = 0
+        self.last_bet = 0.0
+        self.last_net_win = 0.0
+        self.last_outcome = ""
+        self.streak = 0  # consecutive wins (> 0) or losses (< 0); pushes leave it unchanged
+        self.shoe = shoe
+    
+    def update(self, bet: float, net_win: float, outcome: str, bankroll: float):
+        self.hands_played += 1
+        self.last_bet = bet
+        self.last_net_win = net_win
+        self.last_outcome = outcome
+        self.bankroll = bankroll
+        if bankroll > self.peak_bankroll:
+            self.peak_bankroll = bankroll
+        if net_win > 0:
+            self.streak = self.streak + 1 if self.streak > 0 else 1
+        elif net_win < 0:
+            self.streak = self.streak - 1 if self.streak < 0 else -1
+    
+    @property
+    def running_count(self) -> float:
+        """Running count of the shoe's first count system (0 without one)"""
+        return self.shoe.running_count() if self.shoe is not None and self.shoe.counters else 0
+    
+    @property
+    def true_count(self) -> float:
+        return self.shoe.true_count() if self.shoe is not None and self.shoe.counters else 0
+    
+    def last_hand(self) -> List[dict]:
+        """The last hand as a one-entry history, for strategies written against get_bet"""
+        if not self.hands_played:
+            return []
+        return [{
+            "hand_num": self.hands_played,
+            "bet": self.last_bet,
+            "net_win": self.last_net_win,
+            "outcome": self.last_outcome,
+            "bankroll_after": self.bankroll
+        }]
+
+
 class BettingStrategy(ABC):
+    # Strategies that bet from the full hand history keep this True; those that
+    # implement next_bet from SessionState alone set it False so runners can skip
+    # recording history for them
+    uses_history = True
+    # Strategies that implement get_bets set this True; FastSessionSimulator checks
+    # it to choose between get_bets and next_bet per session
+    vectorized = False
+    
     def __init__(self, config: dict):
         self.config = config
+        self.shoe = None
     
     @abstractmethod
     def get_bet(self, bankroll: float, history: List[dict]) -> float:
         """Determine bet amount based on bankroll and hand history"""
         pass
     
+    def next_bet(self, state: SessionState) -> float:
+        """
+        Determine bet amount from the session state. The default shows get_bet only
+        the last hand.
+        """
+        return self.get_bet(state.bankroll, state.last_hand())
+    
+    def get_bets(self, bankrolls, last_net_wins, rng):
+        """
+        Vectorized get_bet for many independent sessions at once (numpy arrays, one
+        entry per session; last_net_wins is None on the first hand). Optional: strategies
+        that implement it set vectorized = True for simulator.outcomes.FastSessionSimulator.
+        """
+        raise NotImplementedError(f"{type(self).__name__} has no vectorized get_bets")
+    
     @abstractmethod
     def reset(self):
         """Reset strategy state for new session"""
         pass
+    
+    def bind_shoe(self, shoe):
+        """Give the strategy read access to the game's shoe (counts, decks remaining)"""
+        self.shoe = shoe
+    
+    def reseed(self, seed: int):
+        """Reseed a strategy's own RNG (a multi-process runner's per-worker seed)"""
+        pass
 
 
 class PlayingStrategy(ABC):
     def __init__(self, config: dict):
         self.config = config
+        self.shoe = None
     
     @abstractmethod
     def get_action(self, player_hand, dealer_upcard, game_state: dict) -> Action:
@@ -42,10 +128,27 @@ class PlayingStrategy(ABC):
         """
         pass
     
+    def take_insurance(self, player_hand, dealer_upcard, game_state: dict) -> bool:
+        """
+        Whether to take insurance against a dealer Ace (declined by default)
+        
+        game_state includes:
+        - player_blackjack: bool
+        """
+        return False
+    
     @abstractmethod
     def reset(self):
         """Reset strategy state for new session"""
         pass
+    
+    def bind_shoe(self, shoe):
+        """Give the strategy read access to the game's shoe (counts, decks remaining)"""
+        self.shoe = shoe
+    
+    def reseed(self, seed: int):
+        """Reseed a strategy's own RNG (a multi-process runner's per-worker seed)"""
+        pass
 
 
 class Strategy:
@@ -54,12 +157,31 @@ class Strategy:
         self.betting = betting
         self.playing = playing
     
+    @property
+    def uses_history(self) -> bool:
+        return self.betting.uses_history
+    
     def get_bet(self, bankroll: float, history: List[dict]) -> float:
         return self.betting.get_bet(bankroll, history)
     
+    def next_bet(self, state: SessionState) -> float:
+        return self.betting.next_bet(state)
+    
     def get_action(self, player_hand, dealer_upcard, game_state: dict) -> Action:
         return self.playing.get_action(player_hand, dealer_upcard, game_state)
     
+    def take_insurance(self, player_hand, dealer_upcard, game_state: dict) -> bool:
+        return self.playing.take_insurance(player_hand, dealer_upcard, game_state)
+    
     def reset(self):
         self.betting.reset()
         self.playing.reset()
+    
+    def bind_shoe(self, shoe):
+        self.betting.bind_shoe(shoe)
+        self.playing.bind_shoe(shoe)
+    
+    def reseed(self, seed: int):
+        # Distinct seeds keep the two halves' streams apart
+        self.betting.reseed(seed)
+        self.playing.reseed(seed + 1)
@@ -0,0 +1,34 @@
+from ..base_strategy import BettingStrategy, SessionState
+from typing import List
+
+
+class CountBetStrategy(BettingStrategy):
+    """Spread bets with the true count of the shoe (needs a count system on the shoe)"""
+    uses_history = False
+    
+    def __init__(self, config: dict):
+        super().__init__(config)
+        self.base_bet = config.get("base_bet", 10)
+        self.max_bet = config.get("max_bet", 500)
+        self.system = config.get("system")  # None = first count system attached to the shoe
+        # (minimum true count, bet in base units), checked from the highest count down
+        self.ramp = sorted(config.get("ramp", [(2, 2), (3, 4), (4, 6), (5, 8)]), reverse=True)
+    
+    def get_bet(self, bankroll: float, history: List[dict]) -> float:
+        return self._bet(bankroll)
+    
+    def next_bet(self, state: SessionState) -> float:
+        return self._bet(state.bankroll)
+    
+    def _bet(self, bankroll: float) -> float:
+        units = 1
+        if self.shoe is not None:
+            true_count = self.shoe.true_count(self.system)
+            for min_count, ramp_units in self.ramp:
+                if true_count >= min_count:
+                    units = ramp_units
+                    break
+        return min(self.base_bet * units, self.max_bet, bankroll)
+    
+    def reset(self):
+        pass
@@ -1,9 +1,11 @@
-from ..base_strategy import BettingStrategy
+from ..base_strategy import BettingStrategy, SessionState
 from typing import List
 
 
 class FlatBetStrategy(BettingStrategy):
     """Fixed bet amount every hand"""
+    uses_history = False
+    vectorized = True
     
     def __init__(self, config: dict):
         super().__init__(config)
@@ -12,5 +14,11 @@ class FlatBetStrategy(BettingStrategy):
     def get_bet(self, bankroll: float, history: List[dict]) -> float:
         return min(self.bet_amount, bankroll)
     
+    def next_bet(self, state: SessionState) -> float:
+        return min(self.bet_amount, state.bankroll)
+    
+    def get_bets(self, bankrolls, last_net_wins, rng):
+        return bankrolls.clip(None, self.bet_amount)
+    
     def reset(self):
         pass
@@ -1,15 +1,18 @@
-from ..base_strategy import BettingStrategy
+from ..base_strategy import BettingStrategy, SessionState
 from typing import List
 
 
 class MartingaleStrategy(BettingStrategy):
     """Double bet after each loss, reset to base bet after win"""
+    uses_history = False
+    vectorized = True
     
     def __init__(self, config: dict):
         super().__init__(config)
         self.base_bet = config.get("base_bet", 10)
         self.max_bet = config.get("max_bet", 500)
         self.current_bet = self.base_bet
+        self._current_bets = None  # per-session bets of get_bets
     
     def get_bet(self, bankroll: float, history: List[dict]) -> float:
         # First hand or after a win
@@ -22,5 +25,22 @@ class MartingaleStrategy(BettingStrategy):
         # Don't bet more than bankroll
         return min(self.current_bet, bankroll)
     
+    def next_bet(self, state: SessionState) -> float:
+        if not state.hands_played or state.last_net_win >= 0:
+            self.current_bet = self.base_bet
+        else:
+            self.current_bet = min(self.current_bet * 2, self.max_bet)
+        return min(self.current_bet, state.bankroll)
+    
+    def get_bets(self, bankrolls, last_net_wins, rng):
+        import numpy as np
+        if last_net_wins is None or self._current_bets is None:
+            self._current_bets = np.full(len(bankrolls), float(self.base_bet))
+        if last_net_wins is not None:
+            self._current_bets = np.where(last_net_wins >= 0, self.base_bet,
+                                          np.minimum(self._current_bets * 2, self.max_bet))
+        return np.minimum(self._current_bets, bankrolls)
+    
     def reset(self):
         self.current_bet = self.base_bet
+        self._current_bets = None
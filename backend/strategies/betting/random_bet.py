@@ -1,21 +1,48 @@
-import random
-from ..base_strategy import BettingStrategy
+from engine.rng import make_rng, rng_kind
+from ..base_strategy import BettingStrategy, SessionState
 from typing import List
 
 
 class RandomBetStrategy(BettingStrategy):
-    """Randomly selects bet amount within configured range"""
+    """
+    Randomly selects bet amount within configured range. Draws from the game's RNG
+    once bound to a shoe, unless config gives its own "rng" kind and/or "seed".
+    """
+    uses_history = False
+    vectorized = True
     
     def __init__(self, config: dict):
         super().__init__(config)
         self.min_bet = config.get("min_bet", 5)
         self.max_bet = config.get("max_bet", 100)
+        self.rng = make_rng(config.get("rng"), config.get("seed"))
+    
+    def bind_shoe(self, shoe):
+        super().bind_shoe(shoe)
+        if "rng" not in self.config and "seed" not in self.config:
+            self.rng = shoe.rng
+    
+    def reseed(self, seed: int):
+        if "rng" in self.config or "seed" in self.config:
+            self.rng = make_rng(rng_kind(self.config.get("rng")), seed)
     
     def get_bet(self, bankroll: float, history: List[dict]) -> float:
+        return self._bet(bankroll)
+    
+    def next_bet(self, state: SessionState) -> float:
+        return self._bet(state.bankroll)
+    
+    def _bet(self, bankroll: float) -> float:
         max_allowed = min(self.max_bet, bankroll)
         if max_allowed < self.min_bet:
             return bankroll
-        return random.uniform(self.min_bet, max_allowed)
+        return self.rng.uniform(self.min_bet, max_allowed)
+    
+    def get_bets(self, bankrolls, last_net_wins, rng):
+        import numpy as np
+        max_allowed = np.minimum(self.max_bet, bankrolls)
+        bets = rng.uniform(np.minimum(self.min_bet, max_allowed), max_allowed)
+        return np.where(max_allowed < self.min_bet, bankrolls, bets)
     
     def reset(self):
         pass
@@ -0,0 +1,145 @@
+from typing import Dict, Optional, Tuple
+from engine.tables import (
+    ACTION_DOUBLE, ACTION_HIT, ACTION_NAMES, ACTION_SPLIT, ACTION_STAND, ACTION_SURRENDER,
+    FLAG_DOUBLE, FLAG_SPLIT, FLAG_SURRENDER, NUM_FLAGS, NUM_UPCARDS, NUM_ROWS,
+    PAIR_ROW_OFFSET, SOFT_ROW_OFFSET,
+)
+from ..base_strategy import PlayingStrategy, Action
+from .smart import SmartStrategy
+from .table import TableStrategy
+
+
+_ACTIONS = tuple(Action(name) for name in ACTION_NAMES)
+
+
+def pair(value: int) -> int:
+    """Decision table row of a splittable pair of card value"""
+    return PAIR_ROW_OFFSET + value
+
+
+# Hi-Lo index plays, keyed by (table row, dealer upcard value): play the first action
+# at or above the true count index and the second below it. Rows are hard totals
+# unless built with pair().
+ILLUSTRIOUS_18: Dict[Tuple[int, int], Tuple[float, int, int]] = {
+    (16, 10): (0, ACTION_STAND, ACTION_HIT),
+    (15, 10): (4, ACTION_STAND, ACTION_HIT),
+    (pair(10), 5): (5, ACTION_SPLIT, ACTION_STAND),
+    (pair(10), 6): (4, ACTION_SPLIT, ACTION_STAND),
+    (10, 10): (4, ACTION_DOUBLE, ACTION_HIT),
+    (12, 3): (2, ACTION_STAND, ACTION_HIT),
+    (12, 2): (3, ACTION_STAND, ACTION_HIT),
+    (11, 11): (1, ACTION_DOUBLE, ACTION_HIT),
+    (9, 2): (1, ACTION_DOUBLE, ACTION_HIT),
+    (10, 11): (4, ACTION_DOUBLE, ACTION_HIT),
+    (9, 7): (3, ACTION_DOUBLE, ACTION_HIT),
+    (16, 9): (5, ACTION_STAND, ACTION_HIT),
+    (13, 2): (-1, ACTION_STAND, ACTION_HIT),
+    (12, 4): (0, ACTION_STAND, ACTION_HIT),
+    (12, 5): (-2, ACTION_STAND, ACTION_HIT),
+    (12, 6): (-1, ACTION_STAND, ACTION_HIT),
+    (13, 3): (-2, ACTION_STAND, ACTION_HIT),
+}
+
+# Surrender at or above the index; these hands are played on below it
+FAB_4: Dict[Tuple[int, int], float] = {
+    (14, 10): 3,
+    (15, 10): 0,
+    (15, 9): 2,
+    (15, 11): 1,
+}
+
+INSURANCE_INDEX = 3
+
+_SURRENDER = 0
+_PLAY = 1
+
+
+class DeviationStrategy(PlayingStrategy):
+    """
+    Count-aware play: a basic-strategy decision table plus true count index plays.
+    
+    Deviations live in a tuple indexed like the table without its flag bits, so a
+    decision without a deviation costs one extra tuple index; the true count is only
+    read for hands that have one. Surrender is decided first from the surrender
+    indexes, then the hand is played with the play indexes.
+    
+    config:
+    - base: playing strategy compiled into the basic table (default SmartStrategy)
+    - system: count system to read from the shoe (default: the first attached)
+    - deviations / surrenders: index tables (default ILLUSTRIOUS_18 / FAB_4)
+    - insurance_index: take insurance at or above this true count (None to never insure)
+    - cache_dir: cache the compiled base table there (default: compile in memory)
+    """
+    
+    def __init__(self, config: dict):
+        super().__init__(config)
+        base = config.get("base") or SmartStrategy({})
+        self.table = TableStrategy.compile(base, cache_dir=config.get("cache_dir")).table
+        self.system = config.get("system")
+        self.insurance_index = config.get("insurance_index", INSURANCE_INDEX)
+        
+        slots = [None] * (NUM_ROWS * NUM_UPCARDS)
+        for (row, upcard), index in config.get("surrenders", FAB_4).items():
+            slots[row * NUM_UPCARDS + upcard - 2] = [(_SURRENDER, index, ACTION_SURRENDER, None)]
+        for (row, upcard), (index, above, below) in config.get("deviations", ILLUSTRIOUS_18).items():
+            slot = row * NUM_UPCARDS + upcard - 2
+            slots[slot] = (slots[slot] or []) + [(_PLAY, index, above, below)]
+        self._slots = tuple(tuple(entries) if entries else None for entries in slots)
+    
+    def _true_count(self) -> Optional[float]:
+        if self.shoe is None or not self.shoe.counters:
+            return None
+        return self.shoe.true_count(self.system)
+    
+    def get_action(self, player_hand, dealer_upcard, game_state: dict) -> Action:
+        flags = 0
+        if game_state.get("can_double", False):
+            flags = FLAG_DOUBLE
+        if game_state.get("can_surrender", False):
+            flags |= FLAG_SURRENDER
+        if game_state.get("can_split", False):
+            flags |= FLAG_SPLIT
+            row = PAIR_ROW_OFFSET + player_hand.cards[0].value
+        elif player_hand.is_soft():
+            row = SOFT_ROW_OFFSET + player_hand.value()
+        else:
+            row = player_hand.value()
+        slot = row * NUM_UPCARDS + dealer_upcard.value - 2
+        
+        entries = self._slots[slot]
+        if entries is None:
+            return _ACTIONS[self.table[slot * NUM_FLAGS + flags]]
+        true_count = self._true_count()
+        if true_count is None:
+            return _ACTIONS[self.table[slot * NUM_FLAGS + flags]]
+        
+        # Surrender indexes replace the table's surrender decision
+        surrender_decided = False
+        for kind, index, above, below in entries:
+            if kind == _SURRENDER and flags & FLAG_SURRENDER:
+                if true_count >= index:
+                    return _ACTIONS[ACTION_SURRENDER]
+                surrender_decided = True
+        if surrender_decided:
+            flags &= ~FLAG_SURRENDER
+        
+        basic = self.table[slot * NUM_FLAGS + flags]
+        if basic == ACTION_SURRENDER:
+            return _ACTIONS[basic]
+        for kind, index, above, below in entries:
+            if kind == _PLAY:
+                action = above if true_count >= index else below
+                if action == ACTION_DOUBLE and not flags & FLAG_DOUBLE:
+                    # Can't double: fall back to the table's play without doubling
+                    action = self.table[slot * NUM_FLAGS + (flags & ~FLAG_DOUBLE)]
+                return _ACTIONS[action]
+        return _ACTIONS[basic]
+    
+    def take_insurance(self, player_hand, dealer_upcard, game_state: dict) -> bool:
+        if self.insurance_index is None:
+            return False
+        true_count = self._true_count()
+        return true_count is not None and true_count >= self.insurance_index
+    
+    def reset(self):
+        pass
@@ -25,5 +25,10 @@ class ManualStrategy(PlayingStrategy):
                 return Action(action_str)
             print(f"Invalid action. Choose from {available_actions}")
     
+    def take_insurance(self, player_hand, dealer_upcard, game_state: dict) -> bool:
+        print(f"\nYour hand: {player_hand}")
+        answer = input("Dealer shows an Ace. Take insurance? [y/N]: ").lower().strip()
+        return answer in ("y", "yes")
+    
     def reset(self):
         pass
@@ -1,9 +1,25 @@
-import random
+from engine.rng import make_rng, rng_kind
 from ..base_strategy import PlayingStrategy, Action
 
 
 class RandomStrategy(PlayingStrategy):
-    """Randomly selects from available actions"""
+    """
+    Randomly selects from available actions. Draws from the game's RNG once bound
+    to a shoe, unless config gives its own "rng" kind and/or "seed".
+    """
+    
+    def __init__(self, config: dict):
+        super().__init__(config)
+        self.rng = make_rng(config.get("rng"), config.get("seed"))
+    
+    def bind_shoe(self, shoe):
+        super().bind_shoe(shoe)
+        if "rng" not in self.config and "seed" not in self.config:
+            self.rng = shoe.rng
+    
+    def reseed(self, seed: int):
+        if "rng" in self.config or "seed" in self.config:
+            self.rng = make_rng(rng_kind(self.config.get("rng")), seed)
     
     def get_action(self, player_hand, dealer_upcard, game_state: dict) -> Action:
         available_actions = [Action.HIT, Action.STAND]
@@ -15,7 +31,7 @@ class RandomStrategy(PlayingStrategy):
         if game_state.get("can_surrender", False):
             available_actions.append(Action.SURRENDER)
         
-        return random.choice(available_actions)
+        return self.rng.choice(available_actions)
     
     def reset(self):
         pass
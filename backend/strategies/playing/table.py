@@ -0,0 +1,67 @@
+import os
+from typing import Optional
+from engine.keys import atomic_write, cache_dir, content_key, describe
+from engine.tables import (
+    ACTION_NAMES, FLAG_DOUBLE, FLAG_SPLIT, FLAG_SURRENDER, NUM_FLAGS, NUM_UPCARDS,
+    PAIR_ROW_OFFSET, SOFT_ROW_OFFSET, TABLE_SIZE, build_table,
+)
+from ..base_strategy import PlayingStrategy, Action
+
+
+DEFAULT_CACHE_DIR = cache_dir("tables")
+
+_ACTIONS = tuple(Action(name) for name in ACTION_NAMES)
+
+
+def table_cache_key(strategy) -> str:
+    """
+    Content key of a strategy's compiled table: its class, source and config
+    (build_table probes the strategy alone, so the rule set does not enter)
+    """
+    return content_key({"strategy": describe(strategy)})
+
+
+class TableStrategy(PlayingStrategy):
+    """Plays from a precompiled decision table: one index per decision"""
+    
+    def __init__(self, config: dict):
+        super().__init__(config)
+        self.table = bytes(config["table"])
+        if len(self.table) != TABLE_SIZE:
+            raise ValueError(f"Decision table must have {TABLE_SIZE} entries, got {len(self.table)}")
+    
+    @classmethod
+    def compile(cls, strategy, cache_dir: Optional[str] = None) -> "TableStrategy":
+        """
+        Compile a deterministic playing strategy into a TableStrategy. With a
+        cache_dir (e.g. DEFAULT_CACHE_DIR) tables are cached there per strategy.
+        """
+        path = None
+        if cache_dir is not None:
+            path = os.path.join(cache_dir, table_cache_key(strategy) + ".bin")
+            if os.path.exists(path):
+                with open(path, "rb") as f:
+                    return cls({"table": f.read()})
+        
+        table = build_table(strategy)
+        if path is not None:
+            atomic_write(path, table)
+        return cls({"table": table})
+    
+    def get_action(self, player_hand, dealer_upcard, game_state: dict) -> Action:
+        flags = 0
+        if game_state.get("can_double", False):
+            flags = FLAG_DOUBLE
+        if game_state.get("can_surrender", False):
+            flags |= FLAG_SURRENDER
+        if game_state.get("can_split", False):
+            flags |= FLAG_SPLIT
+            row = PAIR_ROW_OFFSET + player_hand.cards[0].value
+        elif player_hand.is_soft():
+            row = SOFT_ROW_OFFSET + player_hand.value()
+        else:
+            row = player_hand.value()
+        return _ACTIONS[self.table[(row * NUM_UPCARDS + dealer_upcard.value - 2) * NUM_FLAGS + flags]]
+    
+    def reset(self):
+        pass
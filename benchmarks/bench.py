@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Engine throughput and memory benchmarks.
+
+    python benchmarks/bench.py                      # run everything
+    python benchmarks/bench.py --quick -k play_hand # fewer iterations, filtered
+    python benchmarks/bench.py --save base.json     # record a baseline
+    python benchmarks/bench.py --compare base.json  # exit 1 on regressions
+
+Throughput is the best of --repeat timed runs. Memory is measured in a separate
+run under tracemalloc: bytes still allocated per operation afterwards (e.g. the
+history a runner keeps) and the peak of the run.
+"""
+
+import argparse
+import contextlib
+import gc
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "backend"))
+
+from engine import GameConfig, BlackjackGame, Shoe, Hand, make_rng
+from strategies import Strategy
+from strategies.betting.flat_bet import FlatBetStrategy
+from strategies.playing.smart import SmartStrategy
+from simulator import SimulationRunner
+
+
+PROFILES = {
+    "6d_s17": dict(num_decks=6, dealer_hits_soft_17=False, surrender_allowed=True, double_after_split=True),
+    "1d_h17": dict(num_decks=1, dealer_hits_soft_17=True, surrender_allowed=False, double_on="10-11"),
+    "8d_csm": dict(num_decks=8, shuffle_every_hand=True),
+    "8d_csm_pcg64": dict(num_decks=8, shuffle_every_hand=True, rng="pcg64", seed=0),
+    "6d_hilo": dict(num_decks=6, count_systems=["hi-lo"]),
+}
+
+
+def _strategy():
+    return Strategy(FlatBetStrategy({"bet_amount": 10}), SmartStrategy({}))
+
+
+# Each benchmark is setup(n, profile) -> (operation, unit): calling operation() performs
+# n units of work and returns anything that should stay alive for the memory measurement.
+
+def bench_play_hand(n, profile):
+    game = BlackjackGame(GameConfig(**PROFILES[profile]), verbose=False)
+    strategy = _strategy()
+    
+    def run():
+        for _ in range(n):
+            game.play_hand(10, strategy)
+    return run, "hands"
+
+
+def bench_shoe_deal(n, profile):
+    config = GameConfig(**PROFILES[profile])
+    shoe = Shoe(config.num_decks, config.penetration, config.count_systems)
+    
+    def run():
+        for _ in range(n):
+            if shoe.needs_shuffle():
+                shoe.shuffle()
+            shoe.deal()
+    return run, "cards"
+
+
+def bench_shoe_shuffle(n, profile):
+    config = GameConfig(**PROFILES[profile])
+    shoe = Shoe(config.num_decks, config.penetration, config.count_systems, make_rng(config.rng, config.seed))
+    
+    def run():
+        for _ in range(n):
+            shoe.shuffle()
+    return run, "shuffles"
+
+
+def bench_hand_value(n, profile):
+    shoe = Shoe(6)
+    hands = []
+    for _ in range(1000):
+        hand = Hand()
+        for _ in range(random.randint(2, 4)):
+            hand.add_card(shoe.deal())
+        hands.append(hand)
+    rounds = max(n // len(hands), 1)
+    
+    def run():
+        for _ in range(rounds):
+            for hand in hands:
+                hand.value()
+    return run, "calls"
+
+
+def bench_smart_get_action(n, profile):
+    shoe = Shoe(6)
+    playing = SmartStrategy({})
+    decisions = []
+    for _ in range(1000):
+        hand = Hand()
+        hand.add_card(shoe.deal())
+        hand.add_card(shoe.deal())
+        state = {"can_double": True, "can_split": hand.is_pair(), "can_surrender": True}
+        decisions.append((hand, shoe.deal(), state))
+    rounds = max(n // len(decisions), 1)
+    
+    def run():
+        for _ in range(rounds):
+            for hand, upcard, state in decisions:
+                playing.get_action(hand, upcard, state)
+    return run, "decisions"
+
+
+def _bench_runner(history_format, streaming):
+    def setup(n, profile):
+        runner = SimulationRunner(GameConfig(**PROFILES[profile]), verbose=False)
+        
+        def run():
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                return runner.run(_strategy(), n, 1e12, progress_interval=0,
+                                  streaming=streaming, history_format=history_format)
+        return run, "hands"
+    return setup
+
+
+# name -> (setup, profiles, operations per run at full size)
+BENCHMARKS = {
+    "play_hand": (bench_play_hand, list(PROFILES), 50_000),
+    "shoe_deal": (bench_shoe_deal, ["6d_s17", "6d_hilo"], 500_000),
+    "shoe_shuffle": (bench_shoe_shuffle, ["6d_s17", "1d_h17", "8d_csm", "8d_csm_pcg64"], 5_000),
+    "hand_value": (bench_hand_value, ["6d_s17"], 1_000_000),
+    "smart_get_action": (bench_smart_get_action, ["6d_s17"], 500_000),
+    "runner_dicts": (_bench_runner("dicts", False), ["6d_s17", "8d_csm"], 50_000),
+    "runner_columnar": (_bench_runner("columnar", False), ["6d_s17"], 50_000),
+    "runner_streaming": (_bench_runner("dicts", True), ["6d_s17", "8d_csm"], 50_000),
+}
+
+
+def measure(setup, n: int, profile: str, repeat: int) -> dict:
+    best = 0.0
+    for _ in range(repeat):
+        random.seed(0)
+        run, unit = setup(n, profile)
+        gc.collect()
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        best = max(best, n / elapsed)
+    
+    random.seed(0)
+    run, unit = setup(n, profile)
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    kept = run()
+    after, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return {
+        "ops_per_sec": round(best, 1),
+        "unit": unit,
+        "bytes_per_op": round((after - before) / n, 2),
+        "peak_bytes": peak - before,
+    }
+
+
+def run_benchmarks(quick: bool = False, repeat: int = 3, selected=None) -> dict:
+    results = {}
+    for name, (setup, profiles, n) in BENCHMARKS.items():
+        if quick:
+            n = max(n // 10, 1)
+        for profile in profiles:
+            key = f"{name}[{profile}]"
+            if selected and not any(s in key for s in selected):
+                continue
+            results[key] = measure(setup, n, profile, repeat)
+            r = results[key]
+            print(f"{key:32s} {r['ops_per_sec']:>14,.0f} {r['unit']}/s  "
+                  f"{r['bytes_per_op']:>10,.1f} B/{r['unit'][:-1]} kept  peak {r['peak_bytes'] / 1024:,.0f} KiB")
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> bool:
+    """Print changes against a baseline; True when nothing regressed beyond threshold"""
+    ok = True
+    print(f"\n{'='*50}")
+    print(f"Comparison against baseline from {baseline.get('meta', {}).get('date', '?')}")
+    for key, r in results.items():
+        base = baseline.get("results", {}).get(key)
+        if base is None:
+            print(f"{key:32s} (new)")
+            continue
+        speed = r["ops_per_sec"] / base["ops_per_sec"] - 1
+        memory = r["bytes_per_op"] - base["bytes_per_op"]
+        # Memory may jitter by a few bytes per op; flag growth beyond 16 bytes and threshold
+        regressed = speed < -threshold or (memory > 16 and memory > abs(base["bytes_per_op"]) * threshold)
+        ok &= not regressed
+        print(f"{key:32s} speed {speed * 100:+6.1f}%  memory {memory:+8.1f} B/op"
+              f"{'  REGRESSION' if regressed else ''}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--quick", action="store_true", help="a tenth of the iterations")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per benchmark (best is kept)")
+    parser.add_argument("-k", dest="selected", action="append", help="only benchmarks whose name contains this")
+    parser.add_argument("--save", metavar="PATH", help="write the results as a JSON baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare with a JSON baseline")
+    parser.add_argument("--threshold", type=float, default=0.10, help="relative change counted as a regression")
+    args = parser.parse_args()
+    
+    results = run_benchmarks(args.quick, args.repeat, args.selected)
+    
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({
+                "meta": {
+                    "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "quick": args.quick,
+                },
+                "results": results,
+            }, f, indent=2)
+        print(f"\nBaseline written to {args.save}")
+    
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if not compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""Demo script for the vectorized batch engine"""
+
+import sys
+import time
+sys.path.insert(0, 'backend')
+
+from engine import GameConfig
+from engine.batch import BatchGame
+from strategies.playing.smart import SmartStrategy
+
+
+def main():
+    config = GameConfig(
+        num_decks=6,
+        dealer_hits_soft_17=False,
+        blackjack_payout=1.5,
+        surrender_allowed=True,
+        double_after_split=True
+    )
+    
+    # Table-driven play: SmartStrategy is compiled into a decision table once
+    game = BatchGame(config, SmartStrategy({}), seed=42)
+    
+    start = time.perf_counter()
+    result = game.play(5_000_000, bet=10, keep_hands=False)
+    elapsed = time.perf_counter() - start
+    
+    result.print_summary()
+    print(f"\nSimulated {result.hands_played} hands in {elapsed:.1f}s "
+          f"({result.hands_played / elapsed:,.0f} hands/sec)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""Compare playing strategies on one shared shoe (paired, common random numbers)"""
+
+import sys
+sys.path.insert(0, 'backend')
+
+from engine import GameConfig
+from strategies import Strategy
+from strategies.betting.flat_bet import FlatBetStrategy
+from strategies.playing.smart import SmartStrategy
+from strategies.playing.deviations import DeviationStrategy
+from simulator import ComparisonRunner
+
+
+def main():
+    config = GameConfig(
+        num_decks=6,
+        penetration=0.8,
+        dealer_hits_soft_17=False,
+        blackjack_payout=1.5,
+        surrender_allowed=True,
+        double_after_split=True,
+        count_systems=["hi-lo"]
+    )
+    
+    # Every strategy plays each round from the same cards; the first is the baseline
+    strategies = {
+        "basic": Strategy(FlatBetStrategy({"bet_amount": 10}), SmartStrategy({})),
+        "index plays": Strategy(FlatBetStrategy({"bet_amount": 10}), DeviationStrategy({})),
+        "index plays, no insurance": Strategy(FlatBetStrategy({"bet_amount": 10}),
+                                              DeviationStrategy({"insurance_index": None})),
+    }
+    
+    runner = ComparisonRunner(config)
+    comparison = runner.run(strategies, num_hands=100000, starting_bankroll=100000, progress_interval=0)
+    comparison.print_summary()
+    print("\nNote: paired intervals are much tighter than two independent runs would give")
+
+
+if __name__ == "__main__":
+    main()
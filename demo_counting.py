@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Demo script for Hi-Lo card counting with a true-count bet spread and index plays"""
+
+import sys
+sys.path.insert(0, 'backend')
+
+from engine import GameConfig
+from strategies import Strategy
+from strategies.betting.flat_bet import FlatBetStrategy
+from strategies.betting.count_bet import CountBetStrategy
+from strategies.playing.smart import SmartStrategy
+from strategies.playing.deviations import DeviationStrategy
+from simulator import SimulationRunner
+
+
+def main():
+    # Setup game: the shoe keeps a Hi-Lo count that strategies can read
+    config = GameConfig(
+        num_decks=6,
+        penetration=0.8,
+        dealer_hits_soft_17=False,
+        blackjack_payout=1.5,
+        surrender_allowed=True,
+        double_after_split=True,
+        count_systems=["hi-lo"]
+    )
+    
+    runner = SimulationRunner(config, verbose=False)
+    
+    spread = {"base_bet": 10, "max_bet": 120, "ramp": [(1, 2), (2, 4), (3, 8), (4, 12)]}
+    
+    # Flat betting vs a 1-12 spread on the true count, then the spread with
+    # Illustrious 18 / Fab 4 index plays and insurance at TC +3
+    for betting, playing in (
+        (FlatBetStrategy({"bet_amount": 10}), SmartStrategy({})),
+        (CountBetStrategy(spread), SmartStrategy({})),
+        (CountBetStrategy(spread), DeviationStrategy({})),
+    ):
+        strategy = Strategy(betting, playing)
+        result = runner.run(
+            strategy=strategy,
+            num_hands=100000,
+            starting_bankroll=100000,
+            progress_interval=0,
+            streaming=True
+        )
+        
+        print(f"\n{type(betting).__name__} + {type(playing).__name__}")
+        result.print_summary()
+
+
+if __name__ == "__main__":
+    main()
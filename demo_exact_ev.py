@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""Demo script for the exact (combinatorial) EV calculator"""
+
+import sys
+import time
+sys.path.insert(0, 'backend')
+
+from engine import GameConfig
+from strategies.playing.smart import SmartStrategy
+from analysis import EVCalculator
+
+
+def main():
+    config = GameConfig(
+        num_decks=6,
+        dealer_hits_soft_17=False,
+        blackjack_payout=1.5,
+        surrender_allowed=True,
+        double_after_split=True
+    )
+    
+    calculator = EVCalculator(config, SmartStrategy({}))
+    
+    start = time.perf_counter()
+    ev = calculator.expected_value()
+    elapsed = time.perf_counter() - start
+    
+    print(f"Exact EV for SmartStrategy: {ev * 100:+.4f}% ({elapsed:.1f}s)")
+    
+    print(f"\n{'='*50}")
+    print("Dealer final totals by upcard (full shoe, no peek information):")
+    print(f"{'Up':>3} " + " ".join(f"{t:>6}" for t in ["17", "18", "19", "20", "21", "bust"]))
+    for upcard in range(2, 12):
+        probabilities = calculator.dealer_probabilities(upcard)
+        label = "A" if upcard == 11 else str(upcard)
+        print(f"{label:>3} " + " ".join(f"{p:6.3f}" for p in probabilities.values()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""Demo script for running a simulation across all CPU cores"""
+
+import sys
+sys.path.insert(0, 'backend')
+
+from engine import GameConfig
+from strategies import Strategy
+from strategies.betting.flat_bet import FlatBetStrategy
+from strategies.betting.random_bet import RandomBetStrategy
+from strategies.playing.smart import SmartStrategy
+from simulator import ParallelSimulationRunner
+
+
+def main():
+    config = GameConfig(
+        num_decks=6,
+        dealer_hits_soft_17=False,
+        blackjack_payout=1.5,
+        surrender_allowed=True,
+        double_after_split=True
+    )
+    
+    betting = FlatBetStrategy({"bet_amount": 10})
+    playing = SmartStrategy({})
+    strategy = Strategy(betting, playing)
+    
+    # Same seed and worker count always reproduce the same result
+    runner = ParallelSimulationRunner(config, seed=2024)
+    result = runner.run(strategy, num_hands=100000, starting_bankroll=1000000)
+    
+    result.print_summary()
+    
+    # A strategy's own seeded RNG is reseeded per worker: every worker bets its own stream
+    seeded = Strategy(RandomBetStrategy({"min_bet": 5, "max_bet": 100, "seed": 1}), SmartStrategy({}))
+    runner = ParallelSimulationRunner(config, workers=4, seed=2024)
+    bets = [hand["bet"] for hand in runner.run(seeded, num_hands=4000, starting_bankroll=1000000).history]
+    openings = {tuple(bets[start:start + 10]) for start in range(0, 4000, 1000)}
+    assert len(openings) == 4, "workers shared a random stream"
+    print(f"\n4 workers, {len(openings)} distinct bet sequences")
+
+
+if __name__ == "__main__":
+    main()
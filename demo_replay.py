@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Record a seeded session's cards, then replay the same deals with another strategy"""
+
+import os
+import sys
+import tempfile
+import time
+sys.path.insert(0, 'backend')
+
+from engine import GameConfig, ShoeRecording
+from strategies import Strategy
+from strategies.betting.flat_bet import FlatBetStrategy
+from strategies.playing.smart import SmartStrategy
+from strategies.playing.deviations import DeviationStrategy
+from simulator import SimulationRunner
+
+
+def main():
+    # A seeded PCG64 stream makes the recorded session itself reproducible
+    config = GameConfig(
+        num_decks=6,
+        penetration=0.75,
+        count_systems=["hi-lo"],
+        rng="pcg64",
+        seed=2024
+    )
+    runner = SimulationRunner(config)
+    
+    recording = ShoeRecording(config.num_decks)
+    basic = Strategy(FlatBetStrategy({"bet_amount": 10}), SmartStrategy({}))
+    original = runner.run(basic, num_hands=100000, starting_bankroll=100000, progress_interval=0,
+                          streaming=True, shoe=recording.recorder(config))
+    
+    path = os.path.join(tempfile.gettempdir(), "blackjack_recording.bjr")
+    recording.save(path)
+    print(f"Recorded {recording.num_rounds} rounds from {recording.num_shoes} shoes "
+          f"({os.path.getsize(path) / 1024:.0f} KiB)")
+    
+    # Every replayed round starts from the recorded cards, whatever the strategy draws
+    start = time.perf_counter()
+    deviations = Strategy(FlatBetStrategy({"bet_amount": 10}), DeviationStrategy({}))
+    replayed = runner.run(deviations, num_hands=100000, starting_bankroll=100000, progress_interval=0,
+                          streaming=True, shoe=ShoeRecording.load(path).replayer(config))
+    print(f"Replayed in {time.perf_counter() - start:.1f}s")
+    
+    print(f"\nBasic strategy:  EV {original.ev_percent:+.3f}%")
+    print(f"Index plays:     EV {replayed.ev_percent:+.3f}% (same deals)")
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
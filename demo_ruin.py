@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Demo script for risk of ruin across betting strategies"""
+
+import sys
+sys.path.insert(0, 'backend')
+
+from engine import GameConfig
+from strategies import Strategy
+from strategies.betting.flat_bet import FlatBetStrategy
+from strategies.betting.martingale import MartingaleStrategy
+from strategies.betting.random_bet import RandomBetStrategy
+from strategies.playing.smart import SmartStrategy
+from simulator import RuinSimulator
+from simulator.outcomes import OutcomeDistribution, FastSessionSimulator
+
+
+def main():
+    config = GameConfig(
+        num_decks=6,
+        dealer_hits_soft_17=False,
+        blackjack_payout=1.5,
+        surrender_allowed=True,
+        double_after_split=True
+    )
+    
+    # 2,000 sessions of up to 300 hands with a $500 bankroll, stopping at $1000
+    simulator = RuinSimulator(config, seed=2024)
+    for betting in (
+        FlatBetStrategy({"bet_amount": 10}),
+        MartingaleStrategy({"base_bet": 10, "max_bet": 500}),
+        RandomBetStrategy({"min_bet": 5, "max_bet": 100}),
+    ):
+        strategy = Strategy(betting, SmartStrategy({}))
+        result = simulator.run(strategy, num_sessions=2000, session_hands=300,
+                               starting_bankroll=500, target=1000)
+        print(f"\n{type(betting).__name__}")
+        result.print_summary()
+    
+    # Fast path: sample hand outcomes from a cached distribution instead of dealing
+    # cards, 100x the sessions in a fraction of the time
+    distribution = OutcomeDistribution.build(config, SmartStrategy({}))
+    distribution.print_summary()
+    fast = FastSessionSimulator(distribution, min_bet=config.min_bet, seed=2024)
+    for betting in (
+        FlatBetStrategy({"bet_amount": 10}),
+        MartingaleStrategy({"base_bet": 10, "max_bet": 500}),
+        RandomBetStrategy({"min_bet": 5, "max_bet": 100}),
+    ):
+        result = fast.run(betting, num_sessions=200000, session_hands=300,
+                          starting_bankroll=500, target=1000)
+        print(f"\n{type(betting).__name__} (sampled outcomes)")
+        result.print_summary()
+
+
+if __name__ == "__main__":
+    main()
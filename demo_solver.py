@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""Solve basic strategy for a rule set and play the solved table"""
+
+import sys
+import time
+sys.path.insert(0, 'backend')
+
+from engine import GameConfig
+from engine.tables import FLAG_DOUBLE, FLAG_SPLIT
+from strategies import Strategy
+from strategies.betting.flat_bet import FlatBetStrategy
+from strategies.playing.smart import SmartStrategy
+from strategies.playing.table import TableStrategy
+from analysis import BasicStrategySolver, EVCalculator, solve_table
+from simulator import SimulationRunner
+
+
+def main():
+    # Rules SmartStrategy's chart was not written for
+    config = GameConfig(
+        num_decks=2,
+        dealer_hits_soft_17=True,
+        blackjack_payout=1.5,
+        surrender_allowed=False,
+        double_after_split=False
+    )
+    
+    solver = BasicStrategySolver(config)
+    start = time.perf_counter()
+    solver.solve()
+    print(f"Solved in {time.perf_counter() - start:.1f}s\n")
+    solver.print_chart(flags=FLAG_DOUBLE | FLAG_SPLIT)  # no surrender at this table
+    
+    print(f"\nExact EV, solved table: {solver.expected_value() * 100:+.4f}%")
+    print(f"Exact EV, SmartStrategy: {EVCalculator(config, SmartStrategy({})).expected_value() * 100:+.4f}%")
+    
+    # solve_table caches per rule set; the table loads straight into TableStrategy
+    strategy = Strategy(FlatBetStrategy({"bet_amount": 10}), TableStrategy({"table": solve_table(config)}))
+    result = SimulationRunner(config).run(strategy, num_hands=200000, starting_bankroll=100000,
+                                          progress_interval=0, streaming=True)
+    result.print_summary()
+
+
+if __name__ == "__main__":
+    main()
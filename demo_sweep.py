@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""Demo script for sweeping a grid of table rules (results are cached per cell)"""
+
+import sys
+sys.path.insert(0, 'backend')
+
+from strategies import Strategy
+from strategies.betting.flat_bet import FlatBetStrategy
+from strategies.playing.smart import SmartStrategy
+from simulator import SweepRunner
+
+
+def main():
+    betting = FlatBetStrategy({"bet_amount": 10})
+    playing = SmartStrategy({})
+    strategy = Strategy(betting, playing)
+    
+    grid = {
+        "num_decks": [1, 2, 6, 8],
+        "dealer_hits_soft_17": [False, True],
+        "blackjack_payout": [1.5, 1.2],
+    }
+    
+    base_config = {"surrender_allowed": True, "double_after_split": True}
+    runner = SweepRunner(seed=2024)
+    result = runner.run(strategy, grid, num_hands=20000, starting_bankroll=1000000, base_config=base_config)
+    result.print_summary()
+    
+    # Run it again: every cell is now served from the cache
+    again = runner.run(strategy, grid, num_hands=20000, starting_bankroll=1000000, base_config=base_config)
+    print(f"\nSecond sweep: {len(again.cells) - again.computed} of {len(again.cells)} cells from the cache")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""Seven players at one table sharing a shoe, against the same player alone"""
+
+import sys
+sys.path.insert(0, 'backend')
+
+from engine import GameConfig
+from strategies import Strategy
+from strategies.betting.flat_bet import FlatBetStrategy
+from strategies.betting.count_bet import CountBetStrategy
+from strategies.playing.smart import SmartStrategy
+from strategies.playing.deviations import DeviationStrategy
+from simulator import TableRunner
+
+
+def main():
+    config = GameConfig(
+        num_decks=6,
+        penetration=0.75,
+        dealer_hits_soft_17=False,
+        blackjack_payout=1.5,
+        surrender_allowed=True,
+        double_after_split=True,
+        count_systems=["hi-lo"]
+    )
+    
+    def basic():
+        return Strategy(FlatBetStrategy({"bet_amount": 10}), SmartStrategy({}))
+    
+    def counter():
+        return Strategy(CountBetStrategy({"base_bet": 10, "max_bet": 120}), DeviationStrategy({}))
+    
+    runner = TableRunner(config)
+    
+    # Heads up: one seat gets many more rounds out of each shoe
+    alone = runner.run({"counter": counter()}, num_rounds=50000, starting_bankroll=100000, progress_interval=0)
+    alone.print_summary()
+    
+    # Full table: the counter sits at third base (last to act) behind six basic players
+    seats = {f"basic {i}": basic() for i in range(1, 7)}
+    seats["counter"] = counter()
+    full = runner.run(seats, num_rounds=50000, starting_bankroll=100000, progress_interval=0)
+    full.print_summary()
+
+
+if __name__ == "__main__":
+    main()